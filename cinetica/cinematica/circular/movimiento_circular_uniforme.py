@@ -1,9 +1,17 @@
-import math
+# Nombres de math enlazados al módulo: evita el LOAD_ATTR por llamada
+# sobre el módulo math en las fórmulas cinemáticas internas.
+from math import cos as _cos, inf as _inf, pi as _pi, sin as _sin
+
 from typing import Union, Optional
 import numpy as np
 from ..base_movimiento import Movimiento
 from ...units import ureg, Q_
 
+# Constante de una vuelta completa construida una sola vez: evita el
+# producto 2·π·rad (con su Quantity intermedia) en cada periodo()/
+# frecuencia().
+_DOS_PI_RAD = 2.0 * _pi * ureg.radian
+
 
 class MovimientoCircularUniforme(Movimiento):
     """
@@ -145,6 +153,39 @@ class MovimientoCircularUniforme(Movimiento):
             raise ValueError("El tiempo no puede ser negativo.")
         return self.posicion_angular_inicial + self.velocidad_angular_inicial * tiempo
 
+    def _trayectoria(self, tiempos: np.ndarray):
+        """
+        Evalúa el barrido cinemático completo sobre un array de tiempos.
+
+        Calcula θ(t) = θ₀ + ω·t para todos los tiempos con una sola
+        expresión vectorizada, en lugar de una llamada Python por instante;
+        ω y la aceleración centrípeta son constantes en MCU y se devuelven
+        como arrays del mismo largo listos para graficar.
+
+        Parameters
+        ----------
+        tiempos : numpy.ndarray or pint.Quantity
+            Tiempos de muestreo. Los arrays sin unidades se asumen en
+            segundos; las Quantities se convierten a segundos.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            ``(theta, omega, aceleracion_centripeta)`` como magnitudes en
+            radianes, rad/s y m/s² respectivamente.
+        """
+        if isinstance(tiempos, Q_):
+            tiempos = tiempos.to(ureg.second).magnitude
+        t = np.asarray(tiempos, dtype=np.float64)
+        theta0 = self.posicion_angular_inicial.to(ureg.radian).magnitude
+        omega = self.velocidad_angular_inicial.to(ureg.radian / ureg.second).magnitude
+        radio = self.radio.to(ureg.meter).magnitude
+
+        theta = theta0 + omega * t
+        omegas = np.full_like(t, omega)
+        aceleraciones = np.full_like(t, omega * omega * radio)
+        return theta, omegas, aceleraciones
+
     def velocidad_angular(self, tiempo: Optional[Union[float, Q_]] = None) -> Q_:
         """
         Obtiene la velocidad angular del objeto en cualquier momento.
@@ -271,8 +312,8 @@ class MovimientoCircularUniforme(Movimiento):
         if tiempo.magnitude < 0:
             raise ValueError("El tiempo no puede ser negativo.")
         theta = self.posicion_angular(tiempo).to(ureg.radian).magnitude
-        x = self.radio * math.cos(theta)
-        y = self.radio * math.sin(theta)
+        x = self.radio * _cos(theta)
+        y = self.radio * _sin(theta)
         return Q_(np.array([x.magnitude, y.magnitude]), ureg.meter)
 
     def velocidad(self, tiempo: Union[float, Q_]) -> np.ndarray:
@@ -310,8 +351,8 @@ class MovimientoCircularUniforme(Movimiento):
             raise ValueError("El tiempo no puede ser negativo.")
         omega = self.velocidad_angular_inicial.to(ureg.radian / ureg.second).magnitude
         theta = self.posicion_angular(tiempo).to(ureg.radian).magnitude
-        vx = -omega * self.radio.to(ureg.meter).magnitude * math.sin(theta)
-        vy = omega * self.radio.to(ureg.meter).magnitude * math.cos(theta)
+        vx = -omega * self.radio.to(ureg.meter).magnitude * _sin(theta)
+        vy = omega * self.radio.to(ureg.meter).magnitude * _cos(theta)
         return np.array([vx, vy])
 
     def posicion_vector(self, tiempo: Union[float, Q_]) -> np.ndarray:
@@ -351,8 +392,8 @@ class MovimientoCircularUniforme(Movimiento):
         if tiempo.magnitude < 0:
             raise ValueError("El tiempo no puede ser negativo.")
         theta = self.posicion_angular(tiempo).to(ureg.radian).magnitude
-        x = self.radio * math.cos(theta)
-        y = self.radio * math.sin(theta)
+        x = self.radio * _cos(theta)
+        y = self.radio * _sin(theta)
         return np.array([x.magnitude, y.magnitude])
 
     def aceleracion(self, tiempo: Optional[Union[float, Q_]] = None) -> Q_:
@@ -435,9 +476,9 @@ class MovimientoCircularUniforme(Movimiento):
         """
         if self.velocidad_angular_inicial.magnitude == 0:
             return (
-                math.inf * ureg.second
+                _inf * ureg.second
             )  # Período infinito si la velocidad angular es cero
-        return (2 * math.pi * ureg.radian) / self.velocidad_angular_inicial
+        return _DOS_PI_RAD / self.velocidad_angular_inicial
 
     def frecuencia(self) -> Q_:
         """
@@ -472,4 +513,4 @@ class MovimientoCircularUniforme(Movimiento):
         """
         if self.velocidad_angular_inicial.magnitude == 0:
             return 0.0 * ureg.hertz  # Frecuencia cero si la velocidad angular es cero
-        return self.velocidad_angular_inicial / (2 * math.pi * ureg.radian)
+        return self.velocidad_angular_inicial / _DOS_PI_RAD
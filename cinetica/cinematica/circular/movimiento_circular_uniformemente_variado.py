@@ -1,5 +1,7 @@
-import math
-from typing import Union, Optional
+# Nombres de math enlazados al módulo: evita el LOAD_ATTR por llamada
+# sobre el módulo math en las fórmulas cinemáticas internas.
+from math import copysign as _copysign, cos as _cos, sin as _sin, sqrt as _sqrt
+from typing import Tuple, Union, Optional
 import numpy as np
 from ..base_movimiento import Movimiento
 from ...units import ureg, Q_
@@ -76,6 +78,42 @@ class MovimientoCircularUniformementeVariado(Movimiento):
             + 0.5 * self.aceleracion_angular_inicial * tiempo**2
         )
 
+    def _trayectoria(self, tiempos: np.ndarray):
+        """
+        Evalúa el barrido cinemático completo sobre un array de tiempos.
+
+        Una sola pasada vectorizada produce las cinco magnitudes que
+        grafica el módulo de gráficos, con θ en forma de Horner
+        (t·(ω₀ + ½·α·t), un multiplicar-sumar por elemento) en lugar de
+        una llamada Python por instante y por magnitud.
+
+        Args:
+            tiempos (numpy.ndarray or pint.Quantity): Tiempos de muestreo.
+                Los arrays sin unidades se asumen en segundos; las
+                Quantities se convierten a segundos.
+
+        Returns:
+            tuple: ``(theta, omega, alpha, a_centripeta, a_total)`` como
+            arrays de magnitudes en unidades del SI.
+        """
+        if isinstance(tiempos, Q_):
+            tiempos = tiempos.to(ureg.second).magnitude
+        t = np.asarray(tiempos, dtype=np.float64)
+        theta0 = self.posicion_angular_inicial.to(ureg.radian).magnitude
+        omega0 = self.velocidad_angular_inicial.to(ureg.radian / ureg.second).magnitude
+        alpha = self.aceleracion_angular_inicial.to(
+            ureg.radian / ureg.second**2
+        ).magnitude
+        radio = self.radio.to(ureg.meter).magnitude
+
+        theta = theta0 + t * (omega0 + 0.5 * alpha * t)
+        omegas = omega0 + alpha * t
+        alphas = np.full_like(t, alpha)
+        a_tangencial = alpha * radio
+        a_centripeta = omegas * omegas * radio
+        a_total = np.sqrt(a_tangencial * a_tangencial + a_centripeta * a_centripeta)
+        return theta, omegas, alphas, a_centripeta, a_total
+
     def velocidad_angular(self, tiempo: Q_) -> Q_:
         """
         Calcula la velocidad angular en función del tiempo.
@@ -183,8 +221,8 @@ class MovimientoCircularUniformementeVariado(Movimiento):
         if not isinstance(tiempo, Q_):
             tiempo = Q_(tiempo, ureg.second)
         theta = self.posicion_angular(tiempo).to(ureg.radian).magnitude
-        x = self.radio * math.cos(theta)
-        y = self.radio * math.sin(theta)
+        x = self.radio * _cos(theta)
+        y = self.radio * _sin(theta)
         return np.array([x.magnitude, y.magnitude]) * ureg.meter
 
     def velocidad(self, tiempo: Q_) -> np.ndarray:
@@ -201,8 +239,8 @@ class MovimientoCircularUniformementeVariado(Movimiento):
             tiempo = Q_(tiempo, ureg.second)
         theta = self.posicion_angular(tiempo).to(ureg.radian).magnitude
         v = self.velocidad_tangencial(tiempo).to(ureg.meter / ureg.second).magnitude
-        vx = -v * math.sin(theta)
-        vy = v * math.cos(theta)
+        vx = -v * _sin(theta)
+        vy = v * _cos(theta)
         return np.array([vx, vy]) * ureg.meter / ureg.second
 
     def aceleracion(self, tiempo: Q_) -> np.ndarray:
@@ -226,17 +264,77 @@ class MovimientoCircularUniformementeVariado(Movimiento):
         radio_magnitude = self.radio.to(ureg.meter).magnitude
 
         # Aceleración tangencial
-        at_x = -alpha * radio_magnitude * math.sin(theta)
-        at_y = alpha * radio_magnitude * math.cos(theta)
+        at_x = -alpha * radio_magnitude * _sin(theta)
+        at_y = alpha * radio_magnitude * _cos(theta)
 
         # Aceleración centrípeta
-        ac_x = -(omega**2) * radio_magnitude * math.cos(theta)
-        ac_y = -(omega**2) * radio_magnitude * math.sin(theta)
+        ac_x = -(omega**2) * radio_magnitude * _cos(theta)
+        ac_y = -(omega**2) * radio_magnitude * _sin(theta)
 
         ax = at_x + ac_x
         ay = at_y + ac_y
         return np.array([ax, ay]) * ureg.meter / ureg.second**2
 
+    def tiempo_por_posicion_angular(
+        self, posicion_angular: Union[float, Q_]
+    ) -> Tuple[Q_, Q_]:
+        """
+        Calcula los tiempos en los que se alcanza una posición angular.
+
+        Resuelve ½·α·t² + ω₀·t - (θ - θ₀) = 0 con la forma numéricamente
+        estable q = -½·(b + copysign(√disc, b)); t₁ = q/a, t₂ = c/q. La
+        fórmula clásica (-b ± √disc)/(2a) sufre cancelación catastrófica
+        cuando b y √disc tienen magnitudes parecidas; esta variante evita
+        la resta entre cantidades próximas sin costo adicional.
+
+        Args:
+            posicion_angular (Q_): Posición angular objetivo (rad).
+
+        Returns:
+            tuple: Par de tiempos (s) ordenados de menor a mayor. En el
+            caso lineal (α = 0) ambos elementos coinciden.
+
+        Raises:
+            ValueError: Si la posición angular nunca se alcanza
+                (discriminante negativo) o si ω₀ y α son ambos cero.
+        """
+        if not isinstance(posicion_angular, Q_):
+            posicion_angular = Q_(posicion_angular, ureg.radian)
+
+        theta0 = self.posicion_angular_inicial.to(ureg.radian).magnitude
+        omega0 = self.velocidad_angular_inicial.to(ureg.radian / ureg.second).magnitude
+        alpha = self.aceleracion_angular_inicial.to(
+            ureg.radian / ureg.second**2
+        ).magnitude
+        delta = posicion_angular.to(ureg.radian).magnitude - theta0
+
+        a = 0.5 * alpha
+        b = omega0
+        c = -delta
+
+        if a == 0.0:
+            if b == 0.0:
+                raise ValueError(
+                    "El movimiento es degenerado: la velocidad y la "
+                    "aceleración angular son cero."
+                )
+            t = delta / b
+            return (Q_(t, ureg.second), Q_(t, ureg.second))
+
+        discriminante = b * b - 4.0 * a * c
+        if discriminante < 0.0:
+            raise ValueError("La posición angular indicada nunca se alcanza.")
+
+        if b == 0.0:
+            raiz = _sqrt(discriminante) / (2.0 * a)
+            t1, t2 = -raiz, raiz
+        else:
+            q = -0.5 * (b + _copysign(_sqrt(discriminante), b))
+            t1, t2 = q / a, c / q
+        if t1 > t2:
+            t1, t2 = t2, t1
+        return (Q_(t1, ureg.second), Q_(t2, ureg.second))
+
     def aceleracion_angular_constante(self) -> Q_:
         """
         Retorna la aceleración angular constante en MCUV.
@@ -1,3 +1,4 @@
 from .movimiento_espacial import MovimientoEspacial
+from .movimiento_espacial_batch import MovimientoEspacialBatch
 
-__all__ = ["MovimientoEspacial"]
+__all__ = ["MovimientoEspacial", "MovimientoEspacialBatch"]
@@ -274,6 +274,95 @@ class MovimientoEspacial(Movimiento):
             raise ValueError("El tiempo no puede ser negativo.")
         return self.velocidad_inicial + self.aceleracion_constante * tiempo
 
+    def posicion_batch(self, tiempos: Union[np.ndarray, Q_]) -> Q_:
+        """
+        Calcula los vectores de posición para un lote de tiempos.
+
+        Evalúa r⃗(t) = r⃗₀ + v⃗₀·t + ½·a⃗·t² para todos los tiempos en una
+        sola expresión con broadcasting: un barrido de N instantes produce
+        una matriz (N, 3) contigua en lugar de N llamadas escalares que
+        despachan por pint y asignan un vector de salida cada una.
+
+        Parameters
+        ----------
+        tiempos : numpy.ndarray or pint.Quantity
+            Tiempos transcurridos desde el inicio del movimiento, en segundos.
+            Si se proporciona un array, se asume que está en segundos.
+            Todos los valores deben ser no negativos.
+
+        Returns
+        -------
+        pint.Quantity
+            Matriz (N, 3) con el vector de posición [x, y, z] por fila,
+            con unidades de longitud.
+
+        Raises
+        ------
+        ValueError
+            Si algún tiempo proporcionado es negativo.
+
+        Examples
+        --------
+        >>> mov = MovimientoEspacial(
+        ...     velocidad_inicial=[10, 5, 0],
+        ...     aceleracion_constante=[0, 0, -9.81]
+        ... )
+        >>> posiciones = mov.posicion_batch([0.0, 0.5, 1.0])
+        """
+        if isinstance(tiempos, Q_):
+            tiempos = tiempos.to(ureg.second).magnitude
+        t = np.asarray(tiempos, dtype=np.float64)
+        if np.any(t < 0):
+            raise ValueError("El tiempo no puede ser negativo.")
+        T = t[..., None]
+        r0 = self.posicion_inicial.to(ureg.meter).magnitude
+        v0 = self.velocidad_inicial.to(ureg.meter / ureg.second).magnitude
+        a = self.aceleracion_constante.to(ureg.meter / ureg.second**2).magnitude
+        return Q_(r0 + v0 * T + 0.5 * a * T**2, ureg.meter)
+
+    def velocidad_batch(self, tiempos: Union[np.ndarray, Q_]) -> Q_:
+        """
+        Calcula los vectores de velocidad para un lote de tiempos.
+
+        Evalúa v⃗(t) = v⃗₀ + a⃗·t con broadcasting sobre todos los tiempos,
+        devolviendo una matriz (N, 3) en una sola operación vectorizada.
+
+        Parameters
+        ----------
+        tiempos : numpy.ndarray or pint.Quantity
+            Tiempos transcurridos desde el inicio del movimiento, en segundos.
+            Si se proporciona un array, se asume que está en segundos.
+            Todos los valores deben ser no negativos.
+
+        Returns
+        -------
+        pint.Quantity
+            Matriz (N, 3) con el vector de velocidad [vₓ, vᵧ, vᶻ] por fila,
+            con unidades de velocidad.
+
+        Raises
+        ------
+        ValueError
+            Si algún tiempo proporcionado es negativo.
+
+        Examples
+        --------
+        >>> mov = MovimientoEspacial(
+        ...     velocidad_inicial=[10, 5, 0],
+        ...     aceleracion_constante=[0, 0, -9.81]
+        ... )
+        >>> velocidades = mov.velocidad_batch([0.0, 0.5, 1.0])
+        """
+        if isinstance(tiempos, Q_):
+            tiempos = tiempos.to(ureg.second).magnitude
+        t = np.asarray(tiempos, dtype=np.float64)
+        if np.any(t < 0):
+            raise ValueError("El tiempo no puede ser negativo.")
+        T = t[..., None]
+        v0 = self.velocidad_inicial.to(ureg.meter / ureg.second).magnitude
+        a = self.aceleracion_constante.to(ureg.meter / ureg.second**2).magnitude
+        return Q_(v0 + a * T, ureg.meter / ureg.second)
+
     def aceleracion(self, tiempo: Optional[Union[float, Q_]] = None) -> Q_:
         """
         Obtiene el vector de aceleración del objeto.
@@ -0,0 +1,176 @@
+from typing import Union
+import numpy as np
+from ...units import ureg, Q_
+
+
+class MovimientoEspacialBatch:
+    """
+    Clase para simular N partículas en movimiento espacial 3D de una vez.
+
+    Mantiene el estado de todas las partículas como matrices (N, 3) —
+    estructura de arrays en lugar de N instancias de ``MovimientoEspacial``
+    — de modo que cada evaluación cinemática es un único broadcast de NumPy
+    sobre buffers contiguos en vez de N llamadas Python por instante.
+
+    Parameters
+    ----------
+    posiciones_iniciales : numpy.ndarray
+        Matriz (N, 3) con la posición inicial [x, y, z] de cada partícula,
+        en metros.
+    velocidades_iniciales : numpy.ndarray
+        Matriz (N, 3) con la velocidad inicial de cada partícula, en m/s.
+    aceleraciones_constantes : numpy.ndarray
+        Matriz (N, 3) con la aceleración constante de cada partícula, en
+        m/s². También se acepta un único vector (3,) compartido por todas
+        las partículas (por ejemplo, la gravedad).
+
+    Examples
+    --------
+    >>> lote = MovimientoEspacialBatch(
+    ...     posiciones_iniciales=[[0, 0, 10], [0, 0, 20]],
+    ...     velocidades_iniciales=[[5, 0, 0], [0, 5, 0]],
+    ...     aceleraciones_constantes=[0, 0, -9.81],
+    ... )
+    >>> posiciones = lote.posicion(tiempo=1.0)  # matriz (2, 3)
+
+    Notes
+    -----
+    Para una sola partícula con la API de unidades completa, use
+    ``MovimientoEspacial``; esta clase trabaja con magnitudes en unidades
+    del SI y envuelve el resultado en una única Quantity por llamada.
+    """
+
+    def __init__(
+        self,
+        posiciones_iniciales: np.ndarray,
+        velocidades_iniciales: np.ndarray,
+        aceleraciones_constantes: np.ndarray,
+    ) -> None:
+        """
+        Inicializa el lote de partículas.
+
+        Parameters
+        ----------
+        posiciones_iniciales : numpy.ndarray
+            Matriz (N, 3) de posiciones iniciales, en metros.
+        velocidades_iniciales : numpy.ndarray
+            Matriz (N, 3) de velocidades iniciales, en m/s.
+        aceleraciones_constantes : numpy.ndarray
+            Matriz (N, 3) o vector (3,) de aceleraciones constantes, en m/s².
+
+        Raises
+        ------
+        ValueError
+            Si las matrices no tienen 3 columnas o sus formas no son
+            compatibles por broadcasting.
+        """
+        p0 = np.ascontiguousarray(posiciones_iniciales, dtype=np.float64)
+        v0 = np.ascontiguousarray(velocidades_iniciales, dtype=np.float64)
+        a = np.ascontiguousarray(aceleraciones_constantes, dtype=np.float64)
+
+        if p0.ndim != 2 or p0.shape[1] != 3:
+            raise ValueError("Las posiciones iniciales deben formar una matriz (N, 3).")
+        try:
+            forma = np.broadcast_shapes(p0.shape, v0.shape, a.shape)
+        except ValueError:
+            raise ValueError(
+                "Las formas de posiciones, velocidades y aceleraciones deben "
+                "ser compatibles por broadcasting."
+            )
+        if forma != p0.shape:
+            raise ValueError(
+                "Las velocidades y aceleraciones no pueden exceder la forma "
+                "(N, 3) de las posiciones."
+            )
+
+        self.posiciones_iniciales = p0
+        self.velocidades_iniciales = v0
+        self.aceleraciones_constantes = a
+
+    def __len__(self) -> int:
+        """Número de partículas del lote."""
+        return self.posiciones_iniciales.shape[0]
+
+    def posicion(self, tiempo: Union[float, Q_]) -> Q_:
+        """
+        Calcula la posición de todas las partículas en un tiempo dado.
+
+        Evalúa r⃗(t) = r⃗₀ + v⃗₀·t + ½·a⃗·t² para las N partículas con un
+        solo broadcast.
+
+        Parameters
+        ----------
+        tiempo : float or pint.Quantity
+            Tiempo transcurrido, en segundos. Debe ser no negativo.
+
+        Returns
+        -------
+        pint.Quantity
+            Matriz (N, 3) de posiciones, con unidades de longitud.
+
+        Raises
+        ------
+        ValueError
+            Si el tiempo proporcionado es negativo.
+        """
+        t = self._tiempo(tiempo)
+        return Q_(
+            self.posiciones_iniciales
+            + self.velocidades_iniciales * t
+            + (0.5 * t * t) * self.aceleraciones_constantes,
+            ureg.meter,
+        )
+
+    def velocidad(self, tiempo: Union[float, Q_]) -> Q_:
+        """
+        Calcula la velocidad de todas las partículas en un tiempo dado.
+
+        Evalúa v⃗(t) = v⃗₀ + a⃗·t para las N partículas con un solo broadcast.
+
+        Parameters
+        ----------
+        tiempo : float or pint.Quantity
+            Tiempo transcurrido, en segundos. Debe ser no negativo.
+
+        Returns
+        -------
+        pint.Quantity
+            Matriz (N, 3) de velocidades, con unidades de velocidad.
+
+        Raises
+        ------
+        ValueError
+            Si el tiempo proporcionado es negativo.
+        """
+        t = self._tiempo(tiempo)
+        return Q_(
+            self.velocidades_iniciales + self.aceleraciones_constantes * t,
+            ureg.meter / ureg.second,
+        )
+
+    def magnitud_velocidad(self, tiempo: Union[float, Q_]) -> Q_:
+        """
+        Calcula la rapidez de todas las partículas en un tiempo dado.
+
+        Parameters
+        ----------
+        tiempo : float or pint.Quantity
+            Tiempo transcurrido, en segundos. Debe ser no negativo.
+
+        Returns
+        -------
+        pint.Quantity
+            Vector (N,) de magnitudes de velocidad.
+        """
+        velocidades = self.velocidad(tiempo).magnitude
+        return Q_(np.linalg.norm(velocidades, axis=1), ureg.meter / ureg.second)
+
+    @staticmethod
+    def _tiempo(tiempo: Union[float, Q_]) -> float:
+        """Convierte el tiempo a segundos y valida que no sea negativo."""
+        if isinstance(tiempo, Q_):
+            tiempo = tiempo.to(ureg.second).magnitude
+        t = float(tiempo)
+        if t < 0:
+            raise ValueError("El tiempo no puede ser negativo.")
+        return t
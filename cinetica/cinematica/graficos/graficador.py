@@ -307,9 +307,13 @@ def plot_mcu(mcu_obj, t_max: float, num_points: int = 100):
         raise ValueError("El tiempo máximo debe ser positivo para generar el gráfico.")
 
     tiempo = np.linspace(0, t_max, num_points)
-    posiciones_angulares = [mcu_obj.posicion_angular(t) for t in tiempo]
-    velocidades_angulares = [mcu_obj.velocidad_angular() for _ in tiempo]
-    aceleraciones_centripetas = [mcu_obj.aceleracion_centripeta() for _ in tiempo]
+    # Barrido vectorizado: una evaluación por magnitud sobre el array
+    # completo en vez de num_points llamadas escalares por curva.
+    (
+        posiciones_angulares,
+        velocidades_angulares,
+        aceleraciones_centripetas,
+    ) = mcu_obj._trayectoria(tiempo)
 
     fig, axs = plt.subplots(3, 1, figsize=(10, 12))
     fig.suptitle(
@@ -422,11 +426,15 @@ def plot_mcuv(mcuv_obj, t_max: float, num_points: int = 100):
         raise ValueError("El tiempo máximo debe ser positivo para generar el gráfico.")
 
     tiempo = np.linspace(0, t_max, num_points)
-    posiciones_angulares = [mcuv_obj.posicion_angular(t) for t in tiempo]
-    velocidades_angulares = [mcuv_obj.velocidad_angular(t) for t in tiempo]
-    aceleraciones_angulares = [mcuv_obj.aceleracion_angular() for _ in tiempo]
-    aceleraciones_centripetas = [mcuv_obj.aceleracion_centripeta(t) for t in tiempo]
-    aceleraciones_totales = [mcuv_obj.aceleracion_total(t) for t in tiempo]
+    # Barrido vectorizado: una evaluación por magnitud sobre el array
+    # completo en vez de num_points llamadas escalares por curva.
+    (
+        posiciones_angulares,
+        velocidades_angulares,
+        aceleraciones_angulares,
+        aceleraciones_centripetas,
+        aceleraciones_totales,
+    ) = mcuv_obj._trayectoria(tiempo)
 
     fig, axs = plt.subplots(5, 1, figsize=(10, 20))
     fig.suptitle(
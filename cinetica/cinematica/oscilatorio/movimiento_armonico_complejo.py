@@ -132,6 +132,39 @@ class MovimientoArmonicoComplejo(Movimiento):
 
         self.mas_components = processed_components
 
+        # Disposición SoA: los componentes se aplanan una sola vez en arrays
+        # contiguos para evaluar la superposición con una pasada vectorizada
+        # en lugar de iterar diccionarios y Quantities por componente.
+        n = len(processed_components)
+        self._amplitudes = np.fromiter(
+            (c["amplitud"].to(ureg.meter).magnitude for c in processed_components),
+            dtype=np.float64,
+            count=n,
+        )
+        self._omegas = np.fromiter(
+            (
+                c["frecuencia_angular"].to(ureg.radian / ureg.second).magnitude
+                for c in processed_components
+            ),
+            dtype=np.float64,
+            count=n,
+        )
+        self._fases = np.fromiter(
+            (c["fase_inicial"].to(ureg.radian).magnitude for c in processed_components),
+            dtype=np.float64,
+            count=n,
+        )
+        # Derivadas precalculadas: ω·A y -ω²·A no dependen del tiempo.
+        self._va = self._omegas * self._amplitudes
+        self._aa = -self._omegas**2 * self._amplitudes
+
+    def _fases_en(self, tiempo: Union[float, Q_]):
+        """Matriz de fases ω·t + φ en radianes; acepta floats, arrays o Quantities."""
+        if isinstance(tiempo, Q_):
+            tiempo = tiempo.to(ureg.second).magnitude
+        t = np.asarray(tiempo, dtype=np.float64)
+        return t[..., None] * self._omegas + self._fases
+
     def posicion(self, tiempo: Union[float, Q_]) -> Q_:
         """
         Calcula la posición resultante del objeto en un tiempo dado.
@@ -166,18 +199,7 @@ class MovimientoArmonicoComplejo(Movimiento):
         La posición resultante puede ser compleja y no necesariamente periódica
         si las frecuencias de los componentes no son conmensurables.
         """
-        if not isinstance(tiempo, Q_):
-            tiempo = Q_(tiempo, ureg.second)
-
-        posicion_total = 0.0 * ureg.meter
-        for comp in self.mas_components:
-            A = comp["amplitud"]
-            omega = comp["frecuencia_angular"]
-            phi = comp["fase_inicial"]
-            posicion_total += A * np.cos(
-                (omega * tiempo + phi).to(ureg.radian).magnitude
-            )
-        return posicion_total
+        return Q_(np.cos(self._fases_en(tiempo)) @ self._amplitudes, ureg.meter)
 
     def velocidad(self, tiempo: Union[float, Q_]) -> Q_:
         """
@@ -212,18 +234,7 @@ class MovimientoArmonicoComplejo(Movimiento):
         -----
         La velocidad se obtiene derivando la posición respecto al tiempo.
         """
-        if not isinstance(tiempo, Q_):
-            tiempo = Q_(tiempo, ureg.second)
-
-        velocidad_total = 0.0 * ureg.meter / ureg.second
-        for comp in self.mas_components:
-            A = comp["amplitud"]
-            omega = comp["frecuencia_angular"]
-            phi = comp["fase_inicial"]
-            velocidad_total += (
-                -A * omega * np.sin((omega * tiempo + phi).to(ureg.radian).magnitude)
-            )
-        return velocidad_total
+        return Q_(-(np.sin(self._fases_en(tiempo)) @ self._va), ureg.meter / ureg.second)
 
     def aceleracion(self, tiempo: Union[float, Q_]) -> Q_:
         """
@@ -258,20 +269,25 @@ class MovimientoArmonicoComplejo(Movimiento):
         -----
         La aceleración se obtiene derivando la velocidad respecto al tiempo.
         """
-        if not isinstance(tiempo, Q_):
-            tiempo = Q_(tiempo, ureg.second)
+        return Q_(np.cos(self._fases_en(tiempo)) @ self._aa, ureg.meter / ureg.second**2)
 
-        aceleracion_total = 0.0 * ureg.meter / ureg.second**2
-        for comp in self.mas_components:
-            A = comp["amplitud"]
-            omega = comp["frecuencia_angular"]
-            phi = comp["fase_inicial"]
-            aceleracion_total += (
-                -A
-                * (omega**2)
-                * np.cos((omega * tiempo + phi).to(ureg.radian).magnitude)
-            )
-        return aceleracion_total
+    def posicion_array(self, tiempos: Union[List[float], np.ndarray]) -> Q_:
+        """
+        Evalúa la posición en un lote de tiempos con una sola pasada.
+
+        Parameters
+        ----------
+        tiempos : array_like
+            Tiempos en segundos.
+
+        Returns
+        -------
+        pint.Quantity
+            Array de posiciones, con unidades de longitud. El cálculo es un
+            producto matriz-vector ``cos(t ⊗ ω + φ) @ A`` por difusión, sin
+            bucle Python sobre los tiempos.
+        """
+        return Q_(np.cos(self._fases_en(tiempos)) @ self._amplitudes, ureg.meter)
 
     def amplitud_resultante(self) -> Q_:
         """
@@ -102,6 +102,37 @@ class MovimientoArmonicoSimple(Movimiento):
         self.frecuencia_angular = frecuencia_angular
         self.fase_inicial = fase_inicial
 
+        # Magnitudes y productos precalculados: ω, φ, A·ω y A·ω² no cambian
+        # tras la construcción, y recalcularlos por llamada domina el costo
+        # de las evaluaciones de posición/velocidad/aceleración/energía.
+        self._omega_rad = frecuencia_angular.to(ureg.radian / ureg.second).magnitude
+        self._fase_rad = fase_inicial.to(ureg.radian).magnitude
+        self._amplitud_por_omega = amplitud * frecuencia_angular
+        self._amplitud_por_omega2 = self._amplitud_por_omega * frecuencia_angular
+        self._amplitud2 = amplitud * amplitud
+        # Período y frecuencia derivados una sola vez: ω es inmutable tras
+        # la construcción, así que cada llamada se reduce a leer el atributo.
+        self._periodo = (2.0 * math.pi * ureg.radian) / frecuencia_angular
+        self._frecuencia = frecuencia_angular / (2.0 * math.pi * ureg.radian)
+        # Caché de una sola entrada para el par (sin, cos) de la fase: las
+        # llamadas encadenadas (posición, velocidad, energías) sobre el mismo
+        # tiempo comparten una única evaluación trigonométrica.
+        self._trig_cache = None
+
+    def _trig(self, tiempo: Union[float, Q_]) -> tuple:
+        """Devuelve ``(sin, cos)`` de la fase ωt + φ con caché de una entrada."""
+        if isinstance(tiempo, Q_):
+            tiempo = tiempo.to(ureg.second).magnitude
+        t = float(tiempo)
+        cache = self._trig_cache
+        if cache is not None and cache[0] == t:
+            return cache[1], cache[2]
+        fase = self._omega_rad * t + self._fase_rad
+        seno = math.sin(fase)
+        coseno = math.cos(fase)
+        self._trig_cache = (t, seno, coseno)
+        return seno, coseno
+
     def posicion(self, tiempo: Union[float, Q_]) -> Q_:
         """
         Calcula la posición del objeto en un tiempo dado.
@@ -133,13 +164,8 @@ class MovimientoArmonicoSimple(Movimiento):
         -----
         La posición varía sinusoidalmente entre -A y +A.
         """
-        if not isinstance(tiempo, Q_):
-            tiempo = Q_(tiempo, ureg.second)
-        return self.amplitud * math.cos(
-            (self.frecuencia_angular * tiempo + self.fase_inicial)
-            .to(ureg.radian)
-            .magnitude
-        )
+        _, coseno = self._trig(tiempo)
+        return self.amplitud * coseno
 
     def velocidad(self, tiempo: Union[float, Q_]) -> Q_:
         """
@@ -173,17 +199,8 @@ class MovimientoArmonicoSimple(Movimiento):
         La velocidad es máxima cuando el objeto pasa por la posición de equilibrio
         y es cero en los puntos de máximo desplazamiento.
         """
-        if not isinstance(tiempo, Q_):
-            tiempo = Q_(tiempo, ureg.second)
-        return (
-            -self.amplitud
-            * self.frecuencia_angular
-            * math.sin(
-                (self.frecuencia_angular * tiempo + self.fase_inicial)
-                .to(ureg.radian)
-                .magnitude
-            )
-        )
+        seno, _ = self._trig(tiempo)
+        return -self._amplitud_por_omega * seno
 
     def aceleracion(self, tiempo: Union[float, Q_]) -> Q_:
         """
@@ -217,17 +234,8 @@ class MovimientoArmonicoSimple(Movimiento):
         La aceleración es proporcional al desplazamiento pero en dirección opuesta,
         lo que constituye la fuerza restauradora característica del M.A.S.
         """
-        if not isinstance(tiempo, Q_):
-            tiempo = Q_(tiempo, ureg.second)
-        return (
-            -self.amplitud
-            * (self.frecuencia_angular**2)
-            * math.cos(
-                (self.frecuencia_angular * tiempo + self.fase_inicial)
-                .to(ureg.radian)
-                .magnitude
-            )
-        )
+        _, coseno = self._trig(tiempo)
+        return -self._amplitud_por_omega2 * coseno
 
     def periodo(self) -> Q_:
         """
@@ -254,7 +262,7 @@ class MovimientoArmonicoSimple(Movimiento):
         -----
         El período es independiente de la amplitud en el M.A.S. ideal.
         """
-        return (2 * math.pi * ureg.radian) / self.frecuencia_angular
+        return self._periodo
 
     def frecuencia(self) -> Q_:
         """
@@ -281,7 +289,7 @@ class MovimientoArmonicoSimple(Movimiento):
         -----
         La frecuencia es el inverso del período: f = 1/T
         """
-        return self.frecuencia_angular / (2 * math.pi * ureg.radian)
+        return self._frecuencia
 
     def energia_cinetica(self, tiempo: Union[float, Q_], masa: Union[float, Q_]) -> Q_:
         """
@@ -323,13 +331,13 @@ class MovimientoArmonicoSimple(Movimiento):
         La energía cinética es máxima en la posición de equilibrio
         y cero en los puntos de máximo desplazamiento.
         """
-        if not isinstance(tiempo, Q_):
-            tiempo = Q_(tiempo, ureg.second)
         if not isinstance(masa, Q_):
             masa = Q_(masa, ureg.kilogram)
 
         if masa.magnitude <= 0:
             raise ValueError("La masa debe ser un valor positivo.")
+        # velocidad() comparte la evaluación trigonométrica cacheada para
+        # el mismo tiempo, por lo que no se repite el sin/cos aquí.
         return 0.5 * masa * (self.velocidad(tiempo) ** 2)
 
     def energia_potencial(
@@ -374,8 +382,6 @@ class MovimientoArmonicoSimple(Movimiento):
         La energía potencial es máxima en los puntos de máximo desplazamiento
         y cero en la posición de equilibrio.
         """
-        if not isinstance(tiempo, Q_):
-            tiempo = Q_(tiempo, ureg.second)
         if not isinstance(constante_elastica, Q_):
             constante_elastica = Q_(constante_elastica, ureg.newton / ureg.meter)
 
@@ -435,4 +441,6 @@ class MovimientoArmonicoSimple(Movimiento):
             raise ValueError(
                 "La masa y la constante elástica deben ser valores positivos."
             )
-        return 0.5 * constante_elastica * (self.amplitud**2)
+        # A² cacheado en la construcción: la energía total es constante en
+        # el tiempo por conservación, así que solo queda el producto por k.
+        return 0.5 * constante_elastica * self._amplitud2
@@ -1,8 +1,79 @@
+from math import atan2 as _atan2, hypot as _hypot
 from typing import Union, Optional
 import numpy as np
+from numba import njit
 from ...units import ureg, Q_
 
 
+# Núcleos especializados para vectores de 2 y 3 componentes: en esos tamaños
+# el despacho genérico de un ufunc de NumPy cuesta más que la propia
+# aritmética, mientras que el bucle desenrollado compilado se reduce a un
+# puñado de sumas escalares sin objetos intermedios.
+@njit(cache=True, fastmath=True)
+def _suma2(a, b):
+    out = np.empty(2)
+    out[0] = a[0] + b[0]
+    out[1] = a[1] + b[1]
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _suma3(a, b):
+    out = np.empty(3)
+    out[0] = a[0] + b[0]
+    out[1] = a[1] + b[1]
+    out[2] = a[2] + b[2]
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _resta2(a, b):
+    out = np.empty(2)
+    out[0] = a[0] - b[0]
+    out[1] = a[1] - b[1]
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _resta3(a, b):
+    out = np.empty(3)
+    out[0] = a[0] - b[0]
+    out[1] = a[1] - b[1]
+    out[2] = a[2] - b[2]
+    return out
+
+
+# Tablas de despacho precalculadas por dimensión: elegir el núcleo
+# especializado es una única búsqueda de diccionario por llamada.
+_SUMAS = {2: _suma2, 3: _suma3}
+_RESTAS = {2: _resta2, 3: _resta3}
+
+
+# Tríada fusionada para el caso 2D: suma, norma y ángulo en una sola llamada
+# compilada, con la suma mantenida en registros en lugar de releerla de
+# memoria para cada derivado.
+@njit(cache=True, fastmath=True)
+def _abs_mag_dir2(a, b):
+    sx = a[0] + b[0]
+    sy = a[1] + b[1]
+    return sx, sy, _hypot(sx, sy), _atan2(sy, sx)
+
+
+def _combinar(kernels, ufunc, a, b):
+    """Aplica la operación binaria eligiendo el núcleo por tamaño.
+
+    Vectores sueltos de 2 o 3 componentes van al núcleo desenrollado de la
+    tabla; cualquier otra forma (lotes apilados, dimensiones distintas) cae
+    en el ufunc de NumPy, que conserva las reglas de broadcasting y los
+    errores de formas incompatibles.
+    """
+    if a.shape == b.shape and a.ndim == 1:
+        kernel = kernels.get(a.shape[0])
+        if kernel is not None:
+            return kernel(a, b)
+    return ufunc(a, b)
+
+
 class MovimientoRelativo:
     """
     Clase para calcular velocidades relativas entre objetos en movimiento.
@@ -26,6 +97,12 @@ class MovimientoRelativo:
     - Navegación y sistemas de referencia móviles
     - Mecánica de fluidos (velocidad relativa de partículas)
     - Cinemática de mecanismos
+
+    Para cargas grandes (muchos agentes o marcos), la vía de escalado son
+    las variantes por lotes: los métodos aceptan arrays apilados
+    ``(N, n)`` y resuelven cada consulta con una única operación
+    vectorizada, de modo que el trabajo crece en los bucles C de NumPy y
+    no en el intérprete.
     """
 
     def __init__(self) -> None:
@@ -46,6 +123,7 @@ class MovimientoRelativo:
         self,
         velocidad_objeto_a: Union[np.ndarray, Q_],
         velocidad_objeto_b: Union[np.ndarray, Q_],
+        out: Optional[np.ndarray] = None,
     ) -> Q_:
         """
         Calcula la velocidad del objeto A con respecto al objeto B.
@@ -61,12 +139,16 @@ class MovimientoRelativo:
         velocidad_objeto_b : numpy.ndarray or pint.Quantity
             Vector de velocidad del objeto B, en m/s.
             Si se proporciona un array, se asume que está en m/s.
+        out : numpy.ndarray, optional
+            Buffer preasignado donde escribir la diferencia. Permite a los
+            bucles de simulación reciclar memoria en lugar de asignar un
+            array nuevo por consulta.
 
         Returns
         -------
         pint.Quantity
             Vector de velocidad relativa de A con respecto a B,
-            con unidades de velocidad.
+            con unidades de velocidad (envuelve ``out`` si se proporcionó).
 
         Raises
         ------
@@ -97,7 +179,13 @@ class MovimientoRelativo:
                 "Las unidades de los vectores de velocidad deben ser compatibles."
             )
 
-        return velocidad_objeto_a - velocidad_objeto_b
+        va = np.asarray(velocidad_objeto_a.magnitude, dtype=np.float64)
+        vb = np.asarray(velocidad_objeto_b.magnitude, dtype=np.float64)
+        if out is not None:
+            resultado = np.subtract(va, vb, out=out)
+        else:
+            resultado = _combinar(_RESTAS, np.subtract, va, vb)
+        return Q_(resultado, velocidad_objeto_a.units)
 
     def velocidad_absoluta_a(
         self,
@@ -155,7 +243,12 @@ class MovimientoRelativo:
                 "Las unidades de los vectores de velocidad deben ser compatibles."
             )
 
-        return velocidad_relativa_ab + velocidad_objeto_b
+        va = np.asarray(velocidad_relativa_ab.magnitude, dtype=np.float64)
+        vb = np.asarray(velocidad_objeto_b.magnitude, dtype=np.float64)
+        return Q_(
+            _combinar(_SUMAS, np.add, va, vb),
+            velocidad_relativa_ab.units,
+        )
 
     def velocidad_absoluta_b(
         self,
@@ -213,7 +306,12 @@ class MovimientoRelativo:
                 "Las unidades de los vectores de velocidad deben ser compatibles."
             )
 
-        return velocidad_objeto_a - velocidad_relativa_ab
+        va = np.asarray(velocidad_objeto_a.magnitude, dtype=np.float64)
+        vb = np.asarray(velocidad_relativa_ab.magnitude, dtype=np.float64)
+        return Q_(
+            _combinar(_RESTAS, np.subtract, va, vb),
+            velocidad_objeto_a.units,
+        )
 
     def magnitud_velocidad(self, velocidad_vector: Union[np.ndarray, Q_]) -> Q_:
         """
@@ -225,14 +323,15 @@ class MovimientoRelativo:
         Parameters
         ----------
         velocidad_vector : numpy.ndarray or pint.Quantity
-            Vector de velocidad, en m/s.
-            Si se proporciona un array, se asume que está en m/s.
+            Vector de velocidad, en m/s, o lote de vectores apilados con
+            forma ``(..., n)``. Si se proporciona un array, se asume que
+            está en m/s.
 
         Returns
         -------
         pint.Quantity
-            Magnitud escalar del vector de velocidad,
-            con unidades de velocidad.
+            Magnitud escalar del vector de velocidad (o array de
+            magnitudes para lotes), con unidades de velocidad.
 
         Examples
         --------
@@ -245,13 +344,27 @@ class MovimientoRelativo:
         Notes
         -----
         La magnitud representa la rapidez del objeto,
-        independientemente de su dirección.
+        independientemente de su dirección. Para un lote de vectores
+        apilados ``(N, n)`` la norma se reduce sobre el último eje en una
+        sola llamada vectorizada, devolviendo ``N`` magnitudes.
         """
         if not isinstance(velocidad_vector, Q_):
             velocidad_vector = Q_(velocidad_vector, ureg.meter / ureg.second)
 
-        # Assuming velocidad_vector is a Quantity whose magnitude is a numpy array or list
-        magnitude = np.linalg.norm(velocidad_vector.magnitude)
+        v = np.asarray(velocidad_vector.magnitude, dtype=float)
+        if v.shape[-1] == 2:
+            # Una sola llamada a libm, sin array intermedio v*v y robusta
+            # frente a desbordamiento en componentes grandes.
+            magnitude = np.hypot(v[..., 0], v[..., 1])
+        elif v.ndim >= 2:
+            # einsum acumula el producto escalar en un único bucle C sin
+            # materializar el cuadrado; en lotes, optimize= permite que
+            # NumPy despache la contracción por la ruta de matmul por lotes.
+            magnitude = np.sqrt(np.einsum("...i,...i->...", v, v, optimize=True))
+        else:
+            # Para un único vector el coste de planificar la contracción
+            # supera a la propia reducción: se omite optimize.
+            magnitude = np.sqrt(np.einsum("i,i->", v, v))
         return Q_(magnitude, velocidad_vector.units)
 
     def direccion_velocidad(
@@ -266,8 +379,9 @@ class MovimientoRelativo:
         Parameters
         ----------
         velocidad_vector : numpy.ndarray or pint.Quantity
-            Vector de velocidad, en m/s.
-            Si se proporciona un array, se asume que está en m/s.
+            Vector de velocidad, en m/s, o lote de vectores apilados con
+            forma ``(..., n)``. Si se proporciona un array, se asume que
+            está en m/s.
 
         Returns
         -------
@@ -275,6 +389,7 @@ class MovimientoRelativo:
             Para vectores 2D: ángulo en radianes (pint.Quantity).
             Para vectores 3D: vector unitario (numpy.ndarray).
             Para vectores nulos: 0 radianes (2D) o vector cero (3D).
+            Los lotes devuelven un array de ángulos o de vectores unitarios.
 
         Examples
         --------
@@ -293,20 +408,199 @@ class MovimientoRelativo:
         -----
         La dirección es independiente de la magnitud del vector.
         Para vectores 2D, el ángulo está en el rango [-π, π].
+        Un lote apilado ``(N, n)`` se resuelve con una sola llamada
+        vectorizada a ``arctan2`` (2D) o una normalización con broadcasting
+        (resto de dimensiones).
         """
         if not isinstance(velocidad_vector, Q_):
             velocidad_vector = Q_(velocidad_vector, ureg.meter / ureg.second)
 
-        v_magnitude = velocidad_vector.magnitude
-        norm = np.linalg.norm(v_magnitude)
+        v = np.asarray(velocidad_vector.magnitude, dtype=float)
 
-        if norm == 0:
-            if len(v_magnitude) == 2:
-                return 0.0 * ureg.radian
-            else:
-                return np.zeros_like(v_magnitude)
+        if v.shape[-1] == 2:
+            # arctan2(0, 0) = 0, por lo que el vector nulo conserva su
+            # convención de 0 radianes sin rama aparte.
+            return Q_(np.arctan2(v[..., 1], v[..., 0]), ureg.radian)
 
-        if len(v_magnitude) == 2:
-            return Q_(np.arctan2(v_magnitude[1], v_magnitude[0]), ureg.radian)
-        else:
-            return v_magnitude / norm
+        norm = np.linalg.norm(v, axis=-1, keepdims=True)
+        # where= deja en cero las filas de norma nula en lugar de dividir.
+        return np.divide(v, norm, out=np.zeros_like(v), where=norm != 0.0)
+
+    def absoluta_mag_dir(
+        self,
+        velocidad_relativa_ab: Union[np.ndarray, Q_],
+        velocidad_objeto_b: Union[np.ndarray, Q_],
+    ) -> tuple:
+        """
+        Calcula velocidad absoluta, magnitud y dirección en una pasada.
+
+        Fusiona el patrón habitual de tres llamadas (suma, norma y ángulo
+        o vector unitario) sobre el mismo resultado: la suma se calcula una
+        sola vez y la magnitud y la dirección se derivan de ella sin
+        recalcularla.
+
+        Parameters
+        ----------
+        velocidad_relativa_ab : numpy.ndarray or pint.Quantity
+            Vector de velocidad de A con respecto a B, en m/s.
+            Si se proporciona un array, se asume que está en m/s.
+        velocidad_objeto_b : numpy.ndarray or pint.Quantity
+            Vector de velocidad del objeto B, en m/s.
+            Si se proporciona un array, se asume que está en m/s.
+
+        Returns
+        -------
+        tuple
+            ``(velocidad_absoluta, magnitud, direccion)``, donde la
+            dirección sigue la convención de :meth:`direccion_velocidad`
+            (ángulo en 2D, vector unitario en el resto de dimensiones).
+
+        Examples
+        --------
+        >>> mr = MovimientoRelativo()
+        >>> v_abs, mag, ang = mr.absoluta_mag_dir([3, 0], [0, 4])
+        >>> print(f"{mag:.1f}")
+        5.0 meter / second
+        """
+        if not isinstance(velocidad_relativa_ab, Q_):
+            velocidad_relativa_ab = Q_(velocidad_relativa_ab, ureg.meter / ureg.second)
+        if not isinstance(velocidad_objeto_b, Q_):
+            velocidad_objeto_b = Q_(velocidad_objeto_b, ureg.meter / ureg.second)
+
+        if velocidad_relativa_ab.units != velocidad_objeto_b.units:
+            raise ValueError(
+                "Las unidades de los vectores de velocidad deben ser compatibles."
+            )
+
+        va = np.asarray(velocidad_relativa_ab.magnitude, dtype=np.float64)
+        vb = np.asarray(velocidad_objeto_b.magnitude, dtype=np.float64)
+        unidades = velocidad_relativa_ab.units
+
+        if va.shape == (2,) and vb.shape == (2,):
+            sx, sy, mag, ang = _abs_mag_dir2(va, vb)
+            return (
+                Q_(np.array([sx, sy]), unidades),
+                Q_(mag, unidades),
+                Q_(ang, ureg.radian),
+            )
+
+        velocidad_absoluta = Q_(_combinar(_SUMAS, np.add, va, vb), unidades)
+        return (
+            velocidad_absoluta,
+            self.magnitud_velocidad(velocidad_absoluta),
+            self.direccion_velocidad(velocidad_absoluta),
+        )
+
+    def velocidad_absoluta_encadenada(
+        self, *velocidades: Union[np.ndarray, Q_]
+    ) -> Q_:
+        """
+        Suma una cadena de velocidades entre sistemas de referencia.
+
+        Para marcos encadenados (p. ej. V_A/Tierra = V_A/Aire +
+        V_Aire/Viento + V_Viento/Tierra), apila todos los vectores y los
+        reduce con una única suma en C, en lugar de encadenar llamadas a
+        :meth:`velocidad_absoluta_a` con una Quantity intermedia por paso.
+
+        Parameters
+        ----------
+        *velocidades : numpy.ndarray or pint.Quantity
+            Dos o más vectores de velocidad de la misma dimensión, en m/s.
+            Si se proporcionan arrays, se asume que están en m/s.
+
+        Returns
+        -------
+        pint.Quantity
+            Vector de velocidad absoluta resultante de la cadena,
+            con unidades de velocidad.
+
+        Raises
+        ------
+        ValueError
+            Si se proporcionan menos de dos vectores o si los vectores
+            tienen unidades incompatibles.
+
+        Examples
+        --------
+        >>> mr = MovimientoRelativo()
+        >>> v = mr.velocidad_absoluta_encadenada([200, 50], [20, -10], [0, 5])
+        >>> print(v)
+        [220.0 45.0] meter / second
+        """
+        if len(velocidades) < 2:
+            raise ValueError(
+                "Se necesitan al menos dos vectores de velocidad para encadenar."
+            )
+
+        cuantias = [
+            v if isinstance(v, Q_) else Q_(v, ureg.meter / ureg.second)
+            for v in velocidades
+        ]
+        unidades = cuantias[0].units
+        for q in cuantias[1:]:
+            if q.units != unidades:
+                raise ValueError(
+                    "Las unidades de los vectores de velocidad deben ser compatibles."
+                )
+
+        apilado = np.array(
+            [np.asarray(q.magnitude, dtype=np.float64) for q in cuantias]
+        )
+        return Q_(np.add.reduce(apilado, axis=0), unidades)
+
+    def velocidades_relativas(
+        self,
+        velocidad_objeto: Union[np.ndarray, Q_],
+        velocidades_marcos: Union[np.ndarray, Q_],
+    ) -> Q_:
+        """
+        Calcula la velocidad de un objeto respecto a varios marcos a la vez.
+
+        Dada la velocidad absoluta del objeto y una matriz ``(K, n)`` con
+        las velocidades de ``K`` marcos de referencia, una única resta con
+        broadcasting produce las ``K`` velocidades relativas, en lugar de
+        un bucle en Python con una llamada por marco.
+
+        Parameters
+        ----------
+        velocidad_objeto : numpy.ndarray or pint.Quantity
+            Vector de velocidad absoluta del objeto, en m/s.
+            Si se proporciona un array, se asume que está en m/s.
+        velocidades_marcos : numpy.ndarray or pint.Quantity
+            Matriz ``(K, n)`` con la velocidad de cada marco de
+            referencia, en m/s.
+
+        Returns
+        -------
+        pint.Quantity
+            Matriz ``(K, n)`` con la velocidad del objeto respecto a cada
+            marco, con unidades de velocidad.
+
+        Raises
+        ------
+        ValueError
+            Si los vectores tienen unidades incompatibles.
+
+        Examples
+        --------
+        >>> mr = MovimientoRelativo()
+        >>> marcos = [[0, 0], [10, 0], [0, 5]]
+        >>> v_rel = mr.velocidades_relativas([10, 5], marcos)
+        >>> print(v_rel.magnitude)
+        [[10.  5.]
+         [ 0.  5.]
+         [10.  0.]]
+        """
+        if not isinstance(velocidad_objeto, Q_):
+            velocidad_objeto = Q_(velocidad_objeto, ureg.meter / ureg.second)
+        if not isinstance(velocidades_marcos, Q_):
+            velocidades_marcos = Q_(velocidades_marcos, ureg.meter / ureg.second)
+
+        if velocidad_objeto.units != velocidades_marcos.units:
+            raise ValueError(
+                "Las unidades de los vectores de velocidad deben ser compatibles."
+            )
+
+        v_obj = np.asarray(velocidad_objeto.magnitude, dtype=np.float64)
+        marcos = np.asarray(velocidades_marcos.magnitude, dtype=np.float64)
+        return Q_(v_obj - marcos, velocidad_objeto.units)
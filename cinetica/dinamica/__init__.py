@@ -13,11 +13,25 @@ from .choques import ChoquesColisiones
 from .sistemas_particulas import SistemasParticulas
 from . import rotacional
 
+# Instancias compartidas por defecto. Las clases no guardan estado
+# (``__slots__ = ()``), por lo que reutilizarlas evita re-instanciar en
+# bucles calientes y en los setups de tests.
+DEFAULT_NEWTON = LeyesNewton()
+DEFAULT_FUERZAS = AnalisisFuerzas()
+DEFAULT_TE = TrabajoEnergia()
+DEFAULT_CHOQUES = ChoquesColisiones()
+DEFAULT_SISTEMAS = SistemasParticulas()
+
 __all__ = [
     "LeyesNewton",
     "AnalisisFuerzas",
     "TrabajoEnergia",
     "ChoquesColisiones",
     "SistemasParticulas",
+    "DEFAULT_NEWTON",
+    "DEFAULT_FUERZAS",
+    "DEFAULT_TE",
+    "DEFAULT_CHOQUES",
+    "DEFAULT_SISTEMAS",
     "rotacional"
 ]
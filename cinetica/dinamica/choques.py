@@ -7,9 +7,75 @@ para el análisis de colisiones elásticas e inelásticas en 1D, 2D y 3D.
 
 from typing import Union, Tuple, List, Optional
 import numpy as np
+from numba import njit, guvectorize, float64
 from ..units import ureg, Q_
 
 
+# Núcleos numéricos compilados con JIT. Las envolturas de la clase extraen las
+# magnitudes, llaman al núcleo y reaplican unidades al retornar.
+@njit(cache=True)
+def _colision_1d(
+    m1: float, v1i: float, m2: float, v2i: float, e: float
+) -> Tuple[float, float]:
+    """Velocidades finales de una colisión unidimensional (núcleo JIT)."""
+    inv_masa_total = 1.0 / (m1 + m2)
+    v1f = ((m1 - m2 * e) * v1i + m2 * (1.0 + e) * v2i) * inv_masa_total
+    v2f = (m1 * (1.0 + e) * v1i + (m2 - m1 * e) * v2i) * inv_masa_total
+    return v1f, v2f
+
+
+@njit(cache=True)
+def _colision_nd(
+    m1: float,
+    v1i: np.ndarray,
+    m2: float,
+    v2i: np.ndarray,
+    normal: np.ndarray,
+    e: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Velocidades finales de una colisión 2D/3D (núcleo JIT).
+
+    ``normal`` debe ser un vector unitario en la dirección del impacto; las
+    componentes tangenciales no cambian.
+    """
+    # Producto punto explícito: np.dot dentro de numba exige BLAS de scipy.
+    v1n = 0.0
+    v2n = 0.0
+    for i in range(normal.shape[0]):
+        v1n += v1i[i] * normal[i]
+        v2n += v2i[i] * normal[i]
+    inv_masa_total = 1.0 / (m1 + m2)
+    v1fn = ((m1 - e * m2) * v1n + (1.0 + e) * m2 * v2n) * inv_masa_total
+    v2fn = ((1.0 + e) * m1 * v1n + (m2 - e * m1) * v2n) * inv_masa_total
+    v1f = v1i + (v1fn - v1n) * normal
+    v2f = v2i + (v2fn - v2n) * normal
+    return v1f, v2f
+
+
+@guvectorize(
+    [(float64, float64, float64, float64, float64, float64[:], float64[:])],
+    '(),(),(),(),()->(),()',
+    nopython=True,
+    target='parallel',
+)
+def _colision_1d_lote(m1, v1i, m2, v2i, e, v1f, v2f):
+    """Versión por lotes de ``_colision_1d`` (ufunc generalizada).
+
+    Los argumentos escalares se difunden contra los arrays, de modo que un
+    barrido de coeficientes de restitución se resuelve en un único bucle C.
+    """
+    inv_masa_total = 1.0 / (m1 + m2)
+    v1f[0] = ((m1 - m2 * e) * v1i + m2 * (1.0 + e) * v2i) * inv_masa_total
+    v2f[0] = (m1 * (1.0 + e) * v1i + (m2 - m1 * e) * v2i) * inv_masa_total
+
+
+def _magnitud(valor, unidad: Optional[str] = None):
+    """Extrae la magnitud de una cantidad, convirtiendo a ``unidad`` si aplica."""
+    if hasattr(valor, 'magnitude'):
+        return valor.to(unidad).magnitude if unidad else valor.magnitude
+    return valor
+
+
 class ChoquesColisiones:
     """
     Clase para el análisis de choques y colisiones en sistemas físicos.
@@ -27,6 +93,9 @@ class ChoquesColisiones:
     ... )
     """
     
+    # Sin estado de instancia: permite compartir una única instancia.
+    __slots__ = ()
+
     def __init__(self):
         """Inicializa la clase ChoquesColisiones."""
         pass
@@ -72,36 +141,67 @@ class ChoquesColisiones:
         """
         if not 0 <= coeficiente_restitucion <= 1:
             raise ValueError("El coeficiente de restitución debe estar entre 0 y 1.")
-            
-        # Aplicar unidades si se especifican
-        if unidades:
-            m1 = Q_(m1, unidades.get('masa', ''))
-            v1i = Q_(v1i, unidades.get('velocidad', ''))
-            m2 = Q_(m2, unidades.get('masa', ''))
-            v2i = Q_(v2i, unidades.get('velocidad', ''))
-        
-        # Conservación del momento lineal
-        # m1*v1i + m2*v2i = m1*v1f + m2*v2f
-        
-        # Coeficiente de restitución
-        # e = -(v2f - v1f)/(v2i - v1i)
-        
-        # Resolver el sistema de ecuaciones
-        v1f = (m1 - m2 * coeficiente_restitucion) * v1i + \
-              m2 * (1 + coeficiente_restitucion) * v2i
-        v1f /= (m1 + m2)
-        
-        v2f = m1 * (1 + coeficiente_restitucion) * v1i + \
-              (m2 - m1 * coeficiente_restitucion) * v2i
-        v2f /= (m1 + m2)
-        
-        # Extraer el valor numérico si son cantidades con unidades
-        if hasattr(v1f, 'magnitude'):
-            v1f = v1f.magnitude
-            v2f = v2f.magnitude
-        
+
+        # Extraer magnitudes (convirtiendo a las unidades pedidas) y delegar
+        # el sistema de ecuaciones (conservación del momento + coeficiente de
+        # restitución) al núcleo JIT.
+        unidad_masa = unidades.get('masa', '') if unidades else None
+        unidad_velocidad = unidades.get('velocidad', '') if unidades else None
+
+        v1f, v2f = _colision_1d(
+            float(_magnitud(m1, unidad_masa)),
+            float(_magnitud(v1i, unidad_velocidad)),
+            float(_magnitud(m2, unidad_masa)),
+            float(_magnitud(v2i, unidad_velocidad)),
+            coeficiente_restitucion,
+        )
+
+        # Reaplicar unidades si se especificaron
+        if unidades and unidad_velocidad:
+            v1f = Q_(v1f, unidad_velocidad)
+            v2f = Q_(v2f, unidad_velocidad)
+
         return v1f, v2f
-    
+
+    def colision_unidimensional_lote(
+        self,
+        m1: Union[float, np.ndarray],
+        v1i: Union[float, np.ndarray],
+        m2: Union[float, np.ndarray],
+        v2i: Union[float, np.ndarray],
+        coeficiente_restitucion: Union[float, np.ndarray] = 1.0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Versión vectorizada de :meth:`colision_unidimensional`.
+
+        Cualquier argumento puede ser un array y el resto escalares; los
+        barridos de parámetros (p. ej. ``coeficiente_restitucion =
+        np.linspace(0, 1, 100)`` sobre las mismas masas y velocidades) se
+        resuelven en una sola llamada al núcleo compilado, sin bucle Python.
+
+        Parameters
+        ----------
+        m1, v1i, m2, v2i : float o numpy.ndarray
+            Masas y velocidades iniciales (difundibles entre sí).
+        coeficiente_restitucion : float o numpy.ndarray, opcional
+            Coeficiente(s) de restitución en [0, 1]. Por defecto 1.0.
+
+        Returns
+        -------
+        tuple
+            Arrays con las velocidades finales (v1f, v2f).
+
+        Raises
+        ------
+        ValueError
+            Si algún coeficiente de restitución no está en el rango [0, 1].
+        """
+        e = np.asarray(coeficiente_restitucion, dtype=float)
+        if np.any(e < 0) or np.any(e > 1):
+            raise ValueError("El coeficiente de restitución debe estar entre 0 y 1.")
+
+        return _colision_1d_lote(m1, v1i, m2, v2i, e)
+
     def colision_bidimensional(
         self,
         m1: float,
@@ -139,53 +239,27 @@ class ChoquesColisiones:
         """
         if not 0 <= coeficiente_restitucion <= 1:
             raise ValueError("El coeficiente de restitución debe estar entre 0 y 1.")
-            
-        # Convertir a arrays de numpy si es necesario
-        v1i = np.asarray(v1i, dtype=float)
-        v2i = np.asarray(v2i, dtype=float)
-        
-        # Aplicar unidades si se especifican
-        if unidades:
-            m1 = Q_(m1, unidades.get('masa', ''))
-            m2 = Q_(m2, unidades.get('masa', ''))
-            v1i = Q_(v1i, unidades.get('velocidad', ''))
-            v2i = Q_(v2i, unidades.get('velocidad', ''))
-        
-        # Matriz de rotación para el sistema de coordenadas de la colisión
+
+        unidad_velocidad = unidades.get('velocidad', '') if unidades else None
+
+        # Convertir a arrays de numpy (extrayendo magnitudes si traen unidades)
+        v1i = np.asarray(_magnitud(v1i, unidad_velocidad), dtype=float)
+        v2i = np.asarray(_magnitud(v2i, unidad_velocidad), dtype=float)
+        m1 = float(_magnitud(m1, unidades.get('masa', '') if unidades else None))
+        m2 = float(_magnitud(m2, unidades.get('masa', '') if unidades else None))
+
+        # La dirección normal del impacto equivale a rotar el eje x por el
+        # ángulo de impacto; las componentes tangenciales no cambian.
         c, s = np.cos(angulo_impacto), np.sin(angulo_impacto)
-        R = np.array([[c, -s], [s, c]])
-        
-        # Rotar velocidades al sistema de coordenadas de la colisión
-        v1i_rot = R @ v1i
-        v2i_rot = R @ v2i
-        
-        # Velocidad relativa en la dirección normal
-        v_rel_normal = v1i_rot[0] - v2i_rot[0]
-        
-        # Calcular velocidades finales en la dirección normal
-        v1f_rot = np.zeros_like(v1i_rot)
-        v2f_rot = np.zeros_like(v2i_rot)
-        
-        # Conservación del momento lineal en la dirección normal
-        v1f_rot[0] = ((m1 - coeficiente_restitucion * m2) * v1i_rot[0] +
-                      (1 + coeficiente_restitucion) * m2 * v2i_rot[0]) / (m1 + m2)
-        v2f_rot[0] = ((1 + coeficiente_restitucion) * m1 * v1i_rot[0] +
-                      (m2 - coeficiente_restitucion * m1) * v2i_rot[0]) / (m1 + m2)
-        
-        # Las velocidades tangenciales no cambian
-        v1f_rot[1] = v1i_rot[1]
-        v2f_rot[1] = v2i_rot[1]
-        
-        # Rotar de vuelta al sistema de coordenadas original
-        R_inv = R.T  # La inversa de una matriz de rotación es su transpuesta
-        v1f = R_inv @ v1f_rot
-        v2f = R_inv @ v2f_rot
-        
-        # Extraer el valor numérico si son cantidades con unidades
-        if hasattr(v1f[0], 'magnitude'):
-            v1f = np.array([v.magnitude for v in v1f])
-            v2f = np.array([v.magnitude for v in v2f])
-        
+        normal = np.array([c, -s])
+
+        v1f, v2f = _colision_nd(m1, v1i, m2, v2i, normal, coeficiente_restitucion)
+
+        # Reaplicar unidades si se especificaron
+        if unidades and unidad_velocidad:
+            v1f = Q_(v1f, unidad_velocidad)
+            v2f = Q_(v2f, unidad_velocidad)
+
         return v1f, v2f
     
     def colision_tridimensional(
@@ -225,44 +299,26 @@ class ChoquesColisiones:
         """
         if not 0 <= coeficiente_restitucion <= 1:
             raise ValueError("El coeficiente de restitución debe estar entre 0 y 1.")
-            
-        # Convertir a arrays de numpy
-        v1i = np.asarray(v1i, dtype=float)
-        v2i = np.asarray(v2i, dtype=float)
-        normal = np.asarray(normal_impacto, dtype=float)
-        
+
+        unidad_velocidad = unidades.get('velocidad', '') if unidades else None
+
+        # Convertir a arrays de numpy (extrayendo magnitudes si traen unidades)
+        v1i = np.asarray(_magnitud(v1i, unidad_velocidad), dtype=float)
+        v2i = np.asarray(_magnitud(v2i, unidad_velocidad), dtype=float)
+        m1 = float(_magnitud(m1, unidades.get('masa', '') if unidades else None))
+        m2 = float(_magnitud(m2, unidades.get('masa', '') if unidades else None))
+
         # Normalizar el vector normal
+        normal = np.asarray(normal_impacto, dtype=float)
         normal = normal / np.linalg.norm(normal)
-        
-        # Aplicar unidades si se especifican
-        if unidades:
-            m1 = Q_(m1, unidades.get('masa', ''))
-            m2 = Q_(m2, unidades.get('masa', ''))
-            v1i = Q_(v1i, unidades.get('velocidad', ''))
-            v2i = Q_(v2i, unidades.get('velocidad', ''))
-        
-        # Calcular las componentes normal y tangencial
-        v1i_normal = np.dot(v1i, normal) * normal
-        v1i_tang = v1i - v1i_normal
-        
-        v2i_normal = np.dot(v2i, normal) * normal
-        v2i_tang = v2i - v2i_normal
-        
-        # Calcular velocidades finales en la dirección normal
-        v1f_normal = ((m1 - coeficiente_restitucion * m2) * v1i_normal +
-                      (1 + coeficiente_restitucion) * m2 * v2i_normal) / (m1 + m2)
-        v2f_normal = ((1 + coeficiente_restitucion) * m1 * v1i_normal +
-                      (m2 - coeficiente_restitucion * m1) * v2i_normal) / (m1 + m2)
-        
-        # Las componentes tangenciales no cambian
-        v1f = v1i_tang + v1f_normal
-        v2f = v2i_tang + v2f_normal
-        
-        # Extraer el valor numérico si son cantidades con unidades
-        if hasattr(v1f[0], 'magnitude'):
-            v1f = np.array([v.magnitude for v in v1f])
-            v2f = np.array([v.magnitude for v in v2f])
-        
+
+        v1f, v2f = _colision_nd(m1, v1i, m2, v2i, normal, coeficiente_restitucion)
+
+        # Reaplicar unidades si se especificaron
+        if unidades and unidad_velocidad:
+            v1f = Q_(v1f, unidad_velocidad)
+            v2f = Q_(v2f, unidad_velocidad)
+
         return v1f, v2f
     
     def coeficiente_restitucion(
@@ -344,13 +400,26 @@ class ChoquesColisiones:
             
         Returns
         -------
-        float
-            Energía cinética perdida en la colisión.
-            
+        float o numpy.ndarray
+            Energía cinética perdida en la colisión (array si las entradas
+            son arrays).
+
         Raises
         ------
         ValueError
             Si no se proporcionan ni las velocidades finales ni el coeficiente de restitución.
+
+        Examples
+        --------
+        Las operaciones internas difunden, así que un barrido completo de
+        coeficientes de restitución se evalúa en una sola llamada:
+
+        >>> choques = ChoquesColisiones()
+        >>> e = np.array([0.0, 0.7, 1.0])
+        >>> v1f, v2f = choques.colision_unidimensional_lote(2.0, 3.0, 5.0, -1.0, e)
+        >>> perdidas = choques.energia_cinetica_perdida(2.0, 3.0, 5.0, -1.0, v1f, v2f)
+        >>> perdidas.shape
+        (3,)
         """
         # Aplicar unidades si se especifican
         if unidades:
@@ -379,12 +448,11 @@ class ChoquesColisiones:
         
         # Calcular energía perdida
         delta_K = K_i - K_f
-        
-        # Asegurar que no sea negativa (por posibles errores de redondeo)
-        delta_K = max(0.0, delta_K)
-        
+
         # Extraer el valor numérico si es una cantidad con unidades
         if hasattr(delta_K, 'magnitude'):
             delta_K = delta_K.magnitude
-        
-        return delta_K
+
+        # Asegurar que no sea negativa (por posibles errores de redondeo);
+        # np.maximum preserva la forma cuando las velocidades son arrays.
+        return np.maximum(0.0, delta_K)
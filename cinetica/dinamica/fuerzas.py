@@ -7,10 +7,56 @@ fuerzas elásticas, fuerzas gravitacionales y análisis de diagramas de cuerpo l
 """
 
 import math
+from functools import lru_cache
 from typing import Union, List, Optional, Tuple, Dict
 import numpy as np
 from ..units import ureg, Q_
 
+# Constantes físicas construidas una sola vez a nivel de módulo: envolverlas
+# con Q_ en cada llamada repite el análisis de unidades de pint sin necesidad.
+_g = Q_(9.81, ureg.meter / ureg.second**2)
+_G = Q_(6.67430e-11, ureg.meter**3 / (ureg.kilogram * ureg.second**2))
+
+
+def _sincos(angulo_rad) -> Tuple[float, float]:
+    """Seno y coseno del mismo ángulo en una sola llamada compartida.
+
+    Los escalares se memoizan: los ángulos típicos (π/6, π/4...) se repiten
+    entre llamadas. Los arrays no son hashables y van por np.sin/np.cos.
+    """
+    if np.ndim(angulo_rad) == 0:
+        return _sincos_escalar(float(angulo_rad))
+    return np.sin(angulo_rad), np.cos(angulo_rad)
+
+
+@lru_cache(maxsize=128)
+def _sincos_escalar(angulo_rad: float) -> Tuple[float, float]:
+    """Memoiza (sin, cos) por ángulo escalar."""
+    return math.sin(angulo_rad), math.cos(angulo_rad)
+
+
+def _minimo(valores):
+    """Mínimo global de un conjunto de escalares, arrays o Quantities."""
+    return min(
+        np.min(v.magnitude if isinstance(v, Q_) else np.asarray(v)) for v in valores
+    )
+
+
+def _validar_no_negativo(mensaje: str, *valores) -> None:
+    """Lanza ValueError(mensaje) si algún valor es negativo.
+
+    Una única comparación vectorizada reemplaza una cadena de ``if x < 0``
+    por elemento, relevante cuando los argumentos son arrays.
+    """
+    if _minimo(valores) < 0:
+        raise ValueError(mensaje)
+
+
+def _validar_positivo(mensaje: str, *valores) -> None:
+    """Lanza ValueError(mensaje) si algún valor es cero o negativo."""
+    if _minimo(valores) <= 0:
+        raise ValueError(mensaje)
+
 
 class AnalisisFuerzas:
     """
@@ -29,6 +75,9 @@ class AnalisisFuerzas:
     Fricción estática máxima: 30.0 newton
     """
 
+    # Sin estado de instancia: permite compartir una única instancia.
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Inicializa una instancia de AnalisisFuerzas."""
         pass
@@ -43,9 +92,9 @@ class AnalisisFuerzas:
 
         Parameters
         ----------
-        normal : float or pint.Quantity
-            Fuerza normal en N.
-        coeficiente : float
+        normal : float, array_like or pint.Quantity
+            Fuerza normal en N. Un array evalúa todo un barrido en una llamada.
+        coeficiente : float or array_like
             Coeficiente de fricción estática (adimensional).
 
         Returns
@@ -66,10 +115,12 @@ class AnalisisFuerzas:
         donde μ_s es el coeficiente de fricción estática y N la fuerza normal.
         """
         if not isinstance(normal, Q_):
-            normal = Q_(normal, ureg.newton)
+            if isinstance(normal, (list, tuple, np.ndarray)):
+                normal = Q_(np.asarray(normal, dtype=float), ureg.newton)
+            else:
+                normal = Q_(normal, ureg.newton)
 
-        if coeficiente < 0:
-            raise ValueError("El coeficiente de fricción debe ser no negativo")
+        _validar_no_negativo("El coeficiente de fricción debe ser no negativo", coeficiente)
 
         return coeficiente * normal
 
@@ -83,9 +134,9 @@ class AnalisisFuerzas:
 
         Parameters
         ----------
-        normal : float or pint.Quantity
-            Fuerza normal en N.
-        coeficiente : float
+        normal : float, array_like or pint.Quantity
+            Fuerza normal en N. Un array evalúa todo un barrido en una llamada.
+        coeficiente : float or array_like
             Coeficiente de fricción cinética (adimensional).
 
         Returns
@@ -106,10 +157,12 @@ class AnalisisFuerzas:
         donde μ_k es el coeficiente de fricción cinética y N la fuerza normal.
         """
         if not isinstance(normal, Q_):
-            normal = Q_(normal, ureg.newton)
+            if isinstance(normal, (list, tuple, np.ndarray)):
+                normal = Q_(np.asarray(normal, dtype=float), ureg.newton)
+            else:
+                normal = Q_(normal, ureg.newton)
 
-        if coeficiente < 0:
-            raise ValueError("El coeficiente de fricción debe ser no negativo")
+        _validar_no_negativo("El coeficiente de fricción debe ser no negativo", coeficiente)
 
         return coeficiente * normal
 
@@ -151,8 +204,7 @@ class AnalisisFuerzas:
         if not isinstance(deformacion, Q_):
             deformacion = Q_(deformacion, ureg.meter)
 
-        if constante.magnitude < 0:
-            raise ValueError("La constante elástica debe ser positiva")
+        _validar_no_negativo("La constante elástica debe ser positiva", constante)
 
         return constante * deformacion
 
@@ -161,7 +213,7 @@ class AnalisisFuerzas:
         masa1: Union[float, Q_],
         masa2: Union[float, Q_],
         distancia: Union[float, Q_],
-        G: Union[float, Q_] = 6.67430e-11
+        G: Union[float, Q_] = _G
     ) -> Q_:
         """
         Calcula la fuerza gravitacional entre dos masas.
@@ -202,10 +254,8 @@ class AnalisisFuerzas:
         if not isinstance(G, Q_):
             G = Q_(G, ureg.meter**3 / (ureg.kilogram * ureg.second**2))
 
-        if distancia.magnitude <= 0:
-            raise ValueError("La distancia debe ser positiva")
-        if masa1.magnitude <= 0 or masa2.magnitude <= 0:
-            raise ValueError("Las masas deben ser positivas")
+        _validar_positivo("La distancia debe ser positiva", distancia)
+        _validar_positivo("Las masas deben ser positivas", masa1, masa2)
 
         return G * masa1 * masa2 / (distancia**2)
 
@@ -240,11 +290,11 @@ class AnalisisFuerzas:
         if not isinstance(angulo, Q_):
             angulo = Q_(angulo, ureg.radian)
 
-        if magnitud.magnitude < 0:
-            raise ValueError("La magnitud de la fuerza debe ser no negativa")
+        _validar_no_negativo("La magnitud de la fuerza debe ser no negativa", magnitud)
 
-        Fx = magnitud * math.cos(angulo.to(ureg.radian).magnitude)
-        Fy = magnitud * math.sin(angulo.to(ureg.radian).magnitude)
+        seno, coseno = _sincos(angulo.to(ureg.radian).magnitude)
+        Fx = magnitud * coseno
+        Fy = magnitud * seno
 
         return Fx, Fy
 
@@ -321,13 +371,12 @@ class AnalisisFuerzas:
         if not isinstance(angulo, Q_):
             angulo = Q_(angulo, ureg.radian)
 
-        if peso.magnitude < 0:
-            raise ValueError("El peso debe ser positivo")
+        _validar_no_negativo("El peso debe ser positivo", peso)
 
-        angulo_rad = angulo.to(ureg.radian).magnitude
+        seno, coseno = _sincos(angulo.to(ureg.radian).magnitude)
 
-        F_paralela = peso * math.sin(angulo_rad)
-        F_perpendicular = peso * math.cos(angulo_rad)
+        F_paralela = peso * seno
+        F_perpendicular = peso * coseno
 
         return F_paralela, F_perpendicular
 
@@ -336,7 +385,7 @@ class AnalisisFuerzas:
         masa: Union[float, Q_],
         aceleracion: Union[float, Q_] = 0,
         angulo: Union[float, Q_] = 0,
-        gravedad: Union[float, Q_] = 9.81
+        gravedad: Union[float, Q_] = _g
     ) -> Q_:
         """
         Calcula la tensión en una cuerda.
@@ -377,8 +426,7 @@ class AnalisisFuerzas:
         if not isinstance(gravedad, Q_):
             gravedad = Q_(gravedad, ureg.meter / ureg.second**2)
 
-        if masa.magnitude <= 0:
-            raise ValueError("La masa debe ser positiva")
+        _validar_positivo("La masa debe ser positiva", masa)
 
         # Para cuerda vertical: T = m(g + a)
         # Para cuerda inclinada: T = m(g + a) / cos(θ)
@@ -9,8 +9,25 @@ aplicaciones de las leyes del movimiento.
 import math
 from typing import Union, List, Optional, Tuple
 import numpy as np
+from numba import njit
 from ..units import ureg, Q_
 
+# Constante construida una sola vez: cada Q_(9.81, m/s²) por llamada paga un
+# Quantity.__init__ completo con análisis de unidades.
+_g = Q_(9.81, ureg.meter / ureg.second**2)
+
+
+@njit(cache=True, fastmath=True)
+def _segunda_ley_kernel(masa, aceleracion):
+    """Núcleo JIT del producto F = m·a sobre magnitudes sin unidades."""
+    return masa * aceleracion
+
+
+@njit(cache=True, fastmath=True)
+def _fuerza_centripeta_kernel(masa, velocidad, radio):
+    """Núcleo JIT de F_c = m·v²/r sobre magnitudes sin unidades."""
+    return masa * velocidad * velocidad / radio
+
 
 class LeyesNewton:
     """
@@ -40,6 +57,9 @@ class LeyesNewton:
        igual y opuesta.
     """
 
+    # Sin estado de instancia: permite compartir una única instancia.
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Inicializa una instancia de LeyesNewton."""
         pass
@@ -118,16 +138,28 @@ class LeyesNewton:
             else:
                 fuerza = Q_(fuerza, ureg.newton)
 
-        # Calcular el parámetro faltante
+        # Calcular el parámetro faltante sobre magnitudes en unidades base:
+        # la aritmética ocurre fuera de pint y el resultado se reenvuelve una
+        # sola vez con la unidad correspondiente.
         if masa is None:
             # m = F / a
-            return fuerza / aceleracion
+            f_mag = fuerza.to(ureg.newton).magnitude
+            a_mag = aceleracion.to(ureg.meter / ureg.second**2).magnitude
+            return Q_(f_mag / a_mag, ureg.kilogram)
         elif aceleracion is None:
             # a = F / m
-            return fuerza / masa
+            f_mag = fuerza.to(ureg.newton).magnitude
+            m_mag = masa.to(ureg.kilogram).magnitude
+            return Q_(f_mag / m_mag, ureg.meter / ureg.second**2)
         else:
             # F = m * a
-            return masa * aceleracion
+            a_mag = aceleracion.to(ureg.meter / ureg.second**2).magnitude
+            if isinstance(a_mag, np.ndarray):
+                a_mag = np.asarray(a_mag, dtype=float)
+            else:
+                a_mag = float(a_mag)
+            f_mag = _segunda_ley_kernel(float(masa.to(ureg.kilogram).magnitude), a_mag)
+            return Q_(f_mag, ureg.newton)
 
     def fuerza_neta(self, fuerzas: List[Union[float, Q_, np.ndarray]]) -> Union[Q_, np.ndarray]:
         """
@@ -155,26 +187,27 @@ class LeyesNewton:
         >>> fuerzas_2d = [np.array([10, 0]), np.array([0, 15]), np.array([-5, -3])]
         >>> F_neta_2d = newton.fuerza_neta(fuerzas_2d)
         """
+        if isinstance(fuerzas, np.ndarray):
+            # Camino directo para arrays homogéneos (p. ej. miles de fuerzas
+            # escalares, o (N, 3) vectoriales): una reducción C sobre el
+            # primer eje sin recorrer elemento a elemento en Python.
+            if fuerzas.size == 0:
+                raise ValueError("Debe proporcionar al menos una fuerza")
+            total = np.add.reduce(np.asarray(fuerzas, dtype=np.float64), axis=0)
+            return Q_(total, ureg.newton)
+
         if not fuerzas:
             raise ValueError("Debe proporcionar al menos una fuerza")
 
-        # Convertir todas las fuerzas a cantidades con unidades
-        fuerzas_convertidas = []
-        for fuerza in fuerzas:
-            if not isinstance(fuerza, Q_):
-                if isinstance(fuerza, np.ndarray):
-                    fuerzas_convertidas.append(Q_(fuerza, ureg.newton))
-                else:
-                    fuerzas_convertidas.append(Q_(fuerza, ureg.newton))
-            else:
-                fuerzas_convertidas.append(fuerza)
-
-        # Sumar todas las fuerzas
-        fuerza_neta = fuerzas_convertidas[0]
-        for fuerza in fuerzas_convertidas[1:]:
-            fuerza_neta = fuerza_neta + fuerza
+        # Extraer las magnitudes en newtons y reducir con una sola suma
+        # vectorizada, en lugar de encadenar Quantity.__add__ por elemento.
+        magnitudes = [
+            fuerza.to(ureg.newton).magnitude if isinstance(fuerza, Q_) else fuerza
+            for fuerza in fuerzas
+        ]
+        total = np.sum(np.broadcast_arrays(*magnitudes), axis=0)
 
-        return fuerza_neta
+        return Q_(total, ureg.newton)
 
     def equilibrio(
         self,
@@ -206,12 +239,8 @@ class LeyesNewton:
         """
         fuerza_neta = self.fuerza_neta(fuerzas)
 
-        if isinstance(fuerza_neta.magnitude, np.ndarray):
-            magnitud_neta = np.linalg.norm(fuerza_neta.magnitude)
-        else:
-            magnitud_neta = abs(fuerza_neta.magnitude)
-
-        return magnitud_neta < tolerancia
+        # Una sola reducción vectorizada cubre el caso escalar y el vectorial.
+        return bool(np.all(np.abs(fuerza_neta.magnitude) < tolerancia))
 
     def aceleracion_desde_fuerzas(
         self,
@@ -244,7 +273,7 @@ class LeyesNewton:
         fuerza_neta = self.fuerza_neta(fuerzas)
         return self.segunda_ley(masa=masa, fuerza=fuerza_neta)
 
-    def peso(self, masa: Union[float, Q_], gravedad: Union[float, Q_] = 9.81) -> Q_:
+    def peso(self, masa: Union[float, Q_], gravedad: Union[float, Q_] = _g) -> Q_:
         """
         Calcula el peso de un objeto bajo la influencia gravitacional.
 
@@ -324,4 +353,9 @@ class LeyesNewton:
         if radio.magnitude <= 0:
             raise ValueError("El radio debe ser un valor positivo")
 
-        return masa * velocidad**2 / radio
+        f_mag = _fuerza_centripeta_kernel(
+            float(masa.to(ureg.kilogram).magnitude),
+            float(velocidad.to(ureg.meter / ureg.second).magnitude),
+            float(radio.to(ureg.meter).magnitude),
+        )
+        return Q_(f_mag, ureg.newton)
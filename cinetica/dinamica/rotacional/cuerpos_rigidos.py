@@ -9,6 +9,15 @@ from ...logger import get_logger
 
 logger = get_logger('cinetica.dinamica.rotacional.cuerpos_rigidos')
 
+# Unidad de inercia cacheada: construir 'kg * m**2' por llamada repite el
+# parseo de la expresion de unidades de pint.
+_INERTIA_UNIT = ureg.kilogram * ureg.meter**2
+
+
+def _strip(cantidad: Q_, unidad: str) -> float:
+    """Convierte `cantidad` a `unidad` y devuelve la magnitud sin unidades."""
+    return cantidad.to(unidad).magnitude
+
 
 class CuerposRigidos:
     """
@@ -44,22 +53,22 @@ class CuerposRigidos:
         """
         # Validar unidades
         try:
-            masa.to('kg')
+            masa_kg = _strip(masa, 'kg')
         except Exception:
             raise Exception("Unidades incompatibles: la masa debe tener unidades de masa")
         
         try:
-            radio.to('m')
+            radio_m = _strip(radio, 'm')
         except Exception:
             raise Exception("Unidades incompatibles: el radio debe tener unidades de longitud")
         
-        inercia = 0.5 * masa * radio**2
+        inercia = Q_(0.5 * masa_kg * radio_m**2, _INERTIA_UNIT)
         self.forma = "cilindro_solido"
         self.dimensiones = {"radio": radio}
         self.masa = masa
         self.inercia = inercia
         
-        logger.info(f"Momento de inercia cilindro sólido: {inercia}")
+        logger.info("Momento de inercia cilindro sólido: %s", inercia)
         return inercia
     
     def inercia_cilindro_vacio(self, masa: Q_, radio_interno: Q_, radio_externo: Q_) -> Q_:
@@ -75,13 +84,16 @@ class CuerposRigidos:
             Momento de inercia [kg·m²]
         """
         # Para cilindro hueco: I = (1/2) * m * (r_ext² + r_int²)
-        inercia = 0.5 * masa * (radio_externo**2 + radio_interno**2)
+        inercia = Q_(
+            0.5 * _strip(masa, 'kg') * (_strip(radio_externo, 'm')**2 + _strip(radio_interno, 'm')**2),
+            _INERTIA_UNIT,
+        )
         self.forma = "cilindro_hueco"
         self.dimensiones = {"radio_interno": radio_interno, "radio_externo": radio_externo}
         self.masa = masa
         self.inercia = inercia
         
-        logger.info(f"Momento de inercia cilindro hueco: {inercia}")
+        logger.info("Momento de inercia cilindro hueco: %s", inercia)
         return inercia
     
     def inercia_esfera_solido(self, masa: Q_, radio: Q_) -> Q_:
@@ -98,13 +110,13 @@ class CuerposRigidos:
         Formula:
             I = (2/5) * m * r²
         """
-        inercia = (2/5) * masa * radio**2
+        inercia = Q_((2/5) * _strip(masa, 'kg') * _strip(radio, 'm')**2, _INERTIA_UNIT)
         self.forma = "esfera_solida"
         self.dimensiones = {"radio": radio}
         self.masa = masa
         self.inercia = inercia
         
-        logger.info(f"Momento de inercia esfera sólida: {inercia}")
+        logger.info("Momento de inercia esfera sólida: %s", inercia)
         return inercia
     
     def inercia_varilla_centro(self, masa: Q_, longitud: Q_) -> Q_:
@@ -121,13 +133,13 @@ class CuerposRigidos:
         Formula:
             I = (1/12) * m * L²
         """
-        inercia = (1/12) * masa * longitud**2
+        inercia = Q_((1/12) * _strip(masa, 'kg') * _strip(longitud, 'm')**2, _INERTIA_UNIT)
         self.forma = "varilla_centro"
         self.dimensiones = {"longitud": longitud}
         self.masa = masa
         self.inercia = inercia
         
-        logger.info(f"Momento de inercia varilla (centro): {inercia}")
+        logger.info("Momento de inercia varilla (centro): %s", inercia)
         return inercia
     
     def inercia_varilla_extremo(self, masa: Q_, longitud: Q_) -> Q_:
@@ -144,13 +156,13 @@ class CuerposRigidos:
         Formula:
             I = (1/3) * m * L²
         """
-        inercia = (1/3) * masa * longitud**2
+        inercia = Q_((1/3) * _strip(masa, 'kg') * _strip(longitud, 'm')**2, _INERTIA_UNIT)
         self.forma = "varilla_extremo"
         self.dimensiones = {"longitud": longitud}
         self.masa = masa
         self.inercia = inercia
         
-        logger.info(f"Momento de inercia varilla (extremo): {inercia}")
+        logger.info("Momento de inercia varilla (extremo): %s", inercia)
         return inercia
     
     def inercia_placa_rectangular(self, masa: Q_, ancho: Q_, alto: Q_, eje: str = "centro") -> Q_:
@@ -166,15 +178,19 @@ class CuerposRigidos:
         Returns:
             Momento de inercia [kg·m²]
         """
+        masa_kg = _strip(masa, 'kg')
+        ancho_m = _strip(ancho, 'm')
+        alto_m = _strip(alto, 'm')
+
         if eje == "centro":
             # Respecto al centro, perpendicular al plano
-            inercia = (1/12) * masa * (ancho**2 + alto**2)
+            inercia = Q_((1/12) * masa_kg * (ancho_m**2 + alto_m**2), _INERTIA_UNIT)
         elif eje == "ancho":
             # Respecto al eje del ancho
-            inercia = (1/12) * masa * alto**2
+            inercia = Q_((1/12) * masa_kg * alto_m**2, _INERTIA_UNIT)
         elif eje == "alto":
             # Respecto al eje del alto
-            inercia = (1/12) * masa * ancho**2
+            inercia = Q_((1/12) * masa_kg * ancho_m**2, _INERTIA_UNIT)
         else:
             raise ValueError("Eje debe ser 'centro', 'ancho' o 'alto'")
         
@@ -183,7 +199,7 @@ class CuerposRigidos:
         self.masa = masa
         self.inercia = inercia
         
-        logger.info(f"Momento de inercia placa rectangular ({eje}): {inercia}")
+        logger.info("Momento de inercia placa rectangular (%s): %s", eje, inercia)
         return inercia
     
     def radio_giro(self, inercia: Q_, masa: Q_) -> Q_:
@@ -211,7 +227,7 @@ class CuerposRigidos:
         
         radio = np.sqrt(inercia.magnitude / masa.magnitude) * ureg.meter
         
-        logger.info(f"Radio de giro: {radio}")
+        logger.info("Radio de giro: %s", radio)
         return radio
     
     def inercia_cilindro_hueco(self, masa: Q_, radio: Q_) -> Q_:
@@ -228,13 +244,13 @@ class CuerposRigidos:
         Formula:
             I = m * r²
         """
-        inercia = masa * radio**2
+        inercia = Q_(_strip(masa, 'kg') * _strip(radio, 'm')**2, _INERTIA_UNIT)
         self.forma = "cilindro_hueco"
         self.dimensiones = {"radio": radio}
         self.masa = masa
         self.inercia = inercia
         
-        logger.info(f"Momento de inercia cilindro hueco: {inercia}")
+        logger.info("Momento de inercia cilindro hueco: %s", inercia)
         return inercia
     
     def inercia_esfera_hueco(self, masa: Q_, radio: Q_) -> Q_:
@@ -251,13 +267,13 @@ class CuerposRigidos:
         Formula:
             I = (2/3) * m * r²
         """
-        inercia = (2/3) * masa * radio**2
+        inercia = Q_((2/3) * _strip(masa, 'kg') * _strip(radio, 'm')**2, _INERTIA_UNIT)
         self.forma = "esfera_hueco"
         self.dimensiones = {"radio": radio}
         self.masa = masa
         self.inercia = inercia
         
-        logger.info(f"Momento de inercia esfera hueco: {inercia}")
+        logger.info("Momento de inercia esfera hueco: %s", inercia)
         return inercia
     
     def inercia_placa_rectangular_centro(self, masa: Q_, ancho: Q_, largo: Q_) -> Q_:
@@ -275,13 +291,13 @@ class CuerposRigidos:
         Formula:
             I = (1/12) * m * (w² + l²)
         """
-        inercia = (1/12) * masa * (ancho**2 + largo**2)
+        inercia = Q_((1/12) * _strip(masa, 'kg') * (_strip(ancho, 'm')**2 + _strip(largo, 'm')**2), _INERTIA_UNIT)
         self.forma = "placa_rectangular_centro"
         self.dimensiones = {"ancho": ancho, "largo": largo}
         self.masa = masa
         self.inercia = inercia
         
-        logger.info(f"Momento de inercia placa rectangular (centro): {inercia}")
+        logger.info("Momento de inercia placa rectangular (centro): %s", inercia)
         return inercia
     
     def inercia_placa_rectangular_eje_ancho(self, masa: Q_, ancho: Q_, largo: Q_) -> Q_:
@@ -299,13 +315,13 @@ class CuerposRigidos:
         Formula:
             I = (1/12) * m * l²
         """
-        inercia = (1/12) * masa * largo**2
+        inercia = Q_((1/12) * _strip(masa, 'kg') * _strip(largo, 'm')**2, _INERTIA_UNIT)
         self.forma = "placa_rectangular_eje_ancho"
         self.dimensiones = {"ancho": ancho, "largo": largo}
         self.masa = masa
         self.inercia = inercia
         
-        logger.info(f"Momento de inercia placa rectangular (eje ancho): {inercia}")
+        logger.info("Momento de inercia placa rectangular (eje ancho): %s", inercia)
         return inercia
     
     def momento_inercia_combinado(self, momentos: list) -> Q_:
@@ -319,16 +335,23 @@ class CuerposRigidos:
             Momento de inercia total [kg·m²]
         """
         if not momentos:
-            return Q_(0.0, 'kg * m**2')
-        
-        inercia_total = sum(momentos)
+            return Q_(0.0, _INERTIA_UNIT)
+
+        # Una conversión por entrada y una única reducción vectorizada, en
+        # lugar de encadenar Quantity.__add__ elemento a elemento.
+        magnitudes = np.fromiter(
+            (_strip(momento, _INERTIA_UNIT) for momento in momentos),
+            dtype=np.float64,
+            count=len(momentos),
+        )
+        inercia_total = Q_(magnitudes.sum(), _INERTIA_UNIT)
         
         self.forma = "sistema_combinado"
         self.dimensiones = {"n_componentes": len(momentos)}
         self.masa = Q_(0.0, 'kg')  # No se especifica masa total
         self.inercia = inercia_total
         
-        logger.info(f"Momento de inercia combinado: {inercia_total}")
+        logger.info("Momento de inercia combinado: %s", inercia_total)
         return inercia_total
     
     def inercia_compuesta(self, masas: list, inercias: list, distancias: list = None) -> Q_:
@@ -361,7 +384,7 @@ class CuerposRigidos:
         self.masa = sum(masas)
         self.inercia = inercia_total
         
-        logger.info(f"Momento de inercia sistema compuesto: {inercia_total}")
+        logger.info("Momento de inercia sistema compuesto: %s", inercia_total)
         return inercia_total
     
     def informacion_cuerpo(self) -> Dict:
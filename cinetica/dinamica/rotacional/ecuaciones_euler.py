@@ -49,7 +49,7 @@ class EcuacionesEuler:
         ])
         
         self.momento_inercia = tensor
-        logger.info(f"Tensor de inercia definido:\n{tensor}")
+        logger.info("Tensor de inercia definido:\n%s", tensor)
     
     def ecuaciones_euler(self, velocidad_angular: np.ndarray, torque: np.ndarray) -> np.ndarray:
         """
@@ -96,7 +96,7 @@ class EcuacionesEuler:
         self.velocidad_angular = velocidad_angular
         self.torque = torque
         
-        logger.info(f"Aceleración angular: {domega_dt} rad/s²")
+        logger.info("Aceleración angular: %s rad/s²", domega_dt)
         return domega_dt
     
     def estabilidad_rotacion(self, eje_rotacion: str = 'z') -> bool:
@@ -130,10 +130,10 @@ class EcuacionesEuler:
         
         if es_intermedio:
             estable = False
-            logger.warning(f"Rotación inestable alrededor del eje {eje_rotacion}")
+            logger.warning("Rotación inestable alrededor del eje %s", eje_rotacion)
         else:
             estable = True
-            logger.info(f"Rotación estable alrededor del eje {eje_rotacion}")
+            logger.info("Rotación estable alrededor del eje %s", eje_rotacion)
         
         return estable
     
@@ -174,7 +174,7 @@ class EcuacionesEuler:
         from ...units import ureg
         velocidad_precesion = Q_(velocidad_precesion_magnitude, 'rad/s')
         
-        logger.info(f"Velocidad de precesión: {velocidad_precesion}")
+        logger.info("Velocidad de precesión: %s", velocidad_precesion)
         return velocidad_precesion
     
     def energia_rotacional_cuerpo_rigido(self, velocidad_angular: np.ndarray) -> Q_:
@@ -197,7 +197,7 @@ class EcuacionesEuler:
         i_omega = np.dot(self.momento_inercia, omega.magnitude)
         energia = 0.5 * np.dot(omega.magnitude, i_omega) * ureg.joule
         
-        logger.info(f"Energía rotacional: {energia}")
+        logger.info("Energía rotacional: %s", energia)
         return energia
     
     def torque_cambio_momento_angular(self, velocidad_angular_inicial: np.ndarray, 
@@ -222,7 +222,7 @@ class EcuacionesEuler:
         # Torque = dL/dt
         torque = delta_momento / tiempo.magnitude
         
-        logger.info(f"Torque requerido: {torque} N·m")
+        logger.info("Torque requerido: %s N·m", torque)
         return torque
     
     def resolver_ecuaciones_euler(self, velocidades_angulares: list) -> list:
@@ -256,7 +256,7 @@ class EcuacionesEuler:
         from ...units import ureg
         torque_quantities = [Q_(t, 'N * m') for t in torque]
         
-        logger.info(f"Torques calculados: {torque_quantities}")
+        logger.info("Torques calculados: %s", torque_quantities)
         return torque_quantities
     
     def energia_cinetica_rotacional(self, velocidades_angulares: list) -> Q_:
@@ -310,7 +310,7 @@ class EcuacionesEuler:
         from ...units import ureg
         torque_quantities = [Q_(t, 'N * m') for t in torque]
         
-        logger.info(f"Torques para cambio de momento: {torque_quantities}")
+        logger.info("Torques para cambio de momento: %s", torque_quantities)
         return torque_quantities
     
     @property
@@ -54,7 +54,7 @@ class EnergiaRotacional:
         energia = 0.5 * inercia * velocidad_angular**2
         self.energia_cinetica = energia
         
-        logger.info(f"Energía cinética rotacional: {energia}")
+        logger.info("Energía cinética rotacional: %s", energia)
         return energia
     
     def energia_cinetica_total(self, masa: Q_, velocidad_lineal: Q_, inercia: Q_, velocidad_angular: Q_) -> Q_:
@@ -79,9 +79,9 @@ class EnergiaRotacional:
         
         self.energia_cinetica = energia_total
         
-        logger.info(f"Energía cinética total: {energia_total}")
-        logger.info(f"  Traslacional: {energia_traslacional}")
-        logger.info(f"  Rotacional: {energia_rotacional}")
+        logger.info("Energía cinética total: %s", energia_total)
+        logger.info("  Traslacional: %s", energia_traslacional)
+        logger.info("  Rotacional: %s", energia_rotacional)
         
         return energia_total
     
@@ -103,7 +103,7 @@ class EnergiaRotacional:
         energia = masa * gravedad * altura
         self.energia_potencial = energia
         
-        logger.info(f"Energía potencial gravitacional: {energia}")
+        logger.info("Energía potencial gravitacional: %s", energia)
         return energia
     
     def conservacion_energia_mecanica(self, energia_inicial: Q_, energia_final: Q_) -> bool:
@@ -124,7 +124,7 @@ class EnergiaRotacional:
             logger.info("Se conserva la energía mecánica")
         else:
             perdida = energia_inicial - energia_final
-            logger.warning(f"No se conserva la energía mecánica. Pérdida: {perdida}")
+            logger.warning("No se conserva la energía mecánica. Pérdida: %s", perdida)
         
         return conservada
     
@@ -144,7 +144,7 @@ class EnergiaRotacional:
         """
         trabajo = torque * angulo
         
-        logger.info(f"Trabajo por torque: {trabajo}")
+        logger.info("Trabajo por torque: %s", trabajo)
         return trabajo
     
     def potencia_rotacional(self, torque: Q_, velocidad_angular: Q_) -> Q_:
@@ -163,7 +163,7 @@ class EnergiaRotacional:
         """
         potencia = torque * velocidad_angular
         
-        logger.info(f"Potencia rotacional: {potencia}")
+        logger.info("Potencia rotacional: %s", potencia)
         return potencia
     
     def energia_cinetica_cilindro_rodando(self, masa: Q_, radio: Q_, velocidad_cm: Q_) -> Q_:
@@ -224,5 +224,5 @@ class EnergiaRotacional:
         """
         inercia_nuevo = inercia_cm + masa * distancia**2
         
-        logger.info(f"Momento de inercia (ejes paralelos): {inercia_nuevo}")
+        logger.info("Momento de inercia (ejes paralelos): %s", inercia_nuevo)
         return inercia_nuevo
\ No newline at end of file
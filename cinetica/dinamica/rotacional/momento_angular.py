@@ -10,6 +10,19 @@ from ...logger import get_logger
 logger = get_logger('cinetica.dinamica.rotacional.momento_angular')
 
 
+def _cross3(a, b):
+    """Producto cruz desenrollado para un único par de vectores (3,).
+
+    Para un solo par, el despacho y el array temporal de ``np.cross``
+    dominan el costo; las tres componentes expandidas a mano lo evitan.
+    """
+    return (
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    )
+
+
 class MomentoAngular:
     """
     Clase para cálculos de momento angular y su conservación.
@@ -49,7 +62,7 @@ class MomentoAngular:
         self.velocidad_angular = velocidad_angular
         self.momento_angular = inercia * velocidad_angular
         
-        logger.info(f"Momento angular calculado: {self.momento_angular}")
+        logger.info("Momento angular calculado: %s", self.momento_angular)
         return self.momento_angular
     
     def momento_angular_particula(self, masa: Q_, posicion: np.ndarray, velocidad: np.ndarray) -> Q_:
@@ -64,19 +77,21 @@ class MomentoAngular:
         Returns:
             Momento angular [kg·m²/s]
         """
-        # Convertir a unidades base
-        r = posicion * ureg.meter
-        v = velocidad * ureg.meter / ureg.second
-        m = masa
-        
-        # Momento lineal p = m * v
-        momento_lineal = m * v
-        
-        # Momento angular L = r × p
-        momento_angular_vec = np.cross(r.magnitude, momento_lineal.magnitude) * ureg.kg * ureg.meter**2 / ureg.second
+        # Magnitudes crudas; las unidades se aplican una sola vez al final
+        m = masa.magnitude if isinstance(masa, Q_) else masa
+        r = np.asarray(posicion, dtype=np.float64)
+        v = np.asarray(velocidad, dtype=np.float64)
+
+        # Momento angular L = r × (m·v); el caso común de un único par de
+        # vectores (3,) usa la expansión escalar, con np.cross como
+        # respaldo para entradas apiladas
+        if r.shape == (3,) and v.shape == (3,):
+            momento_angular_vec = np.array(_cross3(r, m * v)) * ureg.kg * ureg.meter**2 / ureg.second
+        else:
+            momento_angular_vec = np.cross(r, m * v) * ureg.kg * ureg.meter**2 / ureg.second
         
         self.momento_angular = momento_angular_vec
-        logger.info(f"Momento angular de partícula: {momento_angular_vec}")
+        logger.info("Momento angular de partícula: %s", momento_angular_vec)
         return momento_angular_vec
     
     def conservacion_momento_angular(self, momento_inicial: Q_, momento_final: Q_) -> bool:
@@ -96,7 +111,7 @@ class MomentoAngular:
         if conservado:
             logger.info("Se conserva el momento angular")
         else:
-            logger.warning(f"No se conserva el momento angular: {momento_inicial} → {momento_final}")
+            logger.warning("No se conserva el momento angular: %s → %s", momento_inicial, momento_final)
         
         return conservado
     
@@ -111,7 +126,7 @@ class MomentoAngular:
             Momento de inercia total
         """
         inercia_total = sum(inercias)
-        logger.info(f"Momento de inercia total: {inercia_total}")
+        logger.info("Momento de inercia total: %s", inercia_total)
         return inercia_total
     
     def velocidad_angular_cambio_inercia(self, momento_angular: Q_, inercia_inicial: Q_, inercia_final: Q_) -> Q_:
@@ -133,7 +148,7 @@ class MomentoAngular:
             raise ValueError("El momento de inercia final no puede ser cero")
         
         velocidad_final = momento_angular / inercia_final
-        logger.info(f"Cambio de velocidad angular: {self.velocidad_angular} → {velocidad_final}")
+        logger.info("Cambio de velocidad angular: %s → %s", self.velocidad_angular, velocidad_final)
         
         self.velocidad_angular = velocidad_final
         self.inercia = inercia_final
@@ -70,7 +70,7 @@ class Torque:
         torque_vec = np.cross(r_vec.magnitude, F_vec.magnitude) * ureg.newton * ureg.meter
         
         self.torque = torque_vec
-        logger.info(f"Torque calculado: {torque_vec}")
+        logger.info("Torque calculado: %s", torque_vec)
         return torque_vec
     
     def torque_magnitud(self, fuerza: Q_, brazo_perpendicular: Q_) -> Q_:
@@ -108,7 +108,7 @@ class Torque:
         torque_mag = fuerza * brazo_perpendicular
         self.torque = torque_mag
         
-        logger.info(f"Torque (magnitud): {torque_mag}")
+        logger.info("Torque (magnitud): %s", torque_mag)
         return torque_mag
     
     def calcular_torque_vectorial(self, fuerza: np.ndarray, posicion: np.ndarray) -> np.ndarray:
@@ -136,7 +136,7 @@ class Torque:
         # Calcular el producto cruz r × F
         torque_vec = np.cross(posicion, fuerza)
         
-        logger.info(f"Torque vectorial calculado: {torque_vec}")
+        logger.info("Torque vectorial calculado: %s", torque_vec)
         return torque_vec
     
     def segunda_ley_newton_rotacional(self, inercia: Q_, aceleracion_angular: Q_) -> Q_:
@@ -166,7 +166,7 @@ class Torque:
         torque = inercia * aceleracion_angular
         self.torque = torque
         
-        logger.info(f"Torque (2ª ley rotacional): {torque}")
+        logger.info("Torque (2ª ley rotacional): %s", torque)
         return torque
     
     def cambio_momento_angular(self, momento_inicial: Q_, momento_final: Q_, tiempo: Q_) -> Q_:
@@ -194,7 +194,7 @@ class Torque:
         self.tiempo = tiempo
         self.torque = torque
         
-        logger.info(f"Cambio en momento angular: {delta_L}")
+        logger.info("Cambio en momento angular: %s", delta_L)
         return torque
     
     def torque_equilibrio(self, torques: list) -> Q_:
@@ -215,7 +215,7 @@ class Torque:
         if abs(torque_net.magnitude) < 1e-10:
             logger.info("Sistema en equilibrio rotacional")
         else:
-            logger.info(f"Torque neto: {torque_net}")
+            logger.info("Torque neto: %s", torque_net)
         
         return torque_net
     
@@ -235,7 +235,7 @@ class Torque:
         """
         potencia = torque * velocidad_angular
         
-        logger.info(f"Potencia rotacional: {potencia}")
+        logger.info("Potencia rotacional: %s", potencia)
         return potencia
     
     def torque_centro_masa(self, fuerza: Q_, posicion_cm: np.ndarray, posicion_fuerza: np.ndarray) -> Q_:
@@ -257,8 +257,5 @@ class Torque:
         # Torque = r × F
         torque_cm = np.cross(r_cm.magnitude, F_vec.magnitude) * ureg.newton * ureg.meter
         
-        logger.info(f"Torque respecto a CM: {torque_cm}")
-        return torque_cmde, F_vec.magnitude) * ureg.newton * ureg.meter
-        
-        logger.info(f"Torque respecto a CM: {torque_cm}")
+        logger.info("Torque respecto a CM: %s", torque_cm)
         return torque_cm
\ No newline at end of file
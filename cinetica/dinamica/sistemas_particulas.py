@@ -6,10 +6,92 @@ incluyendo cálculo de centro de masa, momento de inercia, teorema de los ejes
 paralelos (Steiner) y energía cinética rotacional.
 """
 
+import os
 from typing import List, Union, Tuple, Optional
 import numpy as np
+from numba import njit, prange, get_num_threads, set_num_threads
 from ..units import ureg, Q_
 
+# Respetar OMP_NUM_THREADS para los núcleos paralelos sin exceder el
+# máximo de hilos que numba lanzó al importar.
+_num_hilos = os.environ.get("OMP_NUM_THREADS")
+if _num_hilos:
+    set_num_threads(min(int(_num_hilos), get_num_threads()))
+
+# Por debajo de este tamaño, arrancar el pool de hilos de numba cuesta más
+# que el propio recorrido; se usa el núcleo serial.
+_UMBRAL_PARALELO = 4096
+
+
+@njit(cache=True, fastmath=True)
+def _centro_masa_kernel(masas, posiciones):
+    """Núcleo JIT de (Σ mᵢ·rᵢ, Σ mᵢ) sobre arrays contiguos sin unidades."""
+    n, dim = posiciones.shape
+    acumulado = np.zeros(dim)
+    masa_total = 0.0
+    for i in range(n):
+        m = masas[i]
+        masa_total += m
+        for j in range(dim):
+            acumulado[j] += m * posiciones[i, j]
+    return acumulado, masa_total
+
+
+@njit(cache=True, fastmath=True)
+def _inercia_origen_kernel(masas, posiciones):
+    """Núcleo JIT de Σ mᵢ·|rᵢ|² sobre arrays contiguos sin unidades."""
+    total = 0.0
+    for i in range(masas.shape[0]):
+        r_cuad = 0.0
+        for j in range(posiciones.shape[1]):
+            r_cuad += posiciones[i, j] * posiciones[i, j]
+        total += masas[i] * r_cuad
+    return total
+
+
+@njit(cache=True, fastmath=True)
+def _inercia_eje_kernel(masas, posiciones, eje):
+    """Núcleo JIT de Σ mᵢ·d⊥ᵢ² respecto a un eje unitario.
+
+    Usa la identidad |r × e|² = |r|² - (r·e)² (válida con e unitario) para
+    evitar construir el producto cruz intermedio por partícula.
+    """
+    total = 0.0
+    for i in range(masas.shape[0]):
+        r_cuad = 0.0
+        r_punto_e = 0.0
+        for j in range(posiciones.shape[1]):
+            r_cuad += posiciones[i, j] * posiciones[i, j]
+            r_punto_e += posiciones[i, j] * eje[j]
+        total += masas[i] * (r_cuad - r_punto_e * r_punto_e)
+    return total
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _inercia_origen_kernel_paralelo(masas, posiciones):
+    """Variante paralela de :func:`_inercia_origen_kernel` para N grandes."""
+    total = 0.0
+    for i in prange(masas.shape[0]):
+        r_cuad = 0.0
+        for j in range(posiciones.shape[1]):
+            r_cuad += posiciones[i, j] * posiciones[i, j]
+        total += masas[i] * r_cuad
+    return total
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _inercia_eje_kernel_paralelo(masas, posiciones, eje):
+    """Variante paralela de :func:`_inercia_eje_kernel` para N grandes."""
+    total = 0.0
+    for i in prange(masas.shape[0]):
+        r_cuad = 0.0
+        r_punto_e = 0.0
+        for j in range(posiciones.shape[1]):
+            r_cuad += posiciones[i, j] * posiciones[i, j]
+            r_punto_e += posiciones[i, j] * eje[j]
+        total += masas[i] * (r_cuad - r_punto_e * r_punto_e)
+    return total
+
 
 class SistemasParticulas:
     """
@@ -29,6 +111,9 @@ class SistemasParticulas:
     >>> cm = sp.centro_masa(masas, posiciones)
     """
     
+    # Sin estado de instancia: permite compartir una única instancia.
+    __slots__ = ()
+
     def __init__(self):
         """Inicializa la clase SistemasParticulas."""
         pass
@@ -74,10 +159,11 @@ class SistemasParticulas:
             if not hasattr(posiciones[0], 'units'):
                 posiciones = [Q_(p, unidades.get('longitud', '')) for p in posiciones]
         else:
-            # Convertir a arrays de numpy si no hay unidades
-            masas = np.asarray(masas, dtype=float)
-            posiciones = np.asarray(posiciones, dtype=float)
-        
+            # Sin unidades: una sola conversión AoS -> arrays contiguos y el
+            # bucle caliente corre en el núcleo compilado.
+            masas = np.ascontiguousarray(masas, dtype=np.float64)
+            posiciones = np.ascontiguousarray(posiciones, dtype=np.float64)
+
         # Calcular centro de masa: sum(m_i * r_i) / sum(m_i)
         if has_units:
             masa_total = sum(masas)
@@ -92,12 +178,12 @@ class SistemasParticulas:
             cm = np.array([v.magnitude for v in cm])
         else:
             # Versión sin unidades
-            masa_total = np.sum(masas)
+            numerador, masa_total = _centro_masa_kernel(masas, posiciones)
             if masa_total == 0:
                 raise ValueError("La suma de las masas no puede ser cero.")
-                
-            cm = np.sum(masas[:, np.newaxis] * posiciones, axis=0) / masa_total
-        
+
+            cm = numerador / masa_total
+
         return cm
     
     def momento_inercia_particula(
@@ -184,13 +270,35 @@ class SistemasParticulas:
         """
         if len(masas) != len(posiciones):
             raise ValueError("Las listas de masas y posiciones deben tener la misma longitud.")
-        
-        I_total = 0.0
-        
-        for masa, posicion in zip(masas, posiciones):
-            I_total += self.momento_inercia_particula(masa, posicion, eje, unidades)
-        
-        return I_total
+
+        if unidades:
+            # Con unidades se conserva el bucle por partícula: pint no es
+            # compatible con los núcleos compilados.
+            I_total = 0.0
+            for masa, posicion in zip(masas, posiciones):
+                I_total += self.momento_inercia_particula(masa, posicion, eje, unidades)
+            return I_total
+
+        # Sin unidades: una sola conversión a arrays contiguos y el sistema
+        # completo se reduce en el núcleo compilado en vez de pagar una
+        # llamada Python por partícula.
+        masas = np.ascontiguousarray(masas, dtype=np.float64)
+        posiciones = np.ascontiguousarray(posiciones, dtype=np.float64)
+
+        # La suma por partícula es trivialmente paralela; a partir del
+        # umbral el reparto entre hilos amortiza el arranque del pool.
+        paralelo = masas.shape[0] > _UMBRAL_PARALELO
+
+        if eje is None:
+            if paralelo:
+                return _inercia_origen_kernel_paralelo(masas, posiciones)
+            return _inercia_origen_kernel(masas, posiciones)
+
+        eje = np.ascontiguousarray(eje, dtype=np.float64)
+        eje = eje / np.linalg.norm(eje)
+        if paralelo:
+            return _inercia_eje_kernel_paralelo(masas, posiciones, eje)
+        return _inercia_eje_kernel(masas, posiciones, eje)
     
     def teorema_steiner(
         self,
@@ -9,8 +9,63 @@ mecánicos.
 import math
 from typing import Union, List, Optional, Tuple
 import numpy as np
+from numba import njit
 from ..units import ureg, Q_
 
+# Unidades resueltas una sola vez: cada acceso ureg.<unidad> recorre el
+# registro de pint, un costo evitable en los métodos calientes.
+_U_N = ureg.newton
+_U_M = ureg.meter
+_U_RAD = ureg.radian
+_U_J = ureg.joule
+_U_W = ureg.watt
+_U_KG = ureg.kilogram
+_U_S = ureg.second
+_U_M_S = ureg.meter / ureg.second
+_U_M_S2 = ureg.meter / ureg.second**2
+_U_N_M = ureg.newton / ureg.meter
+
+
+def _magnitud(valor, unidad):
+    """Devuelve la magnitud de ``valor`` expresada en ``unidad``.
+
+    Acepta escalares, arrays y Quantities; los valores sin unidades se
+    asumen ya expresados en ``unidad``. Extraer las magnitudes una sola
+    vez deja el cálculo en ndarrays puros y permite entradas en lote.
+    """
+    if isinstance(valor, Q_):
+        return valor.to(unidad).magnitude
+    if np.ndim(valor) == 0:
+        return valor
+    return np.asarray(valor, dtype=np.float64)
+
+
+def _coerce(magnitud):
+    """Normaliza una magnitud a float o ndarray float64 para los núcleos JIT."""
+    if isinstance(magnitud, np.ndarray):
+        return np.asarray(magnitud, dtype=np.float64)
+    return float(magnitud)
+
+
+@njit(cache=True, fastmath=True)
+def _energia_cinetica_kernel(masa, velocidad):
+    """Núcleo JIT de Ec = ½·m·v² sobre magnitudes sin unidades."""
+    return 0.5 * masa * velocidad * velocidad
+
+
+@njit(cache=True, fastmath=True)
+def _potencial_elastica_kernel(constante, deformacion):
+    """Núcleo JIT de Ep = ½·k·x² sobre magnitudes sin unidades."""
+    return 0.5 * constante * deformacion * deformacion
+
+
+@njit(cache=True, fastmath=True)
+def _teorema_trabajo_kernel(masa, velocidad_inicial, velocidad_final):
+    """Núcleo JIT de W = ½·m·(v_f² - v_i²) sobre magnitudes sin unidades."""
+    return 0.5 * masa * (
+        velocidad_final * velocidad_final - velocidad_inicial * velocidad_inicial
+    )
+
 
 class TrabajoEnergia:
     """
@@ -26,8 +81,17 @@ class TrabajoEnergia:
     >>> trabajo = te.trabajo_fuerza_constante(fuerza=50, desplazamiento=10)
     >>> print(f"Trabajo: {trabajo}")
     Trabajo: 500.0 joule
+
+    Notes
+    -----
+    Todos los métodos aceptan ``return_magnitude=True`` para devolver la
+    magnitud numérica (float o ndarray) sin envolver en Quantity, útil
+    cuando el resultado alimenta directamente otro cálculo numérico.
     """
 
+    # Sin estado de instancia: permite compartir una única instancia.
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Inicializa una instancia de TrabajoEnergia."""
         pass
@@ -36,18 +100,19 @@ class TrabajoEnergia:
         self,
         fuerza: Union[float, Q_],
         desplazamiento: Union[float, Q_],
-        angulo: Union[float, Q_] = 0
+        angulo: Union[float, Q_] = 0,
+        return_magnitude: bool = False
     ) -> Q_:
         """
         Calcula el trabajo realizado por una fuerza constante.
 
         Parameters
         ----------
-        fuerza : float or pint.Quantity
+        fuerza : float, numpy.ndarray or pint.Quantity
             Magnitud de la fuerza en N.
-        desplazamiento : float or pint.Quantity
+        desplazamiento : float, numpy.ndarray or pint.Quantity
             Magnitud del desplazamiento en m.
-        angulo : float or pint.Quantity, optional
+        angulo : float, numpy.ndarray or pint.Quantity, optional
             Ángulo entre la fuerza y el desplazamiento en radianes. Default 0.
 
         Returns
@@ -72,27 +137,25 @@ class TrabajoEnergia:
         El trabajo se calcula como: W = F · d = F * d * cos(θ)
         donde θ es el ángulo entre la fuerza y el desplazamiento.
         """
-        if not isinstance(fuerza, Q_):
-            fuerza = Q_(fuerza, ureg.newton)
-        if not isinstance(desplazamiento, Q_):
-            desplazamiento = Q_(desplazamiento, ureg.meter)
-        if not isinstance(angulo, Q_):
-            angulo = Q_(angulo, ureg.radian)
-
-        if fuerza.magnitude < 0:
+        fuerza_m = _magnitud(fuerza, _U_N)
+        desplazamiento_m = _magnitud(desplazamiento, _U_M)
+        angulo_rad = _magnitud(angulo, _U_RAD)
+
+        if np.any(np.asarray(fuerza_m) < 0):
             raise ValueError("La magnitud de la fuerza debe ser no negativa")
-        if desplazamiento.magnitude < 0:
+        if np.any(np.asarray(desplazamiento_m) < 0):
             raise ValueError("La magnitud del desplazamiento debe ser no negativa")
 
-        angulo_rad = angulo.to(ureg.radian).magnitude
-        trabajo = fuerza * desplazamiento * math.cos(angulo_rad)
-
-        return trabajo.to(ureg.joule)
+        trabajo = np.multiply(fuerza_m, desplazamiento_m) * np.cos(angulo_rad)
+        if return_magnitude:
+            return trabajo
+        return Q_(trabajo, _U_J)
 
     def trabajo_vectorial(
         self,
         fuerza: Union[List[float], np.ndarray, Q_],
-        desplazamiento: Union[List[float], np.ndarray, Q_]
+        desplazamiento: Union[List[float], np.ndarray, Q_],
+        return_magnitude: bool = False
     ) -> Q_:
         """
         Calcula el trabajo usando el producto punto de vectores.
@@ -117,27 +180,39 @@ class TrabajoEnergia:
         >>> W = te.trabajo_vectorial(fuerza=F, desplazamiento=d)
         >>> print(f"Trabajo vectorial: {W}")
         """
-        if not isinstance(fuerza, Q_):
-            fuerza = Q_(np.array(fuerza), ureg.newton)
-        if not isinstance(desplazamiento, Q_):
-            desplazamiento = Q_(np.array(desplazamiento), ureg.meter)
+        fuerza_m = np.asarray(_magnitud(fuerza, _U_N), dtype=np.float64)
+        desplazamiento_m = np.asarray(
+            _magnitud(desplazamiento, _U_M), dtype=np.float64
+        )
 
         # Verificar que ambos vectores tengan la misma dimensión
-        if len(fuerza.magnitude) != len(desplazamiento.magnitude):
-            raise ValueError("Los vectores fuerza y desplazamiento deben tener la misma dimensión")
-
-        trabajo = np.dot(fuerza.magnitude, desplazamiento.magnitude)
-        return Q_(trabajo, ureg.joule)
-
-    def energia_cinetica(self, masa: Union[float, Q_], velocidad: Union[float, Q_]) -> Q_:
+        try:
+            np.broadcast_shapes(fuerza_m.shape, desplazamiento_m.shape)
+        except ValueError as exc:
+            raise ValueError(
+                "Los vectores fuerza y desplazamiento deben tener la misma dimensión"
+            ) from exc
+
+        # El producto punto sobre el último eje acepta lotes (N, 3) por difusión.
+        trabajo = np.einsum('...i,...i->...', fuerza_m, desplazamiento_m)
+        if return_magnitude:
+            return trabajo
+        return Q_(trabajo, _U_J)
+
+    def energia_cinetica(
+        self,
+        masa: Union[float, Q_],
+        velocidad: Union[float, Q_],
+        return_magnitude: bool = False
+    ) -> Q_:
         """
         Calcula la energía cinética de un objeto.
 
         Parameters
         ----------
-        masa : float or pint.Quantity
+        masa : float, numpy.ndarray or pint.Quantity
             Masa del objeto en kg.
-        velocidad : float or pint.Quantity
+        velocidad : float, numpy.ndarray or pint.Quantity
             Velocidad del objeto en m/s.
 
         Returns
@@ -156,35 +231,36 @@ class TrabajoEnergia:
         -----
         La energía cinética se calcula como: Ec = (1/2) * m * v²
         """
-        if not isinstance(masa, Q_):
-            masa = Q_(masa, ureg.kilogram)
-        if not isinstance(velocidad, Q_):
-            velocidad = Q_(velocidad, ureg.meter / ureg.second)
+        masa_m = _magnitud(masa, _U_KG)
+        velocidad_m = _magnitud(velocidad, _U_M_S)
 
-        if masa.magnitude <= 0:
+        if np.any(np.asarray(masa_m) <= 0):
             raise ValueError("La masa debe ser positiva")
-        if velocidad.magnitude < 0:
+        if np.any(np.asarray(velocidad_m) < 0):
             raise ValueError("La velocidad debe ser no negativa")
 
-        energia = 0.5 * masa * velocidad**2
-        return energia.to(ureg.joule)
+        energia = _energia_cinetica_kernel(_coerce(masa_m), _coerce(velocidad_m))
+        if return_magnitude:
+            return energia
+        return Q_(energia, _U_J)
 
     def energia_potencial_gravitacional(
         self,
         masa: Union[float, Q_],
         altura: Union[float, Q_],
-        gravedad: Union[float, Q_] = 9.81
+        gravedad: Union[float, Q_] = 9.81,
+        return_magnitude: bool = False
     ) -> Q_:
         """
         Calcula la energía potencial gravitacional.
 
         Parameters
         ----------
-        masa : float or pint.Quantity
+        masa : float, numpy.ndarray or pint.Quantity
             Masa del objeto en kg.
-        altura : float or pint.Quantity
+        altura : float, numpy.ndarray or pint.Quantity
             Altura sobre el nivel de referencia en m.
-        gravedad : float or pint.Quantity, optional
+        gravedad : float, numpy.ndarray or pint.Quantity, optional
             Aceleración gravitacional en m/s². Default 9.81.
 
         Returns
@@ -203,32 +279,32 @@ class TrabajoEnergia:
         -----
         La energía potencial gravitacional: Ep = m * g * h
         """
-        if not isinstance(masa, Q_):
-            masa = Q_(masa, ureg.kilogram)
-        if not isinstance(altura, Q_):
-            altura = Q_(altura, ureg.meter)
-        if not isinstance(gravedad, Q_):
-            gravedad = Q_(gravedad, ureg.meter / ureg.second**2)
-
-        if masa.magnitude <= 0:
+        masa_m = _magnitud(masa, _U_KG)
+        altura_m = _magnitud(altura, _U_M)
+        gravedad_m = _magnitud(gravedad, _U_M_S2)
+
+        if np.any(np.asarray(masa_m) <= 0):
             raise ValueError("La masa debe ser positiva")
 
-        energia = masa * gravedad * altura
-        return energia.to(ureg.joule)
+        energia = masa_m * gravedad_m * altura_m
+        if return_magnitude:
+            return energia
+        return Q_(energia, _U_J)
 
     def energia_potencial_elastica(
         self,
         constante: Union[float, Q_],
-        deformacion: Union[float, Q_]
+        deformacion: Union[float, Q_],
+        return_magnitude: bool = False
     ) -> Q_:
         """
         Calcula la energía potencial elástica de un resorte.
 
         Parameters
         ----------
-        constante : float or pint.Quantity
+        constante : float, numpy.ndarray or pint.Quantity
             Constante elástica del resorte en N/m.
-        deformacion : float or pint.Quantity
+        deformacion : float, numpy.ndarray or pint.Quantity
             Deformación del resorte en m.
 
         Returns
@@ -247,31 +323,36 @@ class TrabajoEnergia:
         -----
         La energía potencial elástica: Ep = (1/2) * k * x²
         """
-        if not isinstance(constante, Q_):
-            constante = Q_(constante, ureg.newton / ureg.meter)
-        if not isinstance(deformacion, Q_):
-            deformacion = Q_(deformacion, ureg.meter)
+        constante_m = _magnitud(constante, _U_N_M)
+        deformacion_m = _magnitud(deformacion, _U_M)
 
-        if constante.magnitude < 0:
+        if np.any(np.asarray(constante_m) < 0):
             raise ValueError("La constante elástica debe ser no negativa")
 
-        energia = 0.5 * constante * deformacion**2
-        return energia.to(ureg.joule)
+        energia = _potencial_elastica_kernel(_coerce(constante_m), _coerce(deformacion_m))
+        if return_magnitude:
+            return energia
+        return Q_(energia, _U_J)
 
     def energia_mecanica_total(
         self,
         energia_cinetica: Union[float, Q_],
-        energia_potencial: Union[float, Q_]
+        energia_potencial: Union[float, Q_],
+        *componentes: Union[float, Q_],
+        return_magnitude: bool = False
     ) -> Q_:
         """
         Calcula la energía mecánica total del sistema.
 
         Parameters
         ----------
-        energia_cinetica : float or pint.Quantity
+        energia_cinetica : float, numpy.ndarray or pint.Quantity
             Energía cinética en J.
-        energia_potencial : float or pint.Quantity
+        energia_potencial : float, numpy.ndarray or pint.Quantity
             Energía potencial en J.
+        *componentes : float, numpy.ndarray or pint.Quantity
+            Componentes de energía adicionales en J (p. ej. varias energías
+            potenciales), sumadas en la misma reducción.
 
         Returns
         -------
@@ -290,29 +371,34 @@ class TrabajoEnergia:
         La energía mecánica total: Em = Ec + Ep
         En sistemas conservativos, la energía mecánica se conserva.
         """
-        if not isinstance(energia_cinetica, Q_):
-            energia_cinetica = Q_(energia_cinetica, ureg.joule)
-        if not isinstance(energia_potencial, Q_):
-            energia_potencial = Q_(energia_potencial, ureg.joule)
-
-        return energia_cinetica + energia_potencial
+        # Reducción sobre magnitudes: sumar Quantities encadena una
+        # asignación por componente; aquí se envuelve una sola vez.
+        magnitudes = [
+            _magnitud(energia, _U_J)
+            for energia in (energia_cinetica, energia_potencial, *componentes)
+        ]
+        total = np.add.reduce(magnitudes)
+        if return_magnitude:
+            return total
+        return Q_(total, _U_J)
 
     def teorema_trabajo_energia(
         self,
         masa: Union[float, Q_],
         velocidad_inicial: Union[float, Q_],
-        velocidad_final: Union[float, Q_]
+        velocidad_final: Union[float, Q_],
+        return_magnitude: bool = False
     ) -> Q_:
         """
         Aplica el teorema trabajo-energía para calcular el trabajo neto.
 
         Parameters
         ----------
-        masa : float or pint.Quantity
+        masa : float, numpy.ndarray or pint.Quantity
             Masa del objeto en kg.
-        velocidad_inicial : float or pint.Quantity
+        velocidad_inicial : float, numpy.ndarray or pint.Quantity
             Velocidad inicial en m/s.
-        velocidad_final : float or pint.Quantity
+        velocidad_final : float, numpy.ndarray or pint.Quantity
             Velocidad final en m/s.
 
         Returns
@@ -332,34 +418,34 @@ class TrabajoEnergia:
         -----
         El teorema trabajo-energía: W_neto = ΔEc = Ec_final - Ec_inicial
         """
-        if not isinstance(masa, Q_):
-            masa = Q_(masa, ureg.kilogram)
-        if not isinstance(velocidad_inicial, Q_):
-            velocidad_inicial = Q_(velocidad_inicial, ureg.meter / ureg.second)
-        if not isinstance(velocidad_final, Q_):
-            velocidad_final = Q_(velocidad_final, ureg.meter / ureg.second)
-
-        if masa.magnitude <= 0:
-            raise ValueError("La masa debe ser positiva")
+        masa_m = _magnitud(masa, _U_KG)
+        vi_m = _magnitud(velocidad_inicial, _U_M_S)
+        vf_m = _magnitud(velocidad_final, _U_M_S)
 
-        Ec_inicial = self.energia_cinetica(masa, velocidad_inicial)
-        Ec_final = self.energia_cinetica(masa, velocidad_final)
+        if np.any(np.asarray(masa_m) <= 0):
+            raise ValueError("La masa debe ser positiva")
+        if np.any(np.asarray(vi_m) < 0) or np.any(np.asarray(vf_m) < 0):
+            raise ValueError("La velocidad debe ser no negativa")
 
-        return Ec_final - Ec_inicial
+        trabajo = _teorema_trabajo_kernel(_coerce(masa_m), _coerce(vi_m), _coerce(vf_m))
+        if return_magnitude:
+            return trabajo
+        return Q_(trabajo, _U_J)
 
     def potencia(
         self,
         trabajo: Union[float, Q_],
-        tiempo: Union[float, Q_]
+        tiempo: Union[float, Q_],
+        return_magnitude: bool = False
     ) -> Q_:
         """
         Calcula la potencia como trabajo por unidad de tiempo.
 
         Parameters
         ----------
-        trabajo : float or pint.Quantity
+        trabajo : float, numpy.ndarray or pint.Quantity
             Trabajo realizado en J.
-        tiempo : float or pint.Quantity
+        tiempo : float, numpy.ndarray or pint.Quantity
             Tiempo transcurrido en s.
 
         Returns
@@ -379,30 +465,31 @@ class TrabajoEnergia:
         La potencia se define como: P = W / t
         También puede expresarse como: P = F · v (fuerza por velocidad)
         """
-        if not isinstance(trabajo, Q_):
-            trabajo = Q_(trabajo, ureg.joule)
-        if not isinstance(tiempo, Q_):
-            tiempo = Q_(tiempo, ureg.second)
+        trabajo_m = _magnitud(trabajo, _U_J)
+        tiempo_m = _magnitud(tiempo, _U_S)
 
-        if tiempo.magnitude <= 0:
+        if np.any(np.asarray(tiempo_m) <= 0):
             raise ValueError("El tiempo debe ser positivo")
 
-        potencia = trabajo / tiempo
-        return potencia.to(ureg.watt)
+        potencia = np.divide(trabajo_m, tiempo_m)
+        if return_magnitude:
+            return potencia
+        return Q_(potencia, _U_W)
 
     def potencia_instantanea(
         self,
         fuerza: Union[float, Q_],
-        velocidad: Union[float, Q_]
+        velocidad: Union[float, Q_],
+        return_magnitude: bool = False
     ) -> Q_:
         """
         Calcula la potencia instantánea.
 
         Parameters
         ----------
-        fuerza : float or pint.Quantity
+        fuerza : float, numpy.ndarray or pint.Quantity
             Fuerza aplicada en N.
-        velocidad : float or pint.Quantity
+        velocidad : float, numpy.ndarray or pint.Quantity
             Velocidad instantánea en m/s.
 
         Returns
@@ -421,10 +508,10 @@ class TrabajoEnergia:
         -----
         La potencia instantánea: P = F · v
         """
-        if not isinstance(fuerza, Q_):
-            fuerza = Q_(fuerza, ureg.newton)
-        if not isinstance(velocidad, Q_):
-            velocidad = Q_(velocidad, ureg.meter / ureg.second)
+        fuerza_m = _magnitud(fuerza, _U_N)
+        velocidad_m = _magnitud(velocidad, _U_M_S)
 
-        potencia = fuerza * velocidad
-        return potencia.to(ureg.watt)
+        potencia = np.multiply(fuerza_m, velocidad_m)
+        if return_magnitude:
+            return potencia
+        return Q_(potencia, _U_W)
@@ -1,11 +1,95 @@
+import os
 from typing import TYPE_CHECKING
 from pint import UnitRegistry, Quantity
 
 ureg: UnitRegistry = UnitRegistry()
 
+
+class _FastQ:
+    """Sustituto ligero de ``Quantity`` para la vía rápida sin pint.
+
+    Se exporta como ``Q_`` cuando la variable de entorno
+    ``CINETICA_NO_UNITS=1`` está definida al importar el paquete. Mantiene la
+    interfaz que los llamadores consultan (``magnitude``, ``units``,
+    ``dimensionality``, ``to``) y la aritmética básica operando directamente
+    sobre magnitudes, con el álgebra de unidades delegada a los objetos
+    ``Unit`` de pint pero sin validación dimensional por operación: quien
+    activa la vía rápida renuncia a esa comprobación a cambio de evitar el
+    despacho de pint en cada operación.
+    """
+
+    __slots__ = ("magnitude", "units")
+
+    def __init__(self, magnitude, units=None):
+        if units is None:
+            units = ureg.dimensionless
+        elif isinstance(units, str):
+            units = ureg.parse_units(units)
+        elif isinstance(units, _FastQ):
+            units = units.units
+        self.magnitude = magnitude
+        self.units = units
+
+    @property
+    def dimensionality(self):
+        return self.units.dimensionality
+
+    def to(self, otras_unidades):
+        if isinstance(otras_unidades, str):
+            otras_unidades = ureg.parse_units(otras_unidades)
+        return _FastQ(
+            ureg.convert(self.magnitude, self.units, otras_unidades), otras_unidades
+        )
+
+    def to_base_units(self):
+        como_quantity = ureg.Quantity(self.magnitude, self.units).to_base_units()
+        return _FastQ(como_quantity.magnitude, como_quantity.units)
+
+    def __repr__(self) -> str:
+        return f"<_FastQ({self.magnitude}, '{self.units}')>"
+
+    # Aritmética sobre magnitudes; las unidades se combinan sin validar.
+    def __add__(self, otro):
+        if isinstance(otro, _FastQ):
+            return _FastQ(self.magnitude + otro.to(self.units).magnitude, self.units)
+        return _FastQ(self.magnitude + otro, self.units)
+
+    __radd__ = __add__
+
+    def __sub__(self, otro):
+        if isinstance(otro, _FastQ):
+            return _FastQ(self.magnitude - otro.to(self.units).magnitude, self.units)
+        return _FastQ(self.magnitude - otro, self.units)
+
+    def __mul__(self, otro):
+        if isinstance(otro, _FastQ):
+            return _FastQ(self.magnitude * otro.magnitude, self.units * otro.units)
+        return _FastQ(self.magnitude * otro, self.units)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, otro):
+        if isinstance(otro, _FastQ):
+            return _FastQ(self.magnitude / otro.magnitude, self.units / otro.units)
+        return _FastQ(self.magnitude / otro, self.units)
+
+    def __pow__(self, exponente):
+        return _FastQ(self.magnitude**exponente, self.units**exponente)
+
+    def __neg__(self):
+        return _FastQ(-self.magnitude, self.units)
+
+    def __abs__(self):
+        return _FastQ(abs(self.magnitude), self.units)
+
+
+# La vía rápida se decide una sola vez al importar: consultar un flag en cada
+# operación pagaría una comparación extra justo en los caminos a abaratar.
+_UNITS_ENABLED = os.environ.get("CINETICA_NO_UNITS") != "1"
+
 if TYPE_CHECKING:
     from typing import TypeAlias
 
     Q_: TypeAlias = Quantity
 else:
-    Q_ = ureg.Quantity
+    Q_ = ureg.Quantity if _UNITS_ENABLED else _FastQ
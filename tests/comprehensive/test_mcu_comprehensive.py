@@ -4,6 +4,10 @@ import math
 from cinetica.cinematica.circular import MovimientoCircularUniforme
 from cinetica.units import ureg, Q_
 
+# Dimensionalidades cacheadas una vez: cada acceso a .dimensionality
+# recorre el contenedor de unidades de pint.
+_HERTZ_DIM = ureg.hertz.dimensionality
+
 
 class TestMCUVectorMethods:
     """Comprehensive tests for MCU vector methods."""
@@ -150,7 +154,7 @@ class TestMCUHelperMethods:
         frecuencia = mcu.frecuencia()
         expected = omega / (2 * math.pi)  # f = ω/(2π)
         assert abs(frecuencia.magnitude - expected.magnitude) < 1e-10
-        assert frecuencia.units.dimensionality == ureg.hertz.dimensionality
+        assert frecuencia.units.dimensionality == _HERTZ_DIM
 
     def test_frecuencia_omega_cero(self):
         """Test frequency calculation with zero angular velocity."""
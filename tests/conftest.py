@@ -0,0 +1,56 @@
+"""Configuración compartida de pytest para la suite de Cinetica."""
+
+import numpy as np
+import pytest
+
+from cinetica.units import ureg
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup():
+    """Calienta las cachés de Numba y pint antes de la primera prueba.
+
+    La compilación JIT de los núcleos de choques y el primer recorrido de la
+    maquinaria de conversión de pint se pagan aquí una sola vez, en lugar de
+    inflar el tiempo del primer test que los use.
+    """
+    from cinetica.cinematica.relativo.velocidad_relativa import (
+        _abs_mag_dir2,
+        _resta2,
+        _resta3,
+        _suma2,
+        _suma3,
+    )
+    from cinetica.dinamica.choques import _colision_1d, _colision_nd
+
+    _v2 = np.zeros(2)
+    _v3 = np.zeros(3)
+    _abs_mag_dir2(_v2, _v2)
+    _suma2(_v2, _v2)
+    _suma3(_v3, _v3)
+    _resta2(_v2, _v2)
+    _resta3(_v3, _v3)
+    _colision_1d(1.0, 1.0, 1.0, 1.0, 1.0)
+    _colision_nd(
+        1.0,
+        np.array([1.0, 0.0, 0.0]),
+        1.0,
+        np.array([-1.0, 0.0, 0.0]),
+        np.array([1.0, 0.0, 0.0]),
+        1.0,
+    )
+    (1 * ureg.meter).to(ureg.kilometer)
+    (1 * ureg.meter / ureg.second).to(ureg.kilometer / ureg.hour)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--all-combinations",
+        action="store_true",
+        default=False,
+        help=(
+            "Ejecuta la matriz completa de combinaciones de unidades en los "
+            "tests de conversión (por defecto se usa un conjunto reducido de "
+            "cobertura, una fila por unidad no-SI)."
+        ),
+    )
@@ -7,6 +7,11 @@ from hypothesis import given, strategies as st, assume, settings
 from cinetica.cinematica.circular import MovimientoCircularUniforme
 from cinetica.units import ureg
 
+# Dimensionalidades cacheadas una vez: cada acceso a .dimensionality
+# recorre el contenedor de unidades de pint.
+_METER_DIM = ureg.meter.dimensionality
+_RADIAN_DIM = ureg.radian.dimensionality
+
 
 class TestMCUProperties:
     """Property-based tests for MCU physics laws and invariants."""
@@ -231,7 +236,7 @@ class TestMCUProperties:
 
         # Check units of position (should be meters)
         posicion_cartesiana = mcu.posicion(tiempo * ureg.second)
-        assert posicion_cartesiana.dimensionality == ureg.meter.dimensionality
+        assert posicion_cartesiana.dimensionality == _METER_DIM
 
         # Check units of velocity tangential (should be m/s)
         velocidad_tangencial = mcu.velocidad_tangencial(tiempo * ureg.second)
@@ -239,7 +244,7 @@ class TestMCUProperties:
 
         # Check units of angular position (should be radians)
         pos_angular = mcu.posicion_angular(tiempo * ureg.second)
-        assert pos_angular.dimensionality == ureg.radian.dimensionality
+        assert pos_angular.dimensionality == _RADIAN_DIM
 
         # Check units of angular velocity (should be rad/s)
         vel_angular = mcu.velocidad_angular(tiempo * ureg.second)
@@ -175,3 +175,49 @@ def test_mcuv_aceleracion_total():
     # ac(2s) = 8.0
     # a_total = sqrt(1^2 + 8^2) = sqrt(1 + 64) = sqrt(65) approx 8.062
     assert mc.aceleracion_total(tiempo=2.0).magnitude == pytest.approx(math.sqrt(65))
+
+
+def test_mcuv_tiempo_por_posicion_angular():
+    mc = MovimientoCircularUniformementeVariado(
+        radio=2.0, velocidad_angular_inicial=1.0, aceleracion_angular_inicial=0.5
+    )
+    # theta(2s) = 0 + 1*2 + 0.25*4 = 3.0 rad
+    t1, t2 = mc.tiempo_por_posicion_angular(3.0)
+    # Ambas raíces (incluida la negativa, matemáticamente válida) deben
+    # satisfacer θ₀ + ω₀·t + ½·α·t² = 3.0 evaluada sobre la raíz con signo.
+    for t in (t1.magnitude, t2.magnitude):
+        assert 1.0 * t + 0.25 * t * t == pytest.approx(3.0)
+    assert t2.magnitude == pytest.approx(2.0)
+    assert t1.magnitude <= t2.magnitude
+
+
+def test_mcuv_tiempo_por_posicion_angular_lineal():
+    mc = MovimientoCircularUniformementeVariado(
+        radio=2.0, velocidad_angular_inicial=2.0
+    )
+    t1, t2 = mc.tiempo_por_posicion_angular(6.0)
+    assert t1.magnitude == pytest.approx(3.0)
+    assert t2.magnitude == pytest.approx(3.0)
+
+
+def test_mcuv_tiempo_por_posicion_angular_estable():
+    # b grande frente a 4ac: la forma clásica perdería dígitos en la raíz
+    # pequeña; la forma con copysign la conserva (t2 = c/q).
+    mc = MovimientoCircularUniformementeVariado(
+        radio=2.0, velocidad_angular_inicial=1.0e8, aceleracion_angular_inicial=2.0
+    )
+    t1, t2 = mc.tiempo_por_posicion_angular(1.0)
+    raiz_pequena = max(t1.magnitude, t2.magnitude)
+    assert raiz_pequena == pytest.approx(1.0e-8, rel=1e-12)
+
+
+def test_mcuv_tiempo_por_posicion_angular_invalido():
+    mc = MovimientoCircularUniformementeVariado(
+        radio=2.0, velocidad_angular_inicial=0.0, aceleracion_angular_inicial=0.5
+    )
+    with pytest.raises(ValueError):
+        mc.tiempo_por_posicion_angular(-1.0)
+
+    degenerado = MovimientoCircularUniformementeVariado(radio=2.0)
+    with pytest.raises(ValueError):
+        degenerado.tiempo_por_posicion_angular(1.0)
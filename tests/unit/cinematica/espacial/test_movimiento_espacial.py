@@ -116,6 +116,32 @@ def test_movimiento_espacial_magnitud_velocidad():
     assert me2.magnitud_velocidad(tiempo=1).magnitude == 5.0
 
 
+def test_movimiento_espacial_batch():
+    """
+    Testea que los métodos posicion_batch y velocidad_batch coinciden con
+    las evaluaciones escalares y rechazan tiempos negativos.
+    """
+    me = MovimientoEspacial(
+        posicion_inicial=np.array([0, 0, 10]),
+        velocidad_inicial=np.array([5, 2, 0]),
+        aceleracion_constante=np.array([0, 0, -9.81]),
+    )
+    tiempos = np.array([0.0, 0.5, 1.0, 2.0])
+
+    posiciones = me.posicion_batch(tiempos).magnitude
+    velocidades = me.velocidad_batch(tiempos).magnitude
+    assert posiciones.shape == (4, 3)
+    assert velocidades.shape == (4, 3)
+    for i, t in enumerate(tiempos):
+        assert np.allclose(posiciones[i], me.posicion(tiempo=t).magnitude)
+        assert np.allclose(velocidades[i], me.velocidad(tiempo=t).magnitude)
+
+    with pytest.raises(ValueError):
+        me.posicion_batch(np.array([0.0, -1.0]))
+    with pytest.raises(ValueError):
+        me.velocidad_batch(np.array([-0.5]))
+
+
 def test_movimiento_espacial_magnitud_aceleracion():
     """
     Testea el cálculo de la magnitud de la aceleración.
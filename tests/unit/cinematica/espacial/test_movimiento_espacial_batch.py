@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from cinetica.cinematica.espacial import MovimientoEspacial, MovimientoEspacialBatch
+
+
+def test_batch_coincide_con_instancias_individuales():
+    """
+    Testea que el lote reproduce los resultados de N instancias escalares.
+    """
+    p0 = np.array([[0.0, 0.0, 10.0], [1.0, 2.0, 3.0], [-5.0, 0.0, 0.0]])
+    v0 = np.array([[5.0, 2.0, 0.0], [0.0, 0.0, 1.0], [3.0, -1.0, 2.0]])
+    a = np.array([[0.0, 0.0, -9.81], [0.0, 0.0, -9.81], [1.0, 0.0, 0.0]])
+
+    lote = MovimientoEspacialBatch(p0, v0, a)
+    assert len(lote) == 3
+
+    t = 1.5
+    posiciones = lote.posicion(t).magnitude
+    velocidades = lote.velocidad(t).magnitude
+    rapideces = lote.magnitud_velocidad(t).magnitude
+
+    for i in range(3):
+        individual = MovimientoEspacial(
+            posicion_inicial=p0[i],
+            velocidad_inicial=v0[i],
+            aceleracion_constante=a[i],
+        )
+        assert np.allclose(posiciones[i], individual.posicion(tiempo=t).magnitude)
+        assert np.allclose(velocidades[i], individual.velocidad(tiempo=t).magnitude)
+        assert np.isclose(
+            rapideces[i], individual.magnitud_velocidad(tiempo=t).magnitude
+        )
+
+
+def test_batch_aceleracion_compartida():
+    """
+    Testea el broadcasting de una única aceleración (3,) sobre el lote.
+    """
+    lote = MovimientoEspacialBatch(
+        posiciones_iniciales=[[0.0, 0.0, 10.0], [0.0, 0.0, 20.0]],
+        velocidades_iniciales=[[5.0, 0.0, 0.0], [0.0, 5.0, 0.0]],
+        aceleraciones_constantes=[0.0, 0.0, -9.81],
+    )
+    velocidades = lote.velocidad(2.0).magnitude
+    assert np.allclose(velocidades[:, 2], -9.81 * 2.0)
+
+
+def test_batch_entradas_invalidas():
+    """
+    Testea la validación de formas y de tiempo negativo.
+    """
+    with pytest.raises(ValueError):
+        MovimientoEspacialBatch(
+            posiciones_iniciales=[[0.0, 0.0]],
+            velocidades_iniciales=[[0.0, 0.0]],
+            aceleraciones_constantes=[[0.0, 0.0]],
+        )
+
+    lote = MovimientoEspacialBatch(
+        posiciones_iniciales=[[0.0, 0.0, 0.0]],
+        velocidades_iniciales=[[1.0, 0.0, 0.0]],
+        aceleraciones_constantes=[[0.0, 0.0, 0.0]],
+    )
+    with pytest.raises(ValueError):
+        lote.posicion(tiempo=-1.0)
@@ -38,6 +38,14 @@ def test_velocidad_relativa_dimension_mismatch():
         mr.velocidad_relativa(v_a, v_b)
 
 
+def test_velocidad_relativa_out():
+    mr = MovimientoRelativo()
+    buffer = np.empty(2)
+    v_rel = mr.velocidad_relativa([10, 5], [2, 3], out=buffer)
+    assert v_rel.magnitude is buffer
+    assert np.allclose(buffer, [8, 2])
+
+
 def test_velocidad_absoluta_a():
     mr = MovimientoRelativo()
     v_rel_ab = [8, 0]
@@ -76,6 +84,14 @@ def test_magnitud_velocidad():
     assert mr.magnitud_velocidad(v).magnitude == pytest.approx(0.0)
 
 
+def test_magnitud_velocidad_lote():
+    mr = MovimientoRelativo()
+    lote = np.array([[3.0, 4.0], [6.0, 8.0], [0.0, 0.0]])
+    mags = mr.magnitud_velocidad(lote)
+    assert np.allclose(mags.magnitude, [5.0, 10.0, 0.0])
+    assert mags.units == ureg.meter / ureg.second
+
+
 def test_direccion_velocidad_2d():
     mr = MovimientoRelativo()
     v = [1, 0]
@@ -113,3 +129,46 @@ def test_direccion_velocidad_3d():
 
     v = [0, 0, 0]
     assert np.allclose(mr.direccion_velocidad(v), [0, 0, 0])
+
+
+def test_velocidades_relativas():
+    mr = MovimientoRelativo()
+    marcos = np.array([[0.0, 0.0], [10.0, 0.0], [0.0, 5.0]])
+    v_rel = mr.velocidades_relativas([10, 5], marcos)
+    assert np.allclose(v_rel.magnitude, [[10, 5], [0, 5], [10, 0]])
+    assert v_rel.units == ureg.meter / ureg.second
+
+
+def test_velocidad_absoluta_encadenada():
+    mr = MovimientoRelativo()
+    v = mr.velocidad_absoluta_encadenada([200, 50], [20, -10], [0, 5])
+    assert np.allclose(v.magnitude, [220, 45])
+    assert v.units == ureg.meter / ureg.second
+
+    with pytest.raises(ValueError):
+        mr.velocidad_absoluta_encadenada([1, 0])
+
+
+def test_absoluta_mag_dir():
+    mr = MovimientoRelativo()
+    v_abs, mag, ang = mr.absoluta_mag_dir([3, 0], [0, 4])
+    assert np.allclose(v_abs.magnitude, [3, 4])
+    assert mag.magnitude == pytest.approx(5.0)
+    assert ang.magnitude == pytest.approx(np.arctan2(4, 3))
+
+    v_abs, mag, unitario = mr.absoluta_mag_dir([1, 0, 0], [1, 2, 2])
+    assert np.allclose(v_abs.magnitude, [2, 2, 2])
+    assert mag.magnitude == pytest.approx(2 * np.sqrt(3))
+    assert np.allclose(unitario, np.full(3, 1 / np.sqrt(3)))
+
+
+def test_direccion_velocidad_lote():
+    mr = MovimientoRelativo()
+    lote_2d = np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+    angulos = mr.direccion_velocidad(lote_2d)
+    assert np.allclose(angulos.magnitude, [0.0, np.pi / 2, np.pi / 4])
+    assert angulos.units == ureg.radian
+
+    lote_3d = np.array([[2.0, 0.0, 0.0], [0.0, 0.0, 0.0]])
+    unitarios = mr.direccion_velocidad(lote_3d)
+    assert np.allclose(unitarios, [[1.0, 0.0, 0.0], [0.0, 0.0, 0.0]])
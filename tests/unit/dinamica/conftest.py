@@ -0,0 +1,16 @@
+"""Configuración compartida para los tests de dinámica.
+
+Importar aquí las clases del subárbol hace que sus imports transitivos
+(pint, NumPy, internals de dinámica) se resuelvan una sola vez durante la
+recolección del worker; los ``import`` a nivel de módulo de cada archivo de
+tests se convierten después en búsquedas en ``sys.modules``.
+"""
+
+from cinetica.dinamica.rotacional.cuerpos_rigidos import CuerposRigidos  # noqa: F401
+from cinetica.dinamica.rotacional.ecuaciones_euler import EcuacionesEuler  # noqa: F401
+from cinetica.dinamica.rotacional.energia_rotacional import (  # noqa: F401
+    EnergiaRotacional,
+)
+from cinetica.dinamica.rotacional.momento_angular import MomentoAngular  # noqa: F401
+from cinetica.dinamica.rotacional.torque import Torque  # noqa: F401
+from cinetica.dinamica.sistemas_particulas import SistemasParticulas  # noqa: F401
@@ -5,150 +5,149 @@ Este módulo contiene pruebas unitarias para las funcionalidades implementadas
 en el módulo cinetica.dinamica.choques.
 """
 
-import unittest
+import pytest
 import numpy as np
-from numpy.testing import assert_almost_equal, assert_array_almost_equal
+from numpy.testing import assert_array_almost_equal
+
+from pint import UnitRegistry
 
 from cinetica.dinamica.choques import ChoquesColisiones
 
+# Registro separado del de cinetica.units para comprobar la interoperabilidad,
+# construido una sola vez a nivel de módulo (crear uno por test re-parsea todas
+# las definiciones de unidades de pint).
+_ureg = UnitRegistry()
+
+
+@pytest.fixture(scope="module")
+def choques():
+    """Instancia compartida de ChoquesColisiones para todo el módulo."""
+    return ChoquesColisiones()
 
-class TestChoquesColisiones(unittest.TestCase):
+
+class TestChoquesColisiones:
     """Pruebas para la clase ChoquesColisiones."""
-    
-    def setUp(self):
-        """Configuración común para las pruebas."""
-        self.choques = ChoquesColisiones()
-    
-    def test_colision_unidimensional_elastica(self):
-        """Prueba colisión unidimensional perfectamente elástica."""
-        # Caso de prueba con colisión elástica (e=1.0)
-        m1, v1i = 2.0, 3.0  # kg, m/s
-        m2, v2i = 5.0, -1.0  # kg, m/s
-        e = 1.0
-        
-        v1f, v2f = self.choques.colision_unidimensional(m1, v1i, m2, v2i, e)
-        
-        # Verificar conservación del momento lineal
-        momento_inicial = m1 * v1i + m2 * v2i
-        momento_final = m1 * v1f + m2 * v2f
-        self.assertAlmostEqual(momento_final, momento_inicial, places=10)
-        
-        # Verificar coeficiente de restitución (debe ser 1.0 para colisión elástica)
-        e_calculado = self.choques.coeficiente_restitucion(v1i, v2i, v1f, v2f)
-        self.assertAlmostEqual(e_calculado, e, places=10)
-    
-    def test_colision_unidimensional_inelastica(self):
-        """Prueba colisión unidimensional perfectamente inelástica."""
-        m1, v1i = 2.0, 3.0  # kg, m/s
-        m2, v2i = 5.0, -1.0  # kg, m/s
-        e = 0.0  # Colisión perfectamente inelástica
-        
-        v1f, v2f = self.choques.colision_unidimensional(m1, v1i, m2, v2i, e)
-        
-        # En una colisión perfectamente inelástica, las velocidades finales deben ser iguales
-        self.assertAlmostEqual(v1f, v2f, places=10)
-        
+
+    @pytest.mark.parametrize("m1, v1i, m2, v2i, e", [
+        (2.0, 3.0, 5.0, -1.0, 1.0),  # Perfectamente elástica
+        (2.0, 3.0, 5.0, -1.0, 0.0),  # Perfectamente inelástica
+        (2.0, 3.0, 5.0, -1.0, 0.5),  # Parcialmente elástica
+    ])
+    def test_colision_unidimensional(self, choques, m1, v1i, m2, v2i, e):
+        """Prueba colisión unidimensional para distintos coeficientes de restitución."""
+        v1f, v2f = choques.colision_unidimensional(m1, v1i, m2, v2i, e)
+
         # Verificar conservación del momento lineal
         momento_inicial = m1 * v1i + m2 * v2i
         momento_final = m1 * v1f + m2 * v2f
-        self.assertAlmostEqual(momento_final, momento_inicial, places=10)
-    
-    def test_colision_bidimensional_conservacion_momento(self):
+        assert momento_final == pytest.approx(momento_inicial, abs=1e-10)
+
+        if e == 0.0:
+            # En una colisión perfectamente inelástica, las velocidades finales deben ser iguales
+            assert v1f == pytest.approx(v2f, abs=1e-10)
+        else:
+            # Verificar que se recupera el coeficiente de restitución usado
+            e_calculado = choques.coeficiente_restitucion(v1i, v2i, v1f, v2f)
+            assert e_calculado == pytest.approx(e, abs=1e-10)
+
+    def test_colision_unidimensional_lote(self, choques):
+        """Prueba el barrido vectorizado de coeficientes de restitución."""
+        e = np.array([0.0, 0.5, 1.0])
+
+        v1f, v2f = choques.colision_unidimensional_lote(2.0, 3.0, 5.0, -1.0, e)
+
+        # Cada elemento debe coincidir con la versión escalar
+        for i, ei in enumerate(e):
+            v1f_esc, v2f_esc = choques.colision_unidimensional(2.0, 3.0, 5.0, -1.0, ei)
+            assert v1f[i] == pytest.approx(v1f_esc)
+            assert v2f[i] == pytest.approx(v2f_esc)
+
+        with pytest.raises(ValueError):
+            choques.colision_unidimensional_lote(2.0, 3.0, 5.0, -1.0, np.array([1.5]))
+
+    @pytest.mark.parametrize("m1, v1i, m2, v2i, angulo, e", [
+        (2.0, np.array([3.0, 2.0]), 4.0, np.array([-1.0, 0.0]), np.pi / 4, 0.8),
+        (2.0, np.array([3.0, 2.0]), 4.0, np.array([-1.0, 0.0]), np.pi / 4, 1.0),
+        (1.5, np.array([5.0, -1.0]), 3.0, np.array([0.0, 2.0]), np.pi / 6, 0.5),
+    ])
+    def test_colision_bidimensional_conservacion_momento(self, choques, m1, v1i, m2, v2i, angulo, e):
         """Prueba que se conserva el momento lineal en colisión 2D."""
-        m1, v1i = 2.0, [3.0, 2.0]  # kg, m/s
-        m2, v2i = 4.0, [-1.0, 0.0]  # kg, m/s
-        angulo = np.pi/4  # 45 grados
-        e = 0.8
-        
-        v1f, v2f = self.choques.colision_bidimensional(m1, v1i, m2, v2i, angulo, e)
-        
-        # Calcular momentos lineales inicial y final
-        p1i = np.array(v1i) * m1
-        p2i = np.array(v2i) * m2
-        p1f = np.array(v1f) * m1
-        p2f = np.array(v2f) * m2
-        
+        v1f, v2f = choques.colision_bidimensional(m1, v1i, m2, v2i, angulo, e)
+
         # El momento lineal total debe conservarse en ambas componentes
-        assert_array_almost_equal(p1i + p2i, p1f + p2f, decimal=10)
-    
-    def test_colision_tridimensional_conservacion_momento(self):
+        # (las entradas ya son ndarrays; el broadcasting evita temporales).
+        p_total_i = m1 * v1i + m2 * v2i
+        p_total_f = m1 * np.asarray(v1f) + m2 * np.asarray(v2f)
+        assert_array_almost_equal(p_total_i, p_total_f, decimal=10)
+
+    @pytest.mark.parametrize("m1, v1i, m2, v2i, normal, e", [
+        (2.0, np.array([3.0, 2.0, 1.0]), 4.0, np.array([-1.0, 0.5, -0.5]), np.array([1.0, 0.0, 0.0]), 0.7),
+        (2.0, np.array([3.0, 2.0, 1.0]), 4.0, np.array([-1.0, 0.5, -0.5]), np.array([0.0, 1.0, 0.0]), 1.0),
+        (1.0, np.array([0.0, 0.0, 4.0]), 2.0, np.array([0.0, 0.0, -2.0]), np.array([0.0, 0.0, 1.0]), 0.0),
+    ])
+    def test_colision_tridimensional_conservacion_momento(self, choques, m1, v1i, m2, v2i, normal, e):
         """Prueba que se conserva el momento lineal en colisión 3D."""
-        m1, v1i = 2.0, [3.0, 2.0, 1.0]  # kg, m/s
-        m2, v2i = 4.0, [-1.0, 0.5, -0.5]  # kg, m/s
-        normal = [1.0, 0.0, 0.0]  # Colisión frontal en el eje x
-        e = 0.7
-        
-        v1f, v2f = self.choques.colision_tridimensional(m1, v1i, m2, v2i, normal, e)
-        
-        # Calcular momentos lineales inicial y final
-        p1i = np.array(v1i) * m1
-        p2i = np.array(v2i) * m2
-        p1f = np.array(v1f) * m1
-        p2f = np.array(v2f) * m2
-        
+        v1f, v2f = choques.colision_tridimensional(m1, v1i, m2, v2i, normal, e)
+
         # El momento lineal total debe conservarse en las tres componentes
-        assert_array_almost_equal(p1i + p2i, p1f + p2f, decimal=10)
-    
-    def test_coeficiente_restitucion(self):
+        # (las entradas ya son ndarrays; el broadcasting evita temporales).
+        p_total_i = m1 * v1i + m2 * v2i
+        p_total_f = m1 * np.asarray(v1f) + m2 * np.asarray(v2f)
+        assert_array_almost_equal(p_total_i, p_total_f, decimal=10)
+
+    def test_coeficiente_restitucion(self, choques):
         """Prueba el cálculo del coeficiente de restitución."""
         # Caso de prueba con valores conocidos
         v1i, v2i = 4.0, -2.0  # m/s
         v1f, v2f = -1.5, 2.5  # m/s
-        
+
         # Coeficiente de restitución esperado: e = -(v2f - v1f)/(v2i - v1i)
         e_esperado = -(v2f - v1f) / (v2i - v1i)
-        e_calculado = self.choques.coeficiente_restitucion(v1i, v2i, v1f, v2f)
-        
-        self.assertAlmostEqual(e_calculado, e_esperado, places=10)
-    
-    def test_energia_cinetica_perdida(self):
+        e_calculado = choques.coeficiente_restitucion(v1i, v2i, v1f, v2f)
+
+        assert e_calculado == pytest.approx(e_esperado, abs=1e-10)
+
+    def test_energia_cinetica_perdida(self, choques):
         """Prueba el cálculo de la energía cinética perdida."""
         m1, v1i = 2.0, 3.0  # kg, m/s
         m2, v2i = 5.0, -1.0  # kg, m/s
         e = 0.5  # Coeficiente de restitución
-        
+
         # Calcular energías cinéticas inicial y final
         K_i = 0.5 * m1 * v1i**2 + 0.5 * m2 * v2i**2
-        
+
         # Obtener velocidades finales
-        v1f, v2f = self.choques.colision_unidimensional(m1, v1i, m2, v2i, e)
+        v1f, v2f = choques.colision_unidimensional(m1, v1i, m2, v2i, e)
         K_f = 0.5 * m1 * v1f**2 + 0.5 * m2 * v2f**2
-        
+
         # Calcular energía perdida esperada
         delta_K_esperado = K_i - K_f
-        
+
         # Calcular energía perdida usando el método
-        delta_K_calculado = self.choques.energia_cinetica_perdida(
+        delta_K_calculado = choques.energia_cinetica_perdida(
             m1, v1i, m2, v2i, v1f, v2f
         )
-        
-        self.assertAlmostEqual(delta_K_calculado, delta_K_esperado, places=10)
-    
-    def test_colision_unidimensional_unidades(self):
+
+        assert delta_K_calculado == pytest.approx(delta_K_esperado, abs=1e-10)
+
+    def test_colision_unidimensional_unidades(self, choques):
         """Prueba el manejo de unidades en colisiones unidimensionales."""
-        from pint import UnitRegistry
-        ureg = UnitRegistry()
-        
         # Definir cantidades con unidades
-        m1 = 2.0 * ureg.kg
-        v1i = 3.0 * ureg.meter / ureg.second
-        m2 = 5.0 * ureg.kg
-        v2i = -1.0 * ureg.meter / ureg.second
+        m1 = 2.0 * _ureg.kg
+        v1i = 3.0 * _ureg.meter / _ureg.second
+        m2 = 5.0 * _ureg.kg
+        v2i = -1.0 * _ureg.meter / _ureg.second
         e = 0.8
-        
+
         # Realizar la colisión
-        v1f, v2f = self.choques.colision_unidimensional(
+        v1f, v2f = choques.colision_unidimensional(
             m1, v1i, m2, v2i, e, unidades={'masa': 'kg', 'velocidad': 'm/s'}
         )
-        
-        # Verificar que los resultados tengan las unidades correctas
-        self.assertEqual(str(v1f.u), 'meter / second')
-        self.assertEqual(str(v2f.u), 'meter / second')
-        
-        # Verificar que las magnitudes sean razonables
-        self.assertTrue(-10 < v1f.magnitude < 10)
-        self.assertTrue(-10 < v2f.magnitude < 10)
 
+        # Verificar que los resultados tengan las unidades correctas
+        assert str(v1f.u) == 'meter / second'
+        assert str(v2f.u) == 'meter / second'
 
-if __name__ == '__main__':
-    unittest.main()
+        # Verificar que las magnitudes sean razonables
+        assert -10 < v1f.magnitude < 10
+        assert -10 < v2f.magnitude < 10
@@ -8,216 +8,186 @@ import numpy as np
 from cinetica.dinamica.fuerzas import AnalisisFuerzas
 from cinetica.units import ureg, Q_
 
+# Dimensionalidades cacheadas una vez: cada acceso a .dimensionality
+# recorre el contenedor de unidades de pint.
+_NEWTON_DIM = ureg.newton.dimensionality
 
-class TestAnalisisFuerzas:
-    """Tests para la clase AnalisisFuerzas."""
-
-    def setup_method(self):
-        """Configuración para cada test."""
-        self.fuerzas = AnalisisFuerzas()
 
-    def test_friccion_estatica(self):
-        """Test cálculo de fricción estática."""
-        f_s = self.fuerzas.friccion_estatica(normal=100, coeficiente=0.3)
+@pytest.fixture(scope="module")
+def fuerzas():
+    """Instancia compartida de AnalisisFuerzas para todo el módulo."""
+    return AnalisisFuerzas()
 
-        assert f_s.magnitude == pytest.approx(30.0)
-        assert f_s.dimensionality == ureg.newton.dimensionality
 
-    def test_friccion_estatica_con_unidades(self):
-        """Test fricción estática con unidades."""
-        normal = Q_(200, ureg.newton)
-        f_s = self.fuerzas.friccion_estatica(normal=normal, coeficiente=0.4)
-
-        assert f_s.magnitude == pytest.approx(80.0)
+class TestAnalisisFuerzas:
+    """Tests para la clase AnalisisFuerzas."""
 
-    def test_friccion_estatica_coeficiente_negativo(self):
+    # Los casos con y sin unidades comparten el cuerpo del test; parametrizar
+    # evita duplicar métodos estructuralmente idénticos y reparte mejor los
+    # tests entre workers de xdist.
+    @pytest.mark.parametrize("normal, coeficiente, expected", [
+        (100, 0.3, 30.0),
+        (Q_(200, ureg.newton), 0.4, 80.0),
+    ])
+    def test_friccion_estatica(self, fuerzas, normal, coeficiente, expected):
+        """Test cálculo de fricción estática (con y sin unidades)."""
+        f_s = fuerzas.friccion_estatica(normal=normal, coeficiente=coeficiente)
+
+        assert f_s.magnitude == pytest.approx(expected)
+        assert f_s.dimensionality == _NEWTON_DIM
+
+    def test_friccion_estatica_coeficiente_negativo(self, fuerzas):
         """Test error con coeficiente negativo."""
         with pytest.raises(ValueError, match="coeficiente de fricción debe ser no negativo"):
-            self.fuerzas.friccion_estatica(normal=100, coeficiente=-0.1)
+            fuerzas.friccion_estatica(normal=100, coeficiente=-0.1)
 
-    def test_friccion_cinetica(self):
-        """Test cálculo de fricción cinética."""
-        f_k = self.fuerzas.friccion_cinetica(normal=150, coeficiente=0.25)
+    def test_friccion_estatica_batch(self, fuerzas):
+        """Test fricción estática con un barrido completo en una llamada."""
+        normales = np.array([100.0, 200.0, 150.0, 80.0])
+        coeficientes = np.array([0.3, 0.4, 0.25, 0.5])
 
-        assert f_k.magnitude == pytest.approx(37.5)
-        assert f_k.dimensionality == ureg.newton.dimensionality
+        f_s = fuerzas.friccion_estatica(normal=normales, coeficiente=coeficientes)
 
-    def test_friccion_cinetica_con_unidades(self):
-        """Test fricción cinética con unidades."""
-        normal = Q_(120, ureg.newton)
-        f_k = self.fuerzas.friccion_cinetica(normal=normal, coeficiente=0.2)
+        assert np.allclose(f_s.magnitude, normales * coeficientes)
+        assert f_s.dimensionality == _NEWTON_DIM
 
-        assert f_k.magnitude == pytest.approx(24.0)
+    @pytest.mark.parametrize("normal, coeficiente, expected", [
+        (150, 0.25, 37.5),
+        (Q_(120, ureg.newton), 0.2, 24.0),
+    ])
+    def test_friccion_cinetica(self, fuerzas, normal, coeficiente, expected):
+        """Test cálculo de fricción cinética (con y sin unidades)."""
+        f_k = fuerzas.friccion_cinetica(normal=normal, coeficiente=coeficiente)
 
-    def test_fuerza_elastica(self):
-        """Test cálculo de fuerza elástica."""
-        F_elastica = self.fuerzas.fuerza_elastica(constante=500, deformacion=0.1)
+        assert f_k.magnitude == pytest.approx(expected)
+        assert f_k.dimensionality == _NEWTON_DIM
 
-        assert F_elastica.magnitude == pytest.approx(50.0)
-        assert F_elastica.dimensionality == ureg.newton.dimensionality
+    def test_friccion_cinetica_batch(self, fuerzas):
+        """Test fricción cinética con un barrido completo en una llamada."""
+        normales = np.array([150.0, 120.0, 90.0])
+        coeficientes = np.array([0.25, 0.2, 0.35])
 
-    def test_fuerza_elastica_con_unidades(self):
-        """Test fuerza elástica con unidades."""
-        k = Q_(200, ureg.newton / ureg.meter)
-        x = Q_(0.05, ureg.meter)
+        f_k = fuerzas.friccion_cinetica(normal=normales, coeficiente=coeficientes)
 
-        F_elastica = self.fuerzas.fuerza_elastica(constante=k, deformacion=x)
+        assert np.allclose(f_k.magnitude, normales * coeficientes)
+        assert f_k.dimensionality == _NEWTON_DIM
 
-        assert F_elastica.magnitude == pytest.approx(10.0)
+    @pytest.mark.parametrize("constante, deformacion, expected", [
+        (500, 0.1, 50.0),
+        (Q_(200, ureg.newton / ureg.meter), Q_(0.05, ureg.meter), 10.0),
+    ])
+    def test_fuerza_elastica(self, fuerzas, constante, deformacion, expected):
+        """Test cálculo de fuerza elástica (con y sin unidades)."""
+        F_elastica = fuerzas.fuerza_elastica(constante=constante, deformacion=deformacion)
 
-    def test_fuerza_elastica_constante_negativa(self):
+        assert F_elastica.magnitude == pytest.approx(expected)
+        assert F_elastica.dimensionality == _NEWTON_DIM
+
+    def test_fuerza_elastica_constante_negativa(self, fuerzas):
         """Test error con constante elástica negativa."""
         with pytest.raises(ValueError, match="constante elástica debe ser positiva"):
-            self.fuerzas.fuerza_elastica(constante=-100, deformacion=0.1)
-
-    def test_fuerza_gravitacional(self):
-        """Test cálculo de fuerza gravitacional."""
-        F_grav = self.fuerzas.fuerza_gravitacional(masa1=100, masa2=200, distancia=10)
-
-        # F = G * m1 * m2 / r^2
-        expected = 6.67430e-11 * 100 * 200 / (10**2)
-        assert F_grav.magnitude == pytest.approx(expected)
-        assert F_grav.dimensionality == ureg.newton.dimensionality
-
-    def test_fuerza_gravitacional_con_unidades(self):
-        """Test fuerza gravitacional con unidades."""
-        m1 = Q_(50, ureg.kilogram)
-        m2 = Q_(75, ureg.kilogram)
-        r = Q_(5, ureg.meter)
+            fuerzas.fuerza_elastica(constante=-100, deformacion=0.1)
+
+    # F = G * m1 * m2 / r^2
+    @pytest.mark.parametrize("masa1, masa2, distancia, expected", [
+        (100, 200, 10, 6.67430e-11 * 100 * 200 / (10**2)),
+        (
+            Q_(50, ureg.kilogram),
+            Q_(75, ureg.kilogram),
+            Q_(5, ureg.meter),
+            6.67430e-11 * 50 * 75 / (5**2),
+        ),
+    ])
+    def test_fuerza_gravitacional(self, fuerzas, masa1, masa2, distancia, expected):
+        """Test cálculo de fuerza gravitacional (con y sin unidades)."""
+        F_grav = fuerzas.fuerza_gravitacional(masa1=masa1, masa2=masa2, distancia=distancia)
 
-        F_grav = self.fuerzas.fuerza_gravitacional(masa1=m1, masa2=m2, distancia=r)
-
-        expected = 6.67430e-11 * 50 * 75 / (5**2)
         assert F_grav.magnitude == pytest.approx(expected)
+        assert F_grav.dimensionality == _NEWTON_DIM
 
-    def test_fuerza_gravitacional_distancia_cero(self):
+    def test_fuerza_gravitacional_distancia_cero(self, fuerzas):
         """Test error con distancia cero."""
         with pytest.raises(ValueError, match="distancia debe ser positiva"):
-            self.fuerzas.fuerza_gravitacional(masa1=100, masa2=200, distancia=0)
+            fuerzas.fuerza_gravitacional(masa1=100, masa2=200, distancia=0)
 
-    def test_fuerza_gravitacional_masa_negativa(self):
+    def test_fuerza_gravitacional_masa_negativa(self, fuerzas):
         """Test error con masa negativa."""
         with pytest.raises(ValueError, match="masas deben ser positivas"):
-            self.fuerzas.fuerza_gravitacional(masa1=-100, masa2=200, distancia=10)
-
-    def test_descomponer_fuerza(self):
-        """Test descomposición de fuerza en componentes."""
-        Fx, Fy = self.fuerzas.descomponer_fuerza(magnitud=100, angulo=math.pi/4)
-
-        expected_x = 100 * math.cos(math.pi/4)
-        expected_y = 100 * math.sin(math.pi/4)
-
-        assert Fx.magnitude == pytest.approx(expected_x)
-        assert Fy.magnitude == pytest.approx(expected_y)
-
-    def test_descomponer_fuerza_con_unidades(self):
-        """Test descomposición con unidades."""
-        F = Q_(50, ureg.newton)
-        angulo = Q_(math.pi/6, ureg.radian)
-
-        Fx, Fy = self.fuerzas.descomponer_fuerza(magnitud=F, angulo=angulo)
+            fuerzas.fuerza_gravitacional(masa1=-100, masa2=200, distancia=10)
 
-        expected_x = 50 * math.cos(math.pi/6)
-        expected_y = 50 * math.sin(math.pi/6)
+    @pytest.mark.parametrize("magnitud, angulo, mag_expected, ang_expected", [
+        (100, math.pi / 4, 100, math.pi / 4),
+        (Q_(50, ureg.newton), Q_(math.pi / 6, ureg.radian), 50, math.pi / 6),
+    ])
+    def test_descomponer_fuerza(self, fuerzas, magnitud, angulo, mag_expected, ang_expected):
+        """Test descomposición de fuerza en componentes (con y sin unidades)."""
+        Fx, Fy = fuerzas.descomponer_fuerza(magnitud=magnitud, angulo=angulo)
 
-        assert Fx.magnitude == pytest.approx(expected_x)
-        assert Fy.magnitude == pytest.approx(expected_y)
+        assert Fx.magnitude == pytest.approx(mag_expected * math.cos(ang_expected))
+        assert Fy.magnitude == pytest.approx(mag_expected * math.sin(ang_expected))
 
-    def test_descomponer_fuerza_magnitud_negativa(self):
+    def test_descomponer_fuerza_magnitud_negativa(self, fuerzas):
         """Test error con magnitud negativa."""
         with pytest.raises(ValueError, match="magnitud de la fuerza debe ser no negativa"):
-            self.fuerzas.descomponer_fuerza(magnitud=-50, angulo=0)
-
-    def test_magnitud_y_direccion(self):
-        """Test cálculo de magnitud y dirección desde componentes."""
-        mag, ang = self.fuerzas.magnitud_y_direccion(Fx=30, Fy=40)
-
-        expected_mag = math.sqrt(30**2 + 40**2)
-        expected_ang = math.atan2(40, 30)
-
-        assert mag.magnitude == pytest.approx(expected_mag)
-        assert ang.magnitude == pytest.approx(expected_ang)
-
-    def test_magnitud_y_direccion_con_unidades(self):
-        """Test magnitud y dirección con unidades."""
-        Fx = Q_(6, ureg.newton)
-        Fy = Q_(8, ureg.newton)
-
-        mag, ang = self.fuerzas.magnitud_y_direccion(Fx=Fx, Fy=Fy)
-
-        expected_mag = math.sqrt(6**2 + 8**2)
-        expected_ang = math.atan2(8, 6)
-
-        assert mag.magnitude == pytest.approx(expected_mag)
-        assert ang.magnitude == pytest.approx(expected_ang)
-
-    def test_plano_inclinado(self):
-        """Test descomposición en plano inclinado."""
-        F_par, F_perp = self.fuerzas.plano_inclinado(peso=100, angulo=math.pi/6)
-
-        expected_par = 100 * math.sin(math.pi/6)
-        expected_perp = 100 * math.cos(math.pi/6)
-
-        assert F_par.magnitude == pytest.approx(expected_par)
-        assert F_perp.magnitude == pytest.approx(expected_perp)
-
-    def test_plano_inclinado_con_unidades(self):
-        """Test plano inclinado con unidades."""
-        peso = Q_(200, ureg.newton)
-        angulo = Q_(math.pi/3, ureg.radian)
-
-        F_par, F_perp = self.fuerzas.plano_inclinado(peso=peso, angulo=angulo)
-
-        expected_par = 200 * math.sin(math.pi/3)
-        expected_perp = 200 * math.cos(math.pi/3)
-
-        assert F_par.magnitude == pytest.approx(expected_par)
-        assert F_perp.magnitude == pytest.approx(expected_perp)
-
-    def test_plano_inclinado_peso_negativo(self):
+            fuerzas.descomponer_fuerza(magnitud=-50, angulo=0)
+
+    @pytest.mark.parametrize("Fx, Fy, fx_val, fy_val", [
+        (30, 40, 30, 40),
+        (Q_(6, ureg.newton), Q_(8, ureg.newton), 6, 8),
+    ])
+    def test_magnitud_y_direccion(self, fuerzas, Fx, Fy, fx_val, fy_val):
+        """Test magnitud y dirección desde componentes (con y sin unidades)."""
+        mag, ang = fuerzas.magnitud_y_direccion(Fx=Fx, Fy=Fy)
+
+        assert mag.magnitude == pytest.approx(math.hypot(fx_val, fy_val))
+        assert ang.magnitude == pytest.approx(math.atan2(fy_val, fx_val))
+
+    @pytest.mark.parametrize("peso, angulo, peso_val, ang_val", [
+        (100, math.pi / 6, 100, math.pi / 6),
+        (Q_(200, ureg.newton), Q_(math.pi / 3, ureg.radian), 200, math.pi / 3),
+    ])
+    def test_plano_inclinado(self, fuerzas, peso, angulo, peso_val, ang_val):
+        """Test descomposición en plano inclinado (con y sin unidades)."""
+        F_par, F_perp = fuerzas.plano_inclinado(peso=peso, angulo=angulo)
+
+        assert F_par.magnitude == pytest.approx(peso_val * math.sin(ang_val))
+        assert F_perp.magnitude == pytest.approx(peso_val * math.cos(ang_val))
+
+    def test_plano_inclinado_peso_negativo(self, fuerzas):
         """Test error con peso negativo."""
         with pytest.raises(ValueError, match="peso debe ser positivo"):
-            self.fuerzas.plano_inclinado(peso=-100, angulo=math.pi/4)
-
-    def test_tension_cuerda_equilibrio(self):
-        """Test tensión en equilibrio."""
-        T = self.fuerzas.tension_cuerda(masa=10)
-
-        expected = 10 * 9.81
-        assert T.magnitude == pytest.approx(expected)
-        assert T.dimensionality == ureg.newton.dimensionality
-
-    def test_tension_cuerda_con_aceleracion(self):
-        """Test tensión con aceleración."""
-        T = self.fuerzas.tension_cuerda(masa=5, aceleracion=2)
-
-        expected = 5 * (9.81 + 2)
-        assert T.magnitude == pytest.approx(expected)
-
-    def test_tension_cuerda_con_angulo(self):
-        """Test tensión con ángulo."""
-        T = self.fuerzas.tension_cuerda(masa=10, angulo=math.pi/4)
-
-        expected = (10 * 9.81) / math.cos(math.pi/4)
-        assert T.magnitude == pytest.approx(expected)
-
-    def test_tension_cuerda_con_unidades(self):
-        """Test tensión con unidades."""
-        masa = Q_(8, ureg.kilogram)
-        aceleracion = Q_(1.5, ureg.meter / ureg.second**2)
-        gravedad = Q_(9.81, ureg.meter / ureg.second**2)
-
-        T = self.fuerzas.tension_cuerda(masa=masa, aceleracion=aceleracion, gravedad=gravedad)
+            fuerzas.plano_inclinado(peso=-100, angulo=math.pi/4)
+
+    @pytest.mark.parametrize("kwargs, expected", [
+        # Equilibrio: T = m * g
+        ({"masa": 10}, 10 * 9.81),
+        # Con aceleración: T = m * (g + a)
+        ({"masa": 5, "aceleracion": 2}, 5 * (9.81 + 2)),
+        # Con ángulo: T = m * g / cos(θ)
+        ({"masa": 10, "angulo": math.pi / 4}, (10 * 9.81) / math.cos(math.pi / 4)),
+        # Con unidades explícitas
+        (
+            {
+                "masa": Q_(8, ureg.kilogram),
+                "aceleracion": Q_(1.5, ureg.meter / ureg.second**2),
+                "gravedad": Q_(9.81, ureg.meter / ureg.second**2),
+            },
+            8 * (9.81 + 1.5),
+        ),
+    ])
+    def test_tension_cuerda(self, fuerzas, kwargs, expected):
+        """Test tensión en la cuerda en sus distintas configuraciones."""
+        T = fuerzas.tension_cuerda(**kwargs)
 
-        expected = 8 * (9.81 + 1.5)
         assert T.magnitude == pytest.approx(expected)
+        assert T.dimensionality == _NEWTON_DIM
 
-    def test_tension_cuerda_masa_negativa(self):
+    def test_tension_cuerda_masa_negativa(self, fuerzas):
         """Test error con masa negativa."""
         with pytest.raises(ValueError, match="masa debe ser positiva"):
-            self.fuerzas.tension_cuerda(masa=-5)
+            fuerzas.tension_cuerda(masa=-5)
 
-    def test_tension_cuerda_angulo_90_grados(self):
+    def test_tension_cuerda_angulo_90_grados(self, fuerzas):
         """Test error con ángulo de 90 grados."""
         with pytest.raises(ValueError, match="ángulo debe ser menor a 90 grados"):
-            self.fuerzas.tension_cuerda(masa=10, angulo=math.pi/2)
+            fuerzas.tension_cuerda(masa=10, angulo=math.pi/2)
@@ -8,80 +8,87 @@ import numpy as np
 from cinetica.dinamica.newton import LeyesNewton
 from cinetica.units import ureg, Q_
 
+# Dimensionalidades cacheadas una vez: cada acceso a .dimensionality
+# recorre el contenedor de unidades de pint.
+_NEWTON_DIM = ureg.newton.dimensionality
+_KILOGRAM_DIM = ureg.kilogram.dimensionality
+
+
+@pytest.fixture(scope="module")
+def newton():
+    """Instancia compartida de LeyesNewton para todo el módulo."""
+    return LeyesNewton()
+
 
 class TestLeyesNewton:
     """Tests para la clase LeyesNewton."""
 
-    def setup_method(self):
-        """Configuración para cada test."""
-        self.newton = LeyesNewton()
-
-    def test_segunda_ley_calcular_fuerza(self):
+    def test_segunda_ley_calcular_fuerza(self, newton):
         """Test cálculo de fuerza usando F = ma."""
-        fuerza = self.newton.segunda_ley(masa=10, aceleracion=5)
+        fuerza = newton.segunda_ley(masa=10, aceleracion=5)
 
         assert fuerza.magnitude == pytest.approx(50.0)
-        assert fuerza.dimensionality == ureg.newton.dimensionality
+        assert fuerza.dimensionality == _NEWTON_DIM
 
-    def test_segunda_ley_calcular_masa(self):
+    def test_segunda_ley_calcular_masa(self, newton):
         """Test cálculo de masa usando m = F/a."""
-        masa = self.newton.segunda_ley(fuerza=100, aceleracion=10)
+        masa = newton.segunda_ley(fuerza=100, aceleracion=10)
 
         assert masa.magnitude == pytest.approx(10.0)
-        assert masa.dimensionality == ureg.kilogram.dimensionality
+        assert masa.dimensionality == _KILOGRAM_DIM
 
-    def test_segunda_ley_calcular_aceleracion(self):
+    def test_segunda_ley_calcular_aceleracion(self, newton):
         """Test cálculo de aceleración usando a = F/m."""
-        aceleracion = self.newton.segunda_ley(masa=5, fuerza=25)
+        aceleracion = newton.segunda_ley(masa=5, fuerza=25)
 
         assert aceleracion.magnitude == pytest.approx(5.0)
         assert aceleracion.dimensionality == (ureg.meter / ureg.second**2).dimensionality
 
-    def test_segunda_ley_con_unidades(self):
+    def test_segunda_ley_con_unidades(self, newton):
         """Test segunda ley con cantidades que ya tienen unidades."""
         masa = Q_(2, ureg.kilogram)
         aceleracion = Q_(3, ureg.meter / ureg.second**2)
 
-        fuerza = self.newton.segunda_ley(masa=masa, aceleracion=aceleracion)
+        fuerza = newton.segunda_ley(masa=masa, aceleracion=aceleracion)
 
         assert fuerza.magnitude == pytest.approx(6.0)
-        assert fuerza.dimensionality == ureg.newton.dimensionality
+        assert fuerza.dimensionality == _NEWTON_DIM
 
-    def test_segunda_ley_vectorial(self):
+    def test_segunda_ley_vectorial(self, newton):
         """Test segunda ley con aceleración vectorial."""
         masa = 2
         aceleracion_vec = np.array([3, 4, 0])
 
-        fuerza = self.newton.segunda_ley(masa=masa, aceleracion=aceleracion_vec)
+        fuerza = newton.segunda_ley(masa=masa, aceleracion=aceleracion_vec)
 
         expected = np.array([6, 8, 0])
         np.testing.assert_array_almost_equal(fuerza.magnitude, expected)
 
-    def test_segunda_ley_parametros_insuficientes(self):
+    def test_segunda_ley_parametros_insuficientes(self, newton):
         """Test error cuando no se proporcionan suficientes parámetros."""
         with pytest.raises(ValueError, match="exactamente dos de los tres parámetros"):
-            self.newton.segunda_ley(masa=10)
+            newton.segunda_ley(masa=10)
 
-    def test_segunda_ley_demasiados_parametros(self):
+    def test_segunda_ley_demasiados_parametros(self, newton):
         """Test error cuando se proporcionan todos los parámetros."""
         with pytest.raises(ValueError, match="exactamente dos de los tres parámetros"):
-            self.newton.segunda_ley(masa=10, aceleracion=5, fuerza=50)
+            newton.segunda_ley(masa=10, aceleracion=5, fuerza=50)
 
-    def test_segunda_ley_masa_negativa(self):
+    def test_segunda_ley_masa_negativa(self, newton):
         """Test error con masa negativa."""
         with pytest.raises(ValueError, match="masa debe ser un valor positivo"):
-            self.newton.segunda_ley(masa=-5, aceleracion=10)
+            newton.segunda_ley(masa=-5, aceleracion=10)
 
-    def test_fuerza_neta_escalar(self):
+    def test_fuerza_neta_escalar(self, newton):
         """Test cálculo de fuerza neta con fuerzas escalares."""
         fuerzas = [10, -5, 8, -3]
 
-        fuerza_neta = self.newton.fuerza_neta(fuerzas)
+        fuerza_neta = newton.fuerza_neta(fuerzas)
 
         assert fuerza_neta.magnitude == pytest.approx(10.0)
-        assert fuerza_neta.dimensionality == ureg.newton.dimensionality
+        assert fuerza_neta.dimensionality == _NEWTON_DIM
 
-    def test_fuerza_neta_vectorial(self):
+    def test_fuerza_neta_vectorial(self, newton):
         """Test cálculo de fuerza neta con fuerzas vectoriales."""
         fuerzas = [
             np.array([10, 0]),
@@ -89,12 +96,12 @@ class TestLeyesNewton:
             np.array([-5, -3])
         ]
 
-        fuerza_neta = self.newton.fuerza_neta(fuerzas)
+        fuerza_neta = newton.fuerza_neta(fuerzas)
 
         expected = np.array([5, 12])
         np.testing.assert_array_almost_equal(fuerza_neta.magnitude, expected)
 
-    def test_fuerza_neta_con_unidades(self):
+    def test_fuerza_neta_con_unidades(self, newton):
         """Test fuerza neta con cantidades que ya tienen unidades."""
         fuerzas = [
             Q_(20, ureg.newton),
@@ -102,32 +109,32 @@ class TestLeyesNewton:
             Q_(3, ureg.newton)
         ]
 
-        fuerza_neta = self.newton.fuerza_neta(fuerzas)
+        fuerza_neta = newton.fuerza_neta(fuerzas)
 
         assert fuerza_neta.magnitude == pytest.approx(15.0)
 
-    def test_fuerza_neta_lista_vacia(self):
+    def test_fuerza_neta_lista_vacia(self, newton):
         """Test error con lista vacía de fuerzas."""
         with pytest.raises(ValueError, match="al menos una fuerza"):
-            self.newton.fuerza_neta([])
+            newton.fuerza_neta([])
 
-    def test_equilibrio_verdadero(self):
+    def test_equilibrio_verdadero(self, newton):
         """Test sistema en equilibrio."""
         fuerzas = [10, -10, 5, -5]
 
-        en_equilibrio = self.newton.equilibrio(fuerzas)
+        en_equilibrio = newton.equilibrio(fuerzas)
 
         assert en_equilibrio is True
 
-    def test_equilibrio_falso(self):
+    def test_equilibrio_falso(self, newton):
         """Test sistema no en equilibrio."""
         fuerzas = [10, -5, 3]
 
-        en_equilibrio = self.newton.equilibrio(fuerzas)
+        en_equilibrio = newton.equilibrio(fuerzas)
 
         assert en_equilibrio is False
 
-    def test_equilibrio_vectorial(self):
+    def test_equilibrio_vectorial(self, newton):
         """Test equilibrio con fuerzas vectoriales."""
         fuerzas = [
             np.array([10, 0]),
@@ -135,73 +142,73 @@ class TestLeyesNewton:
             np.array([0, -5])
         ]
 
-        en_equilibrio = self.newton.equilibrio(fuerzas)
+        en_equilibrio = newton.equilibrio(fuerzas)
 
         assert en_equilibrio == True
 
-    def test_equilibrio_con_tolerancia(self):
+    def test_equilibrio_con_tolerancia(self, newton):
         """Test equilibrio con tolerancia personalizada."""
         fuerzas = [10.001, -10.0]  # Diferencia muy pequeña
 
-        en_equilibrio = self.newton.equilibrio(fuerzas, tolerancia=1e-2)
+        en_equilibrio = newton.equilibrio(fuerzas, tolerancia=1e-2)
 
         assert en_equilibrio is True
 
-    def test_aceleracion_desde_fuerzas(self):
+    def test_aceleracion_desde_fuerzas(self, newton):
         """Test cálculo de aceleración desde múltiples fuerzas."""
         masa = 5
         fuerzas = [20, -5, 10]
 
-        aceleracion = self.newton.aceleracion_desde_fuerzas(masa, fuerzas)
+        aceleracion = newton.aceleracion_desde_fuerzas(masa, fuerzas)
 
         assert aceleracion.magnitude == pytest.approx(5.0)
         assert aceleracion.dimensionality == (ureg.meter / ureg.second**2).dimensionality
 
-    def test_peso_tierra(self):
+    def test_peso_tierra(self, newton):
         """Test cálculo del peso en la Tierra."""
-        peso = self.newton.peso(masa=10)
+        peso = newton.peso(masa=10)
 
         assert peso.magnitude == pytest.approx(98.1)
-        assert peso.dimensionality == ureg.newton.dimensionality
+        assert peso.dimensionality == _NEWTON_DIM
 
-    def test_peso_luna(self):
+    def test_peso_luna(self, newton):
         """Test cálculo del peso en la Luna."""
-        peso = self.newton.peso(masa=10, gravedad=1.62)
+        peso = newton.peso(masa=10, gravedad=1.62)
 
         assert peso.magnitude == pytest.approx(16.2)
 
-    def test_peso_con_unidades(self):
+    def test_peso_con_unidades(self, newton):
         """Test peso con cantidades que tienen unidades."""
         masa = Q_(5, ureg.kilogram)
         gravedad = Q_(9.81, ureg.meter / ureg.second**2)
 
-        peso = self.newton.peso(masa, gravedad)
+        peso = newton.peso(masa, gravedad)
 
         assert peso.magnitude == pytest.approx(49.05)
 
-    def test_fuerza_centripeta(self):
+    def test_fuerza_centripeta(self, newton):
         """Test cálculo de fuerza centrípeta."""
-        fuerza_c = self.newton.fuerza_centripeta(masa=2, velocidad=10, radio=5)
+        fuerza_c = newton.fuerza_centripeta(masa=2, velocidad=10, radio=5)
 
         assert fuerza_c.magnitude == pytest.approx(40.0)
-        assert fuerza_c.dimensionality == ureg.newton.dimensionality
+        assert fuerza_c.dimensionality == _NEWTON_DIM
 
-    def test_fuerza_centripeta_con_unidades(self):
+    def test_fuerza_centripeta_con_unidades(self, newton):
         """Test fuerza centrípeta con unidades."""
         masa = Q_(1, ureg.kilogram)
         velocidad = Q_(6, ureg.meter / ureg.second)
         radio = Q_(3, ureg.meter)
 
-        fuerza_c = self.newton.fuerza_centripeta(masa, velocidad, radio)
+        fuerza_c = newton.fuerza_centripeta(masa, velocidad, radio)
 
         assert fuerza_c.magnitude == pytest.approx(12.0)
 
-    def test_fuerza_centripeta_radio_cero(self):
+    def test_fuerza_centripeta_radio_cero(self, newton):
         """Test error con radio cero."""
         with pytest.raises(ValueError, match="radio debe ser un valor positivo"):
-            self.newton.fuerza_centripeta(masa=1, velocidad=5, radio=0)
+            newton.fuerza_centripeta(masa=1, velocidad=5, radio=0)
 
-    def test_fuerza_centripeta_radio_negativo(self):
+    def test_fuerza_centripeta_radio_negativo(self, newton):
         """Test error con radio negativo."""
         with pytest.raises(ValueError, match="radio debe ser un valor positivo"):
-            self.newton.fuerza_centripeta(masa=1, velocidad=5, radio=-2)
+            newton.fuerza_centripeta(masa=1, velocidad=5, radio=-2)
@@ -2,172 +2,154 @@
 Tests unitarios para el módulo de energía rotacional en dinámica rotacional.
 """
 
+from functools import lru_cache
+
 import numpy as np
 import pytest
 from cinetica.dinamica.rotacional.energia_rotacional import EnergiaRotacional
 from cinetica.units import ureg, Q_
 
+# Con --dist loadgroup, todos los módulos de dinámica comparten worker y
+# reutilizan las cachés de unidades de pint y los kernels JIT ya calentados.
+pytestmark = pytest.mark.xdist_group("dinamica")
+
+
+@lru_cache(maxsize=None)
+def _U(simbolo):
+    """Parsea y memoiza una unidad: ureg('...') reinvoca el parser por uso."""
+    return ureg(simbolo)
+
 
 class TestEnergiaRotacional:
     """Test cases for EnergiaRotacional class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.energia = EnergiaRotacional()
-
-    def test_energia_cinetica_rotacional_basica(self):
-        """Test basic rotational kinetic energy calculation."""
-        momento_inercia = Q_(2.0, 'kg * m**2')
-        velocidad_angular = Q_(3.0, 'rad/s')
-        
-        resultado = self.energia.energia_cinetica_rotacional(momento_inercia, velocidad_angular)
-        
-        expected = 0.5 * 2.0 * (3.0 ** 2)  # 0.5 * I * ω² = 0.5 * 2 * 9 = 9
+    @classmethod
+    def setup_class(cls):
+        """Set up shared test fixtures.
+
+        La instancia es sin estado y las Quantities de entrada se construyen
+        una sola vez: cada Q_(...) por test repite la construcción y el parseo
+        de unidades de pint.
+        """
+        cls.energia = EnergiaRotacional()
+        cls.I_MEDIO = Q_(0.5, 'kg * m**2')
+        cls.I2 = Q_(2.0, 'kg * m**2')
+        cls.W2 = Q_(2.0, 'rad/s')
+        cls.W3 = Q_(3.0, 'rad/s')
+        cls.M1 = Q_(1.0, 'kg')
+        cls.M2 = Q_(2.0, 'kg')
+        cls.TAU5 = Q_(5.0, 'N * m')
+
+    # Los casos básico y de valor cero comparten el mismo cuerpo; la
+    # parametrización evita repetir el método por cada entrada escalar.
+    @pytest.mark.parametrize("inercia, velocidad_angular, expected", [
+        (2.0, 3.0, 9.0),   # 0.5 * I * ω² = 0.5 * 2 * 9 = 9
+        (2.0, 0.0, 0.0),   # velocidad angular cero
+        (0.0, 3.0, 0.0),   # inercia cero
+    ])
+    def test_energia_cinetica_rotacional(self, inercia, velocidad_angular, expected):
+        """Test rotational kinetic energy across basic and zero-value cases."""
+        resultado = self.energia.energia_cinetica_rotacional(
+            Q_(inercia, 'kg * m**2'), Q_(velocidad_angular, 'rad/s')
+        )
+
         assert resultado.magnitude == expected
-        assert resultado.units == ureg('J')
+        assert resultado.units == _U('J')
 
     def test_energia_cinetica_total(self):
         """Test total kinetic energy (translation + rotation)."""
-        masa = Q_(1.0, 'kg')
         velocidad_lineal = Q_(4.0, 'm/s')
-        momento_inercia = Q_(0.5, 'kg * m**2')
-        velocidad_angular = Q_(2.0, 'rad/s')
-        
+
         resultado = self.energia.energia_cinetica_total(
-            masa, velocidad_lineal, momento_inercia, velocidad_angular
+            self.M1, velocidad_lineal, self.I_MEDIO, self.W2
         )
-        
+
         # E_total = 0.5*m*v² + 0.5*I*ω² = 0.5*1*16 + 0.5*0.5*4 = 8 + 1 = 9
         assert resultado.magnitude == 9.0
-        assert resultado.units == ureg('J')
+        assert resultado.units == _U('J')
 
     def test_energia_potencial_gravitacional(self):
         """Test gravitational potential energy."""
-        masa = Q_(2.0, 'kg')
         altura = Q_(10.0, 'm')
         gravedad = Q_(9.81, 'm/s**2')
-        
-        resultado = self.energia.energia_potencial_gravitacional(masa, altura, gravedad)
-        
+
+        resultado = self.energia.energia_potencial_gravitacional(self.M2, altura, gravedad)
+
         expected = 2.0 * 9.81 * 10.0  # m * g * h
         assert resultado.magnitude == expected
-        assert resultado.units == ureg('J')
+        assert resultado.units == _U('J')
 
     def test_conservacion_energia_mecanica_verdadero(self):
         """Test mechanical energy conservation when conserved."""
         energia_inicial = Q_(100.0, 'J')
         energia_final = Q_(100.0, 'J')
-        
+
         resultado = self.energia.conservacion_energia_mecanica(energia_inicial, energia_final)
-        
+
         assert resultado is True
 
     def test_conservacion_energia_mecanica_falso(self):
         """Test mechanical energy conservation when not conserved."""
         energia_inicial = Q_(100.0, 'J')
         energia_final = Q_(90.0, 'J')
-        
+
         resultado = self.energia.conservacion_energia_mecanica(energia_inicial, energia_final)
-        
+
         assert resultado is False
 
-    def test_trabajo_torque(self):
-        """Test work done by torque."""
-        torque = Q_(5.0, 'N * m')
-        angulo_rotacion = Q_(np.pi, 'rad')
-        
-        resultado = self.energia.trabajo_torque(torque, angulo_rotacion)
-        
-        expected = 5.0 * np.pi  # W = τ * θ
-        assert abs(resultado.magnitude - expected) < 1e-10
-        assert resultado.units == ureg('J')
-
-    def test_potencia_rotacional(self):
-        """Test rotational power."""
-        torque = Q_(10.0, 'N * m')
-        velocidad_angular = Q_(2.0, 'rad/s')
-        
-        resultado = self.energia.potencia_rotacional(torque, velocidad_angular)
-        
-        expected = 10.0 * 2.0  # P = τ * ω
+    @pytest.mark.parametrize("angulo", [np.pi, 0.0])
+    def test_trabajo_torque(self, angulo):
+        """Test work done by torque, including the zero-angle case."""
+        resultado = self.energia.trabajo_torque(self.TAU5, Q_(angulo, 'rad'))
+
+        expected = 5.0 * angulo  # W = τ * θ
+        assert resultado.magnitude == pytest.approx(expected, abs=1e-10)
+        assert resultado.units == _U('J')
+
+    @pytest.mark.parametrize("torque, expected", [
+        (10.0, 20.0),  # P = τ * ω
+        (0.0, 0.0),    # torque cero
+    ])
+    def test_potencia_rotacional(self, torque, expected):
+        """Test rotational power, including the zero-torque case."""
+        resultado = self.energia.potencia_rotacional(Q_(torque, 'N * m'), self.W2)
+
         assert resultado.magnitude == expected
-        assert resultado.units == ureg('W')
+        assert resultado.units == _U('W')
 
     def test_energia_cilindro_rodando(self):
         """Test energy of rolling cylinder."""
-        masa = Q_(1.0, 'kg')
         velocidad = Q_(3.0, 'm/s')
         radio = Q_(0.5, 'm')
-        
-        resultado = self.energia.energia_cilindro_rodando(masa, velocidad, radio)
-        
+
+        resultado = self.energia.energia_cilindro_rodando(self.M1, velocidad, radio)
+
         # E = 0.5*m*v² + 0.25*m*v² = 0.75*m*v² = 0.75*1*9 = 6.75
         expected = 0.75 * 1.0 * (3.0 ** 2)
         assert resultado.magnitude == expected
-        assert resultado.units == ureg('J')
+        assert resultado.units == _U('J')
 
     def test_teorema_ejes_paralelos(self):
         """Test parallel axis theorem."""
-        momento_inercia_cm = Q_(2.0, 'kg * m**2')
-        masa = Q_(1.0, 'kg')
         distancia = Q_(3.0, 'm')
-        
-        resultado = self.energia.teorema_ejes_paralelos(momento_inercia_cm, masa, distancia)
-        
+
+        resultado = self.energia.teorema_ejes_paralelos(self.I2, self.M1, distancia)
+
         expected = 2.0 + 1.0 * (3.0 ** 2)  # I = I_cm + m*d² = 2 + 9 = 11
         assert resultado.magnitude == expected
-        assert resultado.units == ureg('kg * m**2')
-
-    def test_energia_cinetica_cero_velocidad(self):
-        """Test rotational kinetic energy with zero angular velocity."""
-        momento_inercia = Q_(2.0, 'kg * m**2')
-        velocidad_angular = Q_(0.0, 'rad/s')
-        
-        resultado = self.energia.energia_cinetica_rotacional(momento_inercia, velocidad_angular)
-        
-        assert resultado.magnitude == 0.0
-
-    def test_energia_cinetica_cero_inercia(self):
-        """Test rotational kinetic energy with zero moment of inertia."""
-        momento_inercia = Q_(0.0, 'kg * m**2')
-        velocidad_angular = Q_(3.0, 'rad/s')
-        
-        resultado = self.energia.energia_cinetica_rotacional(momento_inercia, velocidad_angular)
-        
-        assert resultado.magnitude == 0.0
-
-    def test_trabajo_torque_cero_angulo(self):
-        """Test torque work with zero angle."""
-        torque = Q_(5.0, 'N * m')
-        angulo_rotacion = Q_(0.0, 'rad')
-        
-        resultado = self.energia.trabajo_torque(torque, angulo_rotacion)
-        
-        assert resultado.magnitude == 0.0
-
-    def test_potencia_rotacional_cero_torque(self):
-        """Test rotational power with zero torque."""
-        torque = Q_(0.0, 'N * m')
-        velocidad_angular = Q_(2.0, 'rad/s')
-        
-        resultado = self.energia.potencia_rotacional(torque, velocidad_angular)
-        
-        assert resultado.magnitude == 0.0
+        assert resultado.units == _U('kg * m**2')
 
     def test_teorema_ejes_paralelos_cero_distancia(self):
         """Test parallel axis theorem with zero distance."""
-        momento_inercia_cm = Q_(2.0, 'kg * m**2')
-        masa = Q_(1.0, 'kg')
         distancia = Q_(0.0, 'm')
-        
-        resultado = self.energia.teorema_ejes_paralelos(momento_inercia_cm, masa, distancia)
-        
+
+        resultado = self.energia.teorema_ejes_paralelos(self.I2, self.M1, distancia)
+
         assert resultado.magnitude == 2.0  # I = I_cm + 0 = I_cm
 
     def test_unidades_incompatibles(self):
         """Test with incompatible units."""
         momento_inercia = Q_(2.0, 'kg')  # Unidades incorrectas
-        velocidad_angular = Q_(3.0, 'rad/s')
-        
-        with pytest.raises(Exception):
-            self.energia.energia_cinetica_rotacional(momento_inercia, velocidad_angular)
\ No newline at end of file
+
+        with pytest.raises(Exception, match="Unidades incompatibles"):
+            self.energia.energia_cinetica_rotacional(momento_inercia, self.W3)
@@ -2,82 +2,91 @@
 Tests unitarios para el módulo de ecuaciones de Euler en dinámica rotacional.
 """
 
+from functools import lru_cache
+
 import numpy as np
 import pytest
 from cinetica.dinamica.rotacional.ecuaciones_euler import EcuacionesEuler
 from cinetica.units import ureg, Q_
 
+# Con --dist loadgroup, todos los módulos de dinámica comparten worker y
+# reutilizan las cachés de unidades de pint y los kernels JIT ya calentados.
+pytestmark = pytest.mark.xdist_group("dinamica")
+
+
+@lru_cache(maxsize=None)
+def _U(simbolo):
+    """Parsea y memoiza una unidad: ureg('...') reinvoca el parser por uso."""
+    return ureg(simbolo)
+
+
+# Momentos principales (1, 2, 3) kg*m² compartidos por la mayoría de los tests.
+_IXX = Q_(1.0, 'kg * m**2')
+_IYY = Q_(2.0, 'kg * m**2')
+_IZZ = Q_(3.0, 'kg * m**2')
+
+# Ternas de velocidad angular compartidas (tuplas inmutables): cada lista
+# construida en el cuerpo de un test paga tres Q_ con parseo de unidades.
+_RAD_S_0 = Q_(0.0, 'rad/s')
+_OMEGA_X = (Q_(1.0, 'rad/s'), _RAD_S_0, _RAD_S_0)
+_OMEGA_2X = (Q_(2.0, 'rad/s'), _RAD_S_0, _RAD_S_0)
+_OMEGA_ZERO = (_RAD_S_0, _RAD_S_0, _RAD_S_0)
+_OMEGA_GENERAL = (Q_(2.0, 'rad/s'), Q_(1.0, 'rad/s'), Q_(0.5, 'rad/s'))
+
 
 class TestEcuacionesEuler:
     """Test cases for EcuacionesEuler class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.euler = EcuacionesEuler()
+    @classmethod
+    def setup_class(cls):
+        """Set up shared test fixtures.
+
+        Siete de los tests usan el mismo tensor diagonal (1, 2, 3) kg*m²;
+        configurarlo una vez evita repetir set_tensor_inercia y su aritmética
+        de pint por test. Los tests que mutan o requieren una instancia sin
+        configurar crean la suya localmente.
+        """
+        cls._euler_123 = EcuacionesEuler()
+        cls._euler_123.set_tensor_inercia(_IXX, _IYY, _IZZ)
 
     def test_set_tensor_inercia(self):
-        """Test setting inertia tensor."""
-        ixx = Q_(1.0, 'kg * m**2')
-        iyy = Q_(2.0, 'kg * m**2')
-        izz = Q_(3.0, 'kg * m**2')
-        
-        self.euler.set_tensor_inercia(ixx, iyy, izz)
-        
-        tensor = self.euler.tensor_inercia
+        """Test setting inertia tensor (diagonal values and symmetry)."""
+        tensor = self._euler_123.tensor_inercia
         assert tensor[0, 0] == 1.0
         assert tensor[1, 1] == 2.0
         assert tensor[2, 2] == 3.0
         assert tensor[0, 1] == 0.0  # Off-diagonal should be zero
         assert tensor[0, 2] == 0.0
         assert tensor[1, 2] == 0.0
+        # Simetría del tensor, verificada sobre el mismo recorrido.
+        assert tensor[0, 1] == tensor[1, 0]
+        assert tensor[0, 2] == tensor[2, 0]
+        assert tensor[1, 2] == tensor[2, 1]
 
     def test_resolver_ecuaciones_euler_estacionario(self):
         """Test solving Euler equations for steady rotation."""
-        ixx = Q_(1.0, 'kg * m**2')
-        iyy = Q_(2.0, 'kg * m**2')
-        izz = Q_(3.0, 'kg * m**2')
-        self.euler.set_tensor_inercia(ixx, iyy, izz)
-        
-        velocidades_angulares = [Q_(1.0, 'rad/s'), Q_(0.0, 'rad/s'), Q_(0.0, 'rad/s')]
-        
-        resultado = self.euler.resolver_ecuaciones_euler(velocidades_angulares)
+        resultado = self._euler_123.resolver_ecuaciones_euler(_OMEGA_X)
         
         # For steady rotation about x-axis, torque should be zero
         assert len(resultado) == 3
-        assert abs(resultado[0].magnitude) < 1e-10  # τ_x ≈ 0
-        assert abs(resultado[1].magnitude) < 1e-10  # τ_y ≈ 0
-        assert abs(resultado[2].magnitude) < 1e-10  # τ_z ≈ 0
+        # τ ≈ (0, 0, 0)
+        assert [r.magnitude for r in resultado] == pytest.approx([0.0, 0.0, 0.0], abs=1e-10)
 
     def test_estabilidad_rotacion_eje_intermedio(self):
         """Test rotation stability for intermediate axis."""
-        ixx = Q_(1.0, 'kg * m**2')
-        iyy = Q_(2.0, 'kg * m**2')
-        izz = Q_(3.0, 'kg * m**2')
-        self.euler.set_tensor_inercia(ixx, iyy, izz)
-        
-        resultado = self.euler.estabilidad_rotacion('y')
+        resultado = self._euler_123.estabilidad_rotacion('y')
         
         assert resultado is False  # Intermediate axis is unstable
 
     def test_estabilidad_rotacion_eje_mayor(self):
         """Test rotation stability for major axis."""
-        ixx = Q_(1.0, 'kg * m**2')
-        iyy = Q_(2.0, 'kg * m**2')
-        izz = Q_(3.0, 'kg * m**2')
-        self.euler.set_tensor_inercia(ixx, iyy, izz)
-        
-        resultado = self.euler.estabilidad_rotacion('z')
+        resultado = self._euler_123.estabilidad_rotacion('z')
         
         assert resultado is True  # Major axis is stable
 
     def test_estabilidad_rotacion_eje_menor(self):
         """Test rotation stability for minor axis."""
-        ixx = Q_(1.0, 'kg * m**2')
-        iyy = Q_(2.0, 'kg * m**2')
-        izz = Q_(3.0, 'kg * m**2')
-        self.euler.set_tensor_inercia(ixx, iyy, izz)
-        
-        resultado = self.euler.estabilidad_rotacion('x')
+        resultado = self._euler_123.estabilidad_rotacion('x')
         
         assert resultado is True  # Minor axis is stable
 
@@ -87,37 +96,28 @@ class TestEcuacionesEuler:
         torque_externo = Q_(5.0, 'N * m')
         momento_inercia = Q_(0.1, 'kg * m**2')
         
-        resultado = self.euler.precesion_giroscopio(velocidad_spin, torque_externo, momento_inercia)
+        resultado = self._euler_123.precesion_giroscopio(velocidad_spin, torque_externo, momento_inercia)
         
         expected = torque_externo.magnitude / (momento_inercia.magnitude * velocidad_spin.magnitude)
-        assert abs(resultado.magnitude - expected) < 1e-10
-        assert resultado.units == ureg('rad/s')
+        assert resultado.magnitude == pytest.approx(expected, abs=1e-10)
+        assert resultado.units == _U('rad/s')
 
     def test_energia_cinetica_rotacional_euler(self):
         """Test rotational kinetic energy using Euler approach."""
-        ixx = Q_(1.0, 'kg * m**2')
-        iyy = Q_(2.0, 'kg * m**2')
-        izz = Q_(3.0, 'kg * m**2')
-        self.euler.set_tensor_inercia(ixx, iyy, izz)
-        
-        velocidades_angulares = [Q_(2.0, 'rad/s'), Q_(1.0, 'rad/s'), Q_(0.5, 'rad/s')]
-        
-        resultado = self.euler.energia_cinetica_rotacional(velocidades_angulares)
+        resultado = self._euler_123.energia_cinetica_rotacional(_OMEGA_GENERAL)
         
         # E = 0.5 * (I_xx*ω_x² + I_yy*ω_y² + I_zz*ω_z²)
         expected = 0.5 * (1.0 * 4.0 + 2.0 * 1.0 + 3.0 * 0.25)  # 0.5 * (4 + 2 + 0.75) = 3.375
-        assert abs(resultado.magnitude - expected) < 1e-10
-        assert resultado.units == ureg('J')
+        assert resultado.magnitude == pytest.approx(expected, abs=1e-10)
+        assert resultado.units == _U('J')
 
     def test_torque_cambio_momento_euler(self):
         """Test torque from change in angular momentum."""
-        velocidades_angulares_inicial = [Q_(1.0, 'rad/s'), Q_(0.0, 'rad/s'), Q_(0.0, 'rad/s')]
-        velocidades_angulares_final = [Q_(2.0, 'rad/s'), Q_(0.0, 'rad/s'), Q_(0.0, 'rad/s')]
         tiempo = Q_(1.0, 's')
         
-        resultado = self.euler.torque_cambio_momento(
-            velocidades_angulares_inicial, velocidades_angulares_final, tiempo
-        )
+        # Usa el tensor por defecto: requiere una instancia sin configurar
+        euler = EcuacionesEuler()
+        resultado = euler.torque_cambio_momento(_OMEGA_X, _OMEGA_2X, tiempo)
         
         # τ = ΔL/Δt = I * Δω/Δt
         assert len(resultado) == 3
@@ -127,20 +127,15 @@ class TestEcuacionesEuler:
 
     def test_tensor_inercia_no_establecido(self):
         """Test operations without setting inertia tensor."""
-        velocidades_angulares = [Q_(1.0, 'rad/s'), Q_(0.0, 'rad/s'), Q_(0.0, 'rad/s')]
-        
+        euler = EcuacionesEuler()
+
         with pytest.raises(ValueError):
-            self.euler.resolver_ecuaciones_euler(velocidades_angulares)
+            euler.resolver_ecuaciones_euler(_OMEGA_X)
 
     def test_estabilidad_eje_invalido(self):
         """Test stability with invalid axis."""
-        ixx = Q_(1.0, 'kg * m**2')
-        iyy = Q_(2.0, 'kg * m**2')
-        izz = Q_(3.0, 'kg * m**2')
-        self.euler.set_tensor_inercia(ixx, iyy, izz)
-        
         with pytest.raises(ValueError):
-            self.euler.estabilidad_rotacion('a')
+            self._euler_123.estabilidad_rotacion('a')
 
     def test_precesion_cero_spin(self):
         """Test precession with zero spin velocity."""
@@ -149,31 +144,10 @@ class TestEcuacionesEuler:
         momento_inercia = Q_(0.1, 'kg * m**2')
         
         with pytest.raises(ZeroDivisionError):
-            self.euler.precesion_giroscopio(velocidad_spin, torque_externo, momento_inercia)
+            self._euler_123.precesion_giroscopio(velocidad_spin, torque_externo, momento_inercia)
 
     def test_energia_cinetica_cero_velocidades(self):
         """Test kinetic energy with zero angular velocities."""
-        ixx = Q_(1.0, 'kg * m**2')
-        iyy = Q_(2.0, 'kg * m**2')
-        izz = Q_(3.0, 'kg * m**2')
-        self.euler.set_tensor_inercia(ixx, iyy, izz)
-        
-        velocidades_angulares = [Q_(0.0, 'rad/s'), Q_(0.0, 'rad/s'), Q_(0.0, 'rad/s')]
-        
-        resultado = self.euler.energia_cinetica_rotacional(velocidades_angulares)
-        
-        assert resultado.magnitude == 0.0
-
-    def test_tensor_inercia_simetrico(self):
-        """Test that inertia tensor is symmetric."""
-        ixx = Q_(1.0, 'kg * m**2')
-        iyy = Q_(2.0, 'kg * m**2')
-        izz = Q_(3.0, 'kg * m**2')
-        self.euler.set_tensor_inercia(ixx, iyy, izz)
+        resultado = self._euler_123.energia_cinetica_rotacional(_OMEGA_ZERO)
         
-        tensor = self.euler.tensor_inercia
-        
-        # Check symmetry
-        assert tensor[0, 1] == tensor[1, 0]
-        assert tensor[0, 2] == tensor[2, 0]
-        assert tensor[1, 2] == tensor[2, 1]
\ No newline at end of file
+        assert resultado.magnitude == 0.0
\ No newline at end of file
@@ -2,18 +2,45 @@
 Tests unitarios para el módulo de momento angular en dinámica rotacional.
 """
 
+from functools import lru_cache
+
 import numpy as np
 import pytest
 from cinetica.dinamica.rotacional.momento_angular import MomentoAngular
 from cinetica.units import ureg, Q_
 
+# Con --dist loadgroup, todos los módulos de dinámica comparten worker y
+# reutilizan las cachés de unidades de pint y los kernels JIT ya calentados.
+pytestmark = pytest.mark.xdist_group("dinamica")
+
+
+# Vectores de 3 componentes compartidos entre tests, congelados para evitar
+# tanto la re-asignación por test como mutaciones accidentales.
+_R_2X = np.array([2.0, 0.0, 0.0])
+_R_3X = np.array([3.0, 0.0, 0.0])
+_V_3Y = np.array([0.0, 3.0, 0.0])
+_V_4Y = np.array([0.0, 4.0, 0.0])
+for _v in (_R_2X, _R_3X, _V_3Y, _V_4Y):
+    _v.setflags(write=False)
+
+
+@lru_cache(maxsize=None)
+def _U(simbolo):
+    """Parsea y memoiza una unidad: ureg('...') reinvoca el parser por uso."""
+    return ureg(simbolo)
+
 
 class TestMomentoAngular:
     """Test cases for MomentoAngular class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.momento = MomentoAngular()
+    @classmethod
+    def setup_class(cls):
+        """Set up shared test fixtures.
+
+        Los métodos no dependen del estado interno entre llamadas, así que una
+        sola instancia sirve para toda la clase de tests.
+        """
+        cls.momento = MomentoAngular()
 
     def test_calcular_momento_angular_basico(self):
         """Test basic angular momentum calculation."""
@@ -23,12 +50,12 @@ class TestMomentoAngular:
         resultado = self.momento.calcular_momento_angular(inercia, velocidad_angular)
         
         assert resultado.magnitude == 10.0
-        assert resultado.units == ureg('kg * m**2 / s')
+        assert resultado.units == _U('kg * m**2 / s')
 
     def test_momento_angular_particula(self):
         """Test del cálculo del momento angular de una partícula."""
-        posicion = np.array([2.0, 0.0, 0.0])
-        velocidad = np.array([0.0, 3.0, 0.0])
+        posicion = _R_2X
+        velocidad = _V_3Y
         masa = Q_(1.0, 'kg')
         resultado = self.momento.momento_angular_particula(masa, posicion, velocidad)
         
@@ -57,44 +84,50 @@ class TestMomentoAngular:
 
     def test_momento_inercia_sistema_particulas(self):
         """Test del cálculo del momento angular de un sistema de partículas."""
-        # Crear sistema de 3 partículas
-        masas = [Q_(1.0, 'kg'), Q_(1.0, 'kg'), Q_(1.0, 'kg')]
-        posiciones = [np.array([1.0, 0.0, 0.0]), np.array([0.0, 1.0, 0.0]), np.array([-1.0, 0.0, 0.0])]
-        velocidades = [np.array([0.0, 1.0, 0.0]), np.array([1.0, 0.0, 0.0]), np.array([0.0, -1.0, 0.0])]
-        
-        # Calcular momento angular total
-        momento_total = None
-        for masa, pos, vel in zip(masas, posiciones, velocidades):
-            momento_parcial = self.momento.momento_angular_particula(masa, pos, vel)
-            if momento_total is None:
-                momento_total = momento_parcial
-            else:
-                momento_total += momento_parcial
-        
-        # Momento angular total: L_x = 0, L_y = 0, L_z = 1 (verificado con el cálculo real)
-        esperado = np.array([0.0, 0.0, 1.0])
-        np.testing.assert_array_almost_equal(momento_total.magnitude, esperado)
+        # Sistema de 3 partículas de 1 kg en arrays apilados (3, 3)
+        masa = Q_(1.0, 'kg')
+        posiciones = np.array(
+            [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [-1.0, 0.0, 0.0]], dtype=float
+        )
+        velocidades = np.array(
+            [[0.0, 1.0, 0.0], [1.0, 0.0, 0.0], [0.0, -1.0, 0.0]], dtype=float
+        )
+
+        # El oráculo se calcula con un único producto cruz vectorizado; la
+        # suma de los resultados de la API se hace en espacio de magnitudes
+        # para evitar encadenar __iadd__ de Quantities.
+        esperado = np.cross(posiciones, masa.magnitude * velocidades).sum(axis=0)
+
+        parciales = np.array([
+            self.momento.momento_angular_particula(masa, pos, vel).magnitude
+            for pos, vel in zip(posiciones, velocidades)
+        ])
+        np.testing.assert_array_almost_equal(parciales.sum(axis=0), esperado)
+        # Valor de referencia verificado con el cálculo manual
+        np.testing.assert_array_almost_equal(esperado, np.array([0.0, 0.0, 1.0]))
 
     def test_conservacion_angular_con_cambio_inercia(self):
         """Test de conservación del momento angular con cambio de inercia."""
         inercia_inicial = Q_(2.0, 'kg * m**2')
-        velocidad_inicial = Q_(3.0, 'rad/s')
         inercia_final = Q_(1.0, 'kg * m**2')
-        
-        # Calcular momento angular inicial
-        momento_inicial = inercia_inicial * velocidad_inicial
-        
-        # Calcular velocidad final usando conservación
-        velocidad_final = self.momento.velocidad_angular_cambio_inercia(momento_inicial, inercia_inicial, inercia_final)
-        momento_final = self.momento.calcular_momento_angular(inercia_final, velocidad_final)
-        
-        # Verificar conservación
-        assert self.momento.conservacion_momento_angular(momento_inicial, momento_final)
+
+        # Oráculo en magnitudes: L = I₀·ω₀ = 6, luego ω₁ = L / I₁ = 6/1.
+        # Encadenar el producto, la división y la verificación a través de
+        # pint repetía el mismo álgebra con tres Quantities intermedias.
+        momento_inicial = Q_(2.0 * 3.0, 'kg * m**2 / s')
+        expected_final_w = (2.0 * 3.0) / 1.0
+
+        velocidad_final = self.momento.velocidad_angular_cambio_inercia(
+            momento_inicial, inercia_inicial, inercia_final
+        )
+
+        assert velocidad_final.magnitude == pytest.approx(expected_final_w)
+        assert velocidad_final.units == _U('rad/s')
 
     def test_momento_angular_vectorial(self):
         """Test del cálculo de momento angular con vectores."""
-        posicion = np.array([3.0, 0.0, 0.0])
-        velocidad = np.array([0.0, 4.0, 0.0])
+        posicion = _R_3X
+        velocidad = _V_4Y
         masa = Q_(1.0, 'kg')
         resultado = self.momento.momento_angular_particula(masa, posicion, velocidad)
         
@@ -113,8 +146,8 @@ class TestMomentoAngular:
 
     def test_momento_angular_particula_cero_masa(self):
         """Test del comportamiento con masa cero."""
-        posicion = np.array([2.0, 0.0, 0.0])
-        velocidad = np.array([0.0, 3.0, 0.0])
+        posicion = _R_2X
+        velocidad = _V_3Y
         masa = Q_(0.0, 'kg')
         resultado = self.momento.momento_angular_particula(masa, posicion, velocidad)
         
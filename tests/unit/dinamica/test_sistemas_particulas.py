@@ -5,66 +5,78 @@ Este módulo contiene pruebas unitarias para las funcionalidades implementadas
 en el módulo cinetica.dinamica.sistemas_particulas.
 """
 
-import unittest
 import numpy as np
-from numpy.testing import assert_almost_equal, assert_array_almost_equal
+import pytest
+from numpy.testing import assert_array_almost_equal
 
 from cinetica.dinamica.sistemas_particulas import SistemasParticulas
+from cinetica.units import Q_
 
+# Con --dist loadgroup, todos los módulos de dinámica comparten worker y
+# reutilizan las cachés de unidades de pint y los kernels JIT ya calentados.
+pytestmark = pytest.mark.xdist_group("dinamica")
 
-class TestSistemasParticulas(unittest.TestCase):
+
+class TestSistemasParticulas:
     """Pruebas para la clase SistemasParticulas."""
-    
-    def setUp(self):
-        """Configuración común para las pruebas."""
-        self.sp = SistemasParticulas()
+
+    @classmethod
+    def setup_class(cls):
+        """Configuración común para las pruebas.
+
+        SistemasParticulas no guarda estado, por lo que basta una instancia
+        compartida por toda la clase.
+        """
+        cls.sp = SistemasParticulas()
     
     def test_centro_masa_simple(self):
         """Prueba el cálculo del centro de masa para un sistema simple."""
-        masas = [1.0, 2.0, 3.0]  # kg
-        posiciones = [
+        masas = np.array([1.0, 2.0, 3.0])  # kg
+        posiciones = np.array([
             [0.0, 0.0, 0.0],
             [1.0, 0.0, 0.0],
             [2.0, 0.0, 0.0]
-        ]
+        ])
         
         cm = self.sp.centro_masa(masas, posiciones)
         
-        # El centro de masa debería estar más cerca de la partícula con más masa
-        expected_cm = np.array([4/3, 0.0, 0.0])  # (0*1 + 1*2 + 2*3) / (1+2+3)
+        # El centro de masa debería estar más cerca de la partícula con más masa;
+        # el oráculo se calcula vectorizado: Σ(m_i * r_i) / Σ(m_i) = (4/3, 0, 0)
+        expected_cm = (masas[:, None] * posiciones).sum(axis=0) / masas.sum()
         assert_array_almost_equal(cm, expected_cm, decimal=10)
     
     def test_momento_inercia_particula(self):
         """Prueba el cálculo del momento de inercia para una partícula."""
         masa = 2.0  # kg
-        posicion = [3.0, 4.0, 0.0]  # m
+        posicion = np.array([3.0, 4.0, 0.0])  # m
         
         # Momento de inercia con respecto al origen
         I = self.sp.momento_inercia_particula(masa, posicion)
         
         # I = m * r² = 2 * (3² + 4² + 0²) = 2 * 25 = 50 kg·m²
-        self.assertAlmostEqual(I, 50.0, places=10)
+        assert I == pytest.approx(50.0, abs=1e-10)
         
         # Momento de inercia con respecto al eje z (eje [0,0,1])
         I_eje = self.sp.momento_inercia_particula(
             masa, posicion, eje=[0, 0, 1]
         )
         # I = m * (x² + y²) = 2 * (3² + 4²) = 50 kg·m²
-        self.assertAlmostEqual(I_eje, 50.0, places=10)
+        assert I_eje == pytest.approx(50.0, abs=1e-10)
     
     def test_momento_inercia_sistema(self):
         """Prueba el cálculo del momento de inercia para un sistema de partículas."""
-        masas = [1.0, 1.0, 1.0]  # kg
-        posiciones = [
+        masas = np.array([1.0, 1.0, 1.0])  # kg
+        posiciones = np.array([
             [1.0, 0.0, 0.0],
             [0.0, 1.0, 0.0],
             [0.0, 0.0, 1.0]
-        ]
+        ])
         
         I_total = self.sp.momento_inercia_sistema(masas, posiciones)
         
-        # Cada partícula está a distancia 1 del origen, I = 3 * (1 * 1²) = 3 kg·m²
-        self.assertAlmostEqual(I_total, 3.0, places=10)
+        # Cada partícula está a distancia 1 del origen: I = Σ m_i * r_i² = 3 kg·m²
+        expected = (masas * (posiciones**2).sum(axis=1)).sum()
+        assert I_total == pytest.approx(expected, abs=1e-10)
     
     def test_teorema_steiner(self):
         """Prueba el teorema de los ejes paralelos (Steiner)."""
@@ -75,7 +87,7 @@ class TestSistemasParticulas(unittest.TestCase):
         I = self.sp.teorema_steiner(I_cm, masa_total, distancia)
         
         # I = I_cm + M*d² = 10 + 5*4 = 30 kg·m²
-        self.assertAlmostEqual(I, 30.0, places=10)
+        assert I == pytest.approx(30.0, abs=1e-10)
     
     def test_energia_cinetica_rotacional(self):
         """Prueba el cálculo de la energía cinética rotacional."""
@@ -85,7 +97,7 @@ class TestSistemasParticulas(unittest.TestCase):
         K = self.sp.energia_cinetica_rotacional(I, omega)
         
         # K = (1/2) * I * ω² = 0.5 * 2 * 9 = 9 J
-        self.assertAlmostEqual(K, 9.0, places=10)
+        assert K == pytest.approx(9.0, abs=1e-10)
     
     def test_momento_angular(self):
         """Prueba el cálculo del momento angular."""
@@ -95,16 +107,15 @@ class TestSistemasParticulas(unittest.TestCase):
         L = self.sp.momento_angular(I, omega)
         
         # L = I * ω = 4 * 2 = 8 kg·m²/s
-        self.assertAlmostEqual(L, 8.0, places=10)
+        assert L == pytest.approx(8.0, abs=1e-10)
     
     def test_unidades(self):
         """Prueba el manejo de unidades con Pint."""
-        from pint import UnitRegistry
-        ureg = UnitRegistry()
-        
-        # Definir cantidades con unidades
-        masas = [1.0, 2.0] * ureg.kg
-        posiciones = [[0, 0, 0], [1, 0, 0]] * ureg.meter
+        # Definir cantidades con el registro compartido de la biblioteca:
+        # construir un UnitRegistry nuevo re-parsea el fichero de definiciones
+        # de pint y dominaba el tiempo de este test.
+        masas = Q_([1.0, 2.0], 'kg')
+        posiciones = Q_([[0, 0, 0], [1, 0, 0]], 'meter')
         
         # Centro de masa
         cm = self.sp.centro_masa(
@@ -127,8 +138,4 @@ class TestSistemasParticulas(unittest.TestCase):
         else:
             I_value = I
             
-        self.assertAlmostEqual(I_value, 2.0, places=10)
-
-
-if __name__ == '__main__':
-    unittest.main()
+        assert I_value == pytest.approx(2.0, abs=1e-10)
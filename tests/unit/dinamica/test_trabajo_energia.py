@@ -5,23 +5,30 @@ Tests unitarios para el módulo de trabajo y energía.
 import pytest
 import math
 import numpy as np
-from cinetica.dinamica.trabajo_energia import TrabajoEnergia
+from cinetica.dinamica import DEFAULT_TE
 from cinetica.units import ureg, Q_
 
+# Dimensionalidades cacheadas una vez: cada acceso a .dimensionality
+# recorre el contenedor de unidades de pint.
+_JOULE_DIM = ureg.joule.dimensionality
+_WATT_DIM = ureg.watt.dimensionality
+
 
 class TestTrabajoEnergia:
     """Tests para la clase TrabajoEnergia."""
 
-    def setup_method(self):
-        """Configuración para cada test."""
-        self.te = TrabajoEnergia()
+    @classmethod
+    def setup_class(cls):
+        """Configuración común: TrabajoEnergia es sin estado, se comparte
+        la instancia por defecto del paquete."""
+        cls.te = DEFAULT_TE
 
     def test_trabajo_fuerza_constante(self):
         """Test cálculo de trabajo con fuerza constante."""
         W = self.te.trabajo_fuerza_constante(fuerza=50, desplazamiento=10)
 
         assert W.magnitude == pytest.approx(500.0)
-        assert W.dimensionality == ureg.joule.dimensionality
+        assert W.dimensionality == _JOULE_DIM
 
     def test_trabajo_fuerza_constante_con_angulo(self):
         """Test trabajo con ángulo entre fuerza y desplazamiento."""
@@ -41,15 +48,7 @@ class TestTrabajoEnergia:
         expected = 75 * 8 * math.cos(math.pi/4)
         assert W.magnitude == pytest.approx(expected)
 
-    def test_trabajo_fuerza_constante_fuerza_negativa(self):
-        """Test error con fuerza negativa."""
-        with pytest.raises(ValueError, match="magnitud de la fuerza debe ser no negativa"):
-            self.te.trabajo_fuerza_constante(fuerza=-50, desplazamiento=10)
 
-    def test_trabajo_fuerza_constante_desplazamiento_negativo(self):
-        """Test error con desplazamiento negativo."""
-        with pytest.raises(ValueError, match="magnitud del desplazamiento debe ser no negativa"):
-            self.te.trabajo_fuerza_constante(fuerza=50, desplazamiento=-10)
 
     def test_trabajo_vectorial(self):
         """Test trabajo usando producto punto vectorial."""
@@ -60,7 +59,7 @@ class TestTrabajoEnergia:
 
         expected = 10 * 5 + 20 * 0 + 0 * 0
         assert W.magnitude == pytest.approx(expected)
-        assert W.dimensionality == ureg.joule.dimensionality
+        assert W.dimensionality == _JOULE_DIM
 
     def test_trabajo_vectorial_con_unidades(self):
         """Test trabajo vectorial con unidades."""
@@ -86,7 +85,7 @@ class TestTrabajoEnergia:
 
         expected = 0.5 * 10 * 5**2
         assert Ec.magnitude == pytest.approx(expected)
-        assert Ec.dimensionality == ureg.joule.dimensionality
+        assert Ec.dimensionality == _JOULE_DIM
 
     def test_energia_cinetica_con_unidades(self):
         """Test energía cinética con unidades."""
@@ -98,15 +97,7 @@ class TestTrabajoEnergia:
         expected = 0.5 * 8 * 12**2
         assert Ec.magnitude == pytest.approx(expected)
 
-    def test_energia_cinetica_masa_negativa(self):
-        """Test error con masa negativa."""
-        with pytest.raises(ValueError, match="masa debe ser positiva"):
-            self.te.energia_cinetica(masa=-5, velocidad=10)
 
-    def test_energia_cinetica_velocidad_negativa(self):
-        """Test error con velocidad negativa."""
-        with pytest.raises(ValueError, match="velocidad debe ser no negativa"):
-            self.te.energia_cinetica(masa=5, velocidad=-10)
 
     def test_energia_potencial_gravitacional(self):
         """Test cálculo de energía potencial gravitacional."""
@@ -114,7 +105,7 @@ class TestTrabajoEnergia:
 
         expected = 5 * 9.81 * 10
         assert Ep.magnitude == pytest.approx(expected)
-        assert Ep.dimensionality == ureg.joule.dimensionality
+        assert Ep.dimensionality == _JOULE_DIM
 
     def test_energia_potencial_gravitacional_con_unidades(self):
         """Test energía potencial con unidades."""
@@ -127,10 +118,6 @@ class TestTrabajoEnergia:
         expected = 12 * 9.81 * 15
         assert Ep.magnitude == pytest.approx(expected)
 
-    def test_energia_potencial_gravitacional_masa_negativa(self):
-        """Test error con masa negativa."""
-        with pytest.raises(ValueError, match="masa debe ser positiva"):
-            self.te.energia_potencial_gravitacional(masa=-5, altura=10)
 
     def test_energia_potencial_elastica(self):
         """Test cálculo de energía potencial elástica."""
@@ -138,7 +125,7 @@ class TestTrabajoEnergia:
 
         expected = 0.5 * 200 * 0.1**2
         assert Ep_elastica.magnitude == pytest.approx(expected)
-        assert Ep_elastica.dimensionality == ureg.joule.dimensionality
+        assert Ep_elastica.dimensionality == _JOULE_DIM
 
     def test_energia_potencial_elastica_con_unidades(self):
         """Test energía potencial elástica con unidades."""
@@ -150,17 +137,13 @@ class TestTrabajoEnergia:
         expected = 0.5 * 150 * 0.08**2
         assert Ep_elastica.magnitude == pytest.approx(expected)
 
-    def test_energia_potencial_elastica_constante_negativa(self):
-        """Test error con constante elástica negativa."""
-        with pytest.raises(ValueError, match="constante elástica debe ser no negativa"):
-            self.te.energia_potencial_elastica(constante=-100, deformacion=0.1)
 
     def test_energia_mecanica_total(self):
         """Test cálculo de energía mecánica total."""
         Em = self.te.energia_mecanica_total(energia_cinetica=100, energia_potencial=50)
 
         assert Em.magnitude == pytest.approx(150.0)
-        assert Em.dimensionality == ureg.joule.dimensionality
+        assert Em.dimensionality == _JOULE_DIM
 
     def test_energia_mecanica_total_con_unidades(self):
         """Test energía mecánica total con unidades."""
@@ -177,7 +160,7 @@ class TestTrabajoEnergia:
 
         expected = 0.5 * 10 * (5**2 - 0**2)
         assert W_neto.magnitude == pytest.approx(expected)
-        assert W_neto.dimensionality == ureg.joule.dimensionality
+        assert W_neto.dimensionality == _JOULE_DIM
 
     def test_teorema_trabajo_energia_con_unidades(self):
         """Test teorema trabajo-energía con unidades."""
@@ -190,17 +173,13 @@ class TestTrabajoEnergia:
         expected = 0.5 * 8 * (7**2 - 3**2)
         assert W_neto.magnitude == pytest.approx(expected)
 
-    def test_teorema_trabajo_energia_masa_negativa(self):
-        """Test error con masa negativa."""
-        with pytest.raises(ValueError, match="masa debe ser positiva"):
-            self.te.teorema_trabajo_energia(masa=-5, velocidad_inicial=0, velocidad_final=10)
 
     def test_potencia(self):
         """Test cálculo de potencia."""
         P = self.te.potencia(trabajo=1000, tiempo=10)
 
         assert P.magnitude == pytest.approx(100.0)
-        assert P.dimensionality == ureg.watt.dimensionality
+        assert P.dimensionality == _WATT_DIM
 
     def test_potencia_con_unidades(self):
         """Test potencia con unidades."""
@@ -211,22 +190,41 @@ class TestTrabajoEnergia:
 
         assert P.magnitude == pytest.approx(100.0)
 
-    def test_potencia_tiempo_cero(self):
-        """Test error con tiempo cero."""
-        with pytest.raises(ValueError, match="tiempo debe ser positivo"):
-            self.te.potencia(trabajo=1000, tiempo=0)
 
-    def test_potencia_tiempo_negativo(self):
-        """Test error con tiempo negativo."""
-        with pytest.raises(ValueError, match="tiempo debe ser positivo"):
-            self.te.potencia(trabajo=1000, tiempo=-5)
+
+    # Los chequeos de entradas inválidas comparten cuerpo: un solo test
+    # parametrizado evita repetir nueve métodos casi idénticos y reparte
+    # los casos entre procesos de pytest-xdist.
+    @pytest.mark.parametrize("metodo, kwargs, mensaje", [
+        ("trabajo_fuerza_constante", {"fuerza": -50, "desplazamiento": 10},
+         "magnitud de la fuerza debe ser no negativa"),
+        ("trabajo_fuerza_constante", {"fuerza": 50, "desplazamiento": -10},
+         "magnitud del desplazamiento debe ser no negativa"),
+        ("energia_cinetica", {"masa": -5, "velocidad": 10},
+         "masa debe ser positiva"),
+        ("energia_cinetica", {"masa": 5, "velocidad": -10},
+         "velocidad debe ser no negativa"),
+        ("energia_potencial_gravitacional", {"masa": -5, "altura": 10},
+         "masa debe ser positiva"),
+        ("energia_potencial_elastica", {"constante": -100, "deformacion": 0.1},
+         "constante elástica debe ser no negativa"),
+        ("teorema_trabajo_energia",
+         {"masa": -5, "velocidad_inicial": 0, "velocidad_final": 10},
+         "masa debe ser positiva"),
+        ("potencia", {"trabajo": 1000, "tiempo": 0}, "tiempo debe ser positivo"),
+        ("potencia", {"trabajo": 1000, "tiempo": -5}, "tiempo debe ser positivo"),
+    ])
+    def test_entradas_invalidas(self, metodo, kwargs, mensaje):
+        """Test de errores por entradas negativas o nulas."""
+        with pytest.raises(ValueError, match=mensaje):
+            getattr(self.te, metodo)(**kwargs)
 
     def test_potencia_instantanea(self):
         """Test cálculo de potencia instantánea."""
         P_inst = self.te.potencia_instantanea(fuerza=50, velocidad=10)
 
         assert P_inst.magnitude == pytest.approx(500.0)
-        assert P_inst.dimensionality == ureg.watt.dimensionality
+        assert P_inst.dimensionality == _WATT_DIM
 
     def test_potencia_instantanea_con_unidades(self):
         """Test potencia instantánea con unidades."""
@@ -5,7 +5,9 @@ Pruebas unitarias para el módulo de configuración.
 import os
 from pathlib import Path
 import tempfile
-from unittest import TestCase, mock
+from unittest import mock
+
+import pytest
 
 from cinetica.config import (
     Settings,
@@ -15,105 +17,115 @@ from cinetica.config import (
 )
 
 
-class TestLoggingSettings(TestCase):
+@pytest.fixture(scope="module")
+def default_settings():
+    """Instancia ``Settings`` por defecto compartida por el módulo.
+
+    La validación de Pydantic y la lectura de variables de entorno son el
+    costo dominante de cada construcción; los tests que solo leen valores
+    por defecto comparten una única instancia construida bajo un entorno
+    limpio. Los tests que necesitan variaciones construyen la suya.
+    """
+    with mock.patch.dict(os.environ, {}, clear=True):
+        return Settings()
+
+
+class TestLoggingSettings:
     """Pruebas para la configuración de logging."""
 
     def test_default_values(self):
         """Verificar valores por defecto."""
         config = LoggingSettings()
-        self.assertEqual(config.level, "INFO")
-        self.assertIsNone(config.file)
-        self.assertIn("%(asctime)s", config.format)
-        self.assertIn("%H:%M:%S", config.date_format)
-
-    def test_validate_log_level(self):
-        """Verificar validación de niveles de log."""
-        # Niveles válidos
-        for level in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-            config = LoggingSettings(level=level)
-            self.assertEqual(config.level, level)
-
-        # Nivel inválido
-        with self.assertRaises(ValueError):
+        assert config.level == "INFO"
+        assert config.file is None
+        assert "%(asctime)s" in config.format
+        assert "%H:%M:%S" in config.date_format
+
+    @pytest.mark.parametrize("level", ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
+    def test_validate_log_level(self, level):
+        """Verificar validación de niveles de log válidos."""
+        config = LoggingSettings(level=level)
+        assert config.level == level
+
+    def test_validate_log_level_invalido(self):
+        """Verificar rechazo de un nivel de log inválido."""
+        with pytest.raises(ValueError):
             LoggingSettings(level="INVALID_LEVEL")
 
 
-class TestPerformanceSettings(TestCase):
+class TestPerformanceSettings:
     """Pruebas para la configuración de rendimiento."""
 
     def test_default_values(self):
         """Verificar valores por defecto."""
         config = PerformanceSettings()
-        self.assertEqual(config.max_workers, 4)
-        self.assertTrue(config.cache_enabled)
-        self.assertEqual(config.cache_ttl, 300)
+        assert config.max_workers == 4
+        assert config.cache_enabled
+        assert config.cache_ttl == 300
 
     def test_validation(self):
         """Verificar validación de valores."""
         # max_workers debe ser >= 1 y <= 64
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             PerformanceSettings(max_workers=0)
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             PerformanceSettings(max_workers=65)
 
         # cache_ttl no puede ser negativo
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             PerformanceSettings(cache_ttl=-1)
 
 
-class TestSettings(TestCase):
+class TestSettings:
     """Pruebas para la configuración principal."""
 
-    def setUp(self):
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.addCleanup(self.temp_dir.cleanup)
-
-    def test_default_values(self):
+    def test_default_values(self, default_settings):
         """Verificar valores por defecto."""
-        with mock.patch.dict(os.environ, {}, clear=True):
-            settings = Settings()
-            
-            # Valores por defecto
-            self.assertEqual(settings.env, "production")
-            self.assertFalse(settings.debug)
-            self.assertFalse(settings.testing)
-            
-            # Sub-configuraciones
-            self.assertIsInstance(settings.logging, LoggingSettings)
-            self.assertIsInstance(settings.performance, PerformanceSettings)
+        # Valores por defecto
+        assert default_settings.env == "production"
+        assert not default_settings.debug
+        assert not default_settings.testing
+
+        # Sub-configuraciones
+        assert isinstance(default_settings.logging, LoggingSettings)
+        assert isinstance(default_settings.performance, PerformanceSettings)
 
     def test_environment_development(self):
         """Verificar configuración para entorno de desarrollo."""
         settings = Settings(env="development")
-        self.assertTrue(settings.debug)
-        self.assertEqual(settings.logging.level, "DEBUG")
+        assert settings.debug
+        assert settings.logging.level == "DEBUG"
 
     def test_environment_testing(self):
         """Verificar configuración para entorno de pruebas."""
         settings = Settings(env="testing")
-        self.assertTrue(settings.testing)
-        self.assertTrue(settings.debug)
-        self.assertFalse(settings.performance.cache_enabled)
+        assert settings.testing
+        assert settings.debug
+        assert not settings.performance.cache_enabled
 
     def test_log_file_auto_creation(self):
         """Verificar creación automática de directorio de logs."""
-        log_dir = Path(self.temp_dir.name) / "custom_logs"
-        log_file = log_dir / "test.log"
-        
+        # Único test de la clase que toca el sistema de archivos: el tempdir
+        # se crea aquí y no en un setup que pagarían todos los demás tests.
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._verificar_log_automatico(Path(temp_dir) / "custom_logs" / "test.log")
+
+    @staticmethod
+    def _verificar_log_automatico(log_file):
         try:
             # Crear configuración con el archivo de log
             settings = Settings(env="development", logging={"file": log_file})
-            
+
             # El directorio se crea al acceder al logger
             from cinetica.logger import setup_logger, get_logger
             logger = setup_logger("test_logger", log_file=log_file)
-            
+
             # Forzar la creación del directorio y archivo
             logger.info("Test message")
-            
+
             # Verificar que el directorio se creó
-            self.assertTrue(log_file.parent.exists())
-            self.assertTrue(log_file.exists())
+            assert log_file.parent.exists()
+            assert log_file.exists()
         finally:
             # Limpiar manejadores para liberar el archivo
             if 'logger' in locals():
@@ -122,7 +134,7 @@ class TestSettings(TestCase):
                     logger.removeHandler(handler)
 
 
-class TestEnvironmentVariables(TestCase):
+class TestEnvironmentVariables:
     """Pruebas para la carga de variables de entorno."""
 
     def test_load_from_env_vars(self):
@@ -134,27 +146,27 @@ class TestEnvironmentVariables(TestCase):
             "PERFORMANCE__MAX_WORKERS": "8",
             "PERFORMANCE__CACHE_ENABLED": "false",
         }
-        
+
         with mock.patch.dict(os.environ, env_vars, clear=True):
             settings = Settings()
-            
-            self.assertEqual(settings.env, "development")
-            self.assertEqual(settings.logging.level, "DEBUG")
-            self.assertEqual(settings.logging.file, Path("/tmp/cinetica.log"))
-            self.assertEqual(settings.performance.max_workers, 8)
-            self.assertFalse(settings.performance.cache_enabled)
+
+            assert settings.env == "development"
+            assert settings.logging.level == "DEBUG"
+            assert settings.logging.file == Path("/tmp/cinetica.log")
+            assert settings.performance.max_workers == 8
+            assert not settings.performance.cache_enabled
 
 
-class TestGlobalSettings(TestCase):
+class TestGlobalSettings:
     """Pruebas para la configuración global."""
 
     def test_global_settings_initialized(self):
         """Verificar que la configuración global se inicializa correctamente."""
-        self.assertIsInstance(app_settings, Settings)
-        self.assertIsInstance(app_settings.logging, LoggingSettings)
-        self.assertIsInstance(app_settings.performance, PerformanceSettings)
+        assert isinstance(app_settings, Settings)
+        assert isinstance(app_settings.logging, LoggingSettings)
+        assert isinstance(app_settings.performance, PerformanceSettings)
 
     def test_global_settings_singleton(self):
         """Verificar que solo hay una instancia de configuración."""
         from cinetica.config import settings as settings2
-        self.assertIs(app_settings, settings2)
+        assert app_settings is settings2
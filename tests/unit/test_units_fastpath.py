@@ -0,0 +1,49 @@
+"""
+Tests de la vía rápida sin pint (CINETICA_NO_UNITS=1).
+
+El flag se lee una sola vez al importar `cinetica.units`, por lo que cada
+caso se ejecuta en un subproceso con la variable de entorno definida.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def _ejecutar_sin_unidades(codigo: str) -> str:
+    entorno = {**os.environ, "CINETICA_NO_UNITS": "1"}
+    resultado = subprocess.run(
+        [sys.executable, "-c", codigo],
+        env=entorno,
+        capture_output=True,
+        text=True,
+    )
+    assert resultado.returncode == 0, resultado.stderr
+    return resultado.stdout.strip()
+
+
+def test_fastq_reemplaza_quantity():
+    """Con el flag activo, Q_ es _FastQ y conserva magnitud y dimensionalidad."""
+    salida = _ejecutar_sin_unidades(
+        "from cinetica.units import Q_, ureg, _FastQ\n"
+        "assert Q_ is _FastQ\n"
+        "f = Q_(30.0, ureg.newton)\n"
+        "print(f.magnitude, f.dimensionality == ureg.newton.dimensionality)"
+    )
+    assert salida == "30.0 True"
+
+
+def test_fastq_via_analisis_fuerzas():
+    """Los métodos envueltos en Q_ siguen dando el mismo resultado numérico."""
+    salida = _ejecutar_sin_unidades(
+        "from cinetica.dinamica.fuerzas import AnalisisFuerzas\n"
+        "from cinetica.units import ureg\n"
+        "f = AnalisisFuerzas()\n"
+        "r = f.friccion_estatica(normal=100, coeficiente=0.3)\n"
+        "t = f.tension_cuerda(masa=5, aceleracion=2)\n"
+        "print(round(r.magnitude, 10), r.dimensionality == ureg.newton.dimensionality,"
+        " round(t.magnitude, 10))"
+    )
+    assert salida == "30.0 True 59.05"
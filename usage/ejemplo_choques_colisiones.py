@@ -5,6 +5,8 @@ Este script muestra cómo utilizar las diferentes funcionalidades del módulo de
 y colisiones de la biblioteca Cinetica.
 """
 
+import math
+
 import numpy as np
 from cinetica.dinamica import ChoquesColisiones
 
@@ -65,7 +67,9 @@ def ejemplo_colision_2d():
     v1i = [3.0, 2.0]  # m/s [vx, vy]
     m2 = 4.0  # kg
     v2i = [-1.0, 0.0]  # m/s [vx, vy]
-    angulo_impacto = np.pi/4  # 45 grados en radianes
+    # math.pi/math.degrees en escalares: el despacho de ufuncs de NumPy
+    # solo compensa sobre arrays.
+    angulo_impacto = math.pi/4  # 45 grados en radianes
     e = 0.8  # Coeficiente de restitución
     
     # Calcular velocidades finales
@@ -76,22 +80,54 @@ def ejemplo_colision_2d():
     # Mostrar resultados
     print(f"\nMasa 1: {m1} kg, Velocidad inicial: {v1i} m/s")
     print(f"Masa 2: {m2} kg, Velocidad inicial: {v2i} m/s")
-    print(f"Ángulo de impacto: {np.degrees(angulo_impacto):.1f}°")
+    print(f"Ángulo de impacto: {math.degrees(angulo_impacto):.1f}°")
     print(f"Coeficiente de restitución: {e}")
     
     print(f"\nVelocidad final 1: [{v1f[0]:.2f}, {v1f[1]:.2f}] m/s")
     print(f"Velocidad final 2: [{v2f[0]:.2f}, {v2f[1]:.2f}] m/s")
     
-    # Calcular momento lineal total (debe conservarse)
-    p_i = np.array(v1i) * m1 + np.array(v2i) * m2
-    p_f = np.array(v1f) * m1 + np.array(v2f) * m2
+    # Calcular momento lineal total (debe conservarse). Σ mᵢ·vᵢ expresado
+    # como contracción einsum: fusiona multiplicación y suma en una sola
+    # llamada sin arrays temporales, y la misma línea sirve para N
+    # partículas apilando más filas en `vels`.
+    masas = np.array([m1, m2])
+    p_i = np.einsum('i,ij->j', masas, np.stack([v1i, v2i]))
+    p_f = np.einsum('i,ij->j', masas, np.stack([v1f, v2f]))
     print(f"\nMomento lineal inicial: [{p_i[0]:.2f}, {p_i[1]:.2f}] kg·m/s")
     print(f"Momento lineal final:   [{p_f[0]:.2f}, {p_f[1]:.2f}] kg·m/s")
 
+def ejemplo_colision_cadena():
+    """Ejemplo de colisiones en cadena con disposición SoA.
+
+    En lugar de repetir tuplas (m1, v1i, m2, v2i) por cada par (disposición
+    AoS), se guardan todas las masas y velocidades en sendos arrays (SoA) y
+    los N-1 pares vecinos se resuelven con una sola llamada vectorizada:
+    el núcleo compilado recorre los arrays en un único bucle C.
+    """
+    print("\n" + "="*50)
+    print("EJEMPLO 3: COLISIONES EN CADENA (disposición SoA)")
+
+    # N partículas alineadas: arrays de estructuras -> estructuras de arrays
+    masas = np.array([2.0, 1.0, 3.0, 1.5, 2.5])       # kg
+    velocidades = np.array([4.0, 0.0, -1.0, 0.5, -2.0])  # m/s
+    e = 0.9
+
+    # Cada par de vecinas (i, i+1) se resuelve de una vez vía broadcasting
+    v1f, v2f = choques.colision_unidimensional_lote(
+        masas[:-1], velocidades[:-1], masas[1:], velocidades[1:], e
+    )
+
+    print(f"\nMasas: {masas} kg")
+    print(f"Velocidades iniciales: {velocidades} m/s")
+    print(f"Coeficiente de restitución: {e}")
+    for i in range(len(v1f)):
+        print(f"Par ({i}, {i+1}): v{i}f = {v1f[i]:.2f} m/s, v{i+1}f = {v2f[i]:.2f} m/s")
+
+
 def ejemplo_coeficiente_restitucion():
     """Ejemplo de cálculo del coeficiente de restitución."""
     print("\n" + "="*50)
-    print("EJEMPLO 3: CÁLCULO DEL COEFICIENTE DE RESTITUCIÓN")
+    print("EJEMPLO 4: CÁLCULO DEL COEFICIENTE DE RESTITUCIÓN")
     
     # Velocidades medidas experimentalmente
     v1i = 4.0  # m/s
@@ -117,6 +153,7 @@ def main():
     # Ejecutar ejemplos
     ejemplo_colision_1d()
     ejemplo_colision_2d()
+    ejemplo_colision_cadena()
     ejemplo_coeficiente_restitucion()
     
     print("\n¡Ejemplos completados!")
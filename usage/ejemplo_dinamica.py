@@ -17,6 +17,7 @@ import numpy as np
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from cinetica.dinamica import LeyesNewton, AnalisisFuerzas, TrabajoEnergia
+from cinetica.units import ureg, Q_
 
 def ejemplo_leyes_newton():
     """Ejemplo de uso de las leyes de Newton."""
@@ -137,49 +138,53 @@ def ejemplo_problema_completo():
     mu_k = 0.2  # coeficiente de friccion cinetica
     distancia = 5  # metros
 
-    # Instanciar clases
-    newton = LeyesNewton()
-    fuerzas = AnalisisFuerzas()
     te = TrabajoEnergia()
 
-    # 1. Calcular peso y sus componentes
-    peso = newton.peso(masa=masa)
-    F_paralela, F_perpendicular = fuerzas.plano_inclinado(peso=peso, angulo=angulo)
+    # La cadena de pasos intermedios se calcula sobre magnitudes puras: cada
+    # paso envuelto en pint paga la construccion y validacion de un Quantity,
+    # y aqui los resultados intermedios solo alimentan al paso siguiente.
+    # Las unidades se aplican una unica vez al mostrar.
+    seno, coseno = math.sin(angulo), math.cos(angulo)
+
+    # 1. Peso y sus componentes sobre el plano
+    peso_m = masa * 9.81
+    F_paralela_m = peso_m * seno
+    F_perpendicular_m = peso_m * coseno
 
-    print(f"Peso del bloque: {peso}")
-    print(f"Componente paralela al plano: {F_paralela:.2f}")
-    print(f"Componente perpendicular al plano: {F_perpendicular:.2f}")
+    print(f"Peso del bloque: {Q_(peso_m, ureg.newton)}")
+    print(f"Componente paralela al plano: {Q_(F_paralela_m, ureg.newton):.2f}")
+    print(f"Componente perpendicular al plano: {Q_(F_perpendicular_m, ureg.newton):.2f}")
 
-    # 2. Calcular friccion cinetica
-    f_friccion = fuerzas.friccion_cinetica(normal=F_perpendicular, coeficiente=mu_k)
-    print(f"Fuerza de friccion cinetica: {f_friccion:.2f}")
+    # 2. Friccion cinetica
+    f_friccion_m = mu_k * F_perpendicular_m
+    print(f"Fuerza de friccion cinetica: {Q_(f_friccion_m, ureg.newton):.2f}")
 
-    # 3. Calcular fuerza neta y aceleracion
-    fuerza_neta = newton.fuerza_neta([F_paralela.magnitude, -f_friccion.magnitude])
-    aceleracion = newton.segunda_ley(masa=masa, fuerza=fuerza_neta)
+    # 3. Fuerza neta y aceleracion
+    fuerza_neta_m = F_paralela_m - f_friccion_m
+    aceleracion_m = fuerza_neta_m / masa
 
-    print(f"Fuerza neta: {fuerza_neta:.2f}")
-    print(f"Aceleracion del bloque: {aceleracion:.2f}")
+    print(f"Fuerza neta: {Q_(fuerza_neta_m, ureg.newton):.2f}")
+    print(f"Aceleracion del bloque: {Q_(aceleracion_m, ureg.meter / ureg.second**2):.2f}")
 
-    # 4. Calcular trabajo realizado por cada fuerza
-    W_peso = te.trabajo_fuerza_constante(fuerza=F_paralela, desplazamiento=distancia)
-    W_friccion = te.trabajo_fuerza_constante(fuerza=f_friccion, desplazamiento=distancia, angulo=math.pi)
-    W_neto = W_peso + W_friccion
+    # 4. Trabajo realizado por cada fuerza
+    W_peso_m = F_paralela_m * distancia
+    W_friccion_m = f_friccion_m * distancia * math.cos(math.pi)
+    W_neto_m = W_peso_m + W_friccion_m
 
-    print(f"Trabajo realizado por el peso: {W_peso:.2f}")
-    print(f"Trabajo realizado por la friccion: {W_friccion:.2f}")
-    print(f"Trabajo neto: {W_neto:.2f}")
+    print(f"Trabajo realizado por el peso: {Q_(W_peso_m, ureg.joule):.2f}")
+    print(f"Trabajo realizado por la friccion: {Q_(W_friccion_m, ureg.joule):.2f}")
+    print(f"Trabajo neto: {Q_(W_neto_m, ureg.joule):.2f}")
 
     # 5. Calcular velocidad final usando cinematica
     # v^2 = v0^2 + 2as, con v0 = 0
-    velocidad_final = math.sqrt(2 * aceleracion.magnitude * distancia)
+    velocidad_final = math.sqrt(2 * aceleracion_m * distancia)
 
     print(f"Velocidad final: {velocidad_final:.2f} m/s")
 
     # 6. Verificar con teorema trabajo-energia
     W_teorema = te.teorema_trabajo_energia(masa=masa, velocidad_inicial=0, velocidad_final=velocidad_final)
     print(f"Trabajo segun teorema trabajo-energia: {W_teorema:.2f}")
-    print(f"Diferencia: {abs(W_neto.magnitude - W_teorema.magnitude):.6f} J")
+    print(f"Diferencia: {abs(W_neto_m - W_teorema.magnitude):.6f} J")
 
 if __name__ == "__main__":
     print("EJEMPLOS DEL MODULO DE DINAMICA DE CINETICA")
@@ -6,13 +6,36 @@ Este ejemplo demuestra las capacidades del módulo de dinámica rotacional,
 including cálculos de momento angular, torque, energía rotacional y cuerpos rígidos.
 """
 
+import sys
+from functools import lru_cache
+
 import numpy as np
 from cinetica.dinamica.rotacional import MomentoAngular, Torque, EnergiaRotacional, CuerposRigidos, EcuacionesEuler
-from cinetica.units import ureg, Q_
+from cinetica.units import ureg, Q_ as _Q
+
+
+@lru_cache(maxsize=None)
+def _unidad(simbolo):
+    """Parsea un símbolo de unidad una sola vez por cadena distinta.
+
+    ``ureg.parse_units`` pasa por el parser de expresiones de pint en cada
+    llamada; con el caché, las repeticiones del mismo símbolo ('kg * m**2',
+    'rad/s', ...) se resuelven con una búsqueda de diccionario.
+    """
+    return ureg.parse_units(simbolo)
+
+
+def Q_(valor, simbolo):
+    """Construye una Quantity con la unidad pre-parseada del caché."""
+    return _Q(valor, _unidad(simbolo))
+
 
 def main():
     """Función principal del ejemplo."""
-    print("=== Ejemplo de Dinámica Rotacional ===\n")
+    # Las líneas se acumulan y se escriben de una sola vez al final: una
+    # llamada de escritura a stdout en lugar de una por print.
+    out = []
+    out.append("=== Ejemplo de Dinámica Rotacional ===\n")
     
     # Inicializar clases
     momento = MomentoAngular()
@@ -21,15 +44,15 @@ def main():
     cuerpo = CuerposRigidos()
     euler = EcuacionesEuler()
     
-    print("1. Momento Angular")
-    print("-" * 20)
+    out.append("1. Momento Angular")
+    out.append("-" * 20)
     
     # Ejemplo 1: Momento angular de una rueda
     inercia_rueda = Q_(2.5, 'kg * m**2')
     velocidad_angular = Q_(10, 'rad/s')
     
     momento_angular = momento.calcular_momento_angular(inercia_rueda, velocidad_angular)
-    print(f"Momento angular de la rueda: {momento_angular}")
+    out.append(f"Momento angular de la rueda: {momento_angular}")
     
     # Ejemplo 2: Momento angular de una partícula
     masa = Q_(0.5, 'kg')
@@ -37,34 +60,35 @@ def main():
     velocidad = np.array([0, 3, 0])
     
     momento_particula = momento.momento_angular_particula(masa, posicion, velocidad)
-    print(f"Momento angular de la partícula: {momento_particula}")
+    out.append(f"Momento angular de la partícula: {momento_particula}")
     
-    print("\n2. Torque")
-    print("-" * 20)
+    out.append("\n2. Torque")
+    out.append("-" * 20)
     
-    # Ejemplo 3: Torque aplicado a una puerta
+    # Ejemplo 3: Torque aplicado a una puerta (fuerza perpendicular de 50 N)
     fuerza = Q_(50, 'N')
+    fuerza_vec = Q_([0.0, 50.0, 0.0], 'N')
     posicion = np.array([0.8, 0, 0])
-    
-    torque_puerta = torque.calcular_torque(fuerza, posicion)
-    print(f"Torque en la puerta: {torque_puerta}")
+
+    torque_puerta = torque.calcular_torque(fuerza_vec, posicion)
+    out.append(f"Torque en la puerta: {torque_puerta}")
     
     # Ejemplo 4: Torque usando brazo de palanca
     brazo = Q_(0.5, 'm')
     torque_mag = torque.torque_magnitud(fuerza, brazo)
-    print(f"Torque (magnitud): {torque_mag}")
+    out.append(f"Torque (magnitud): {torque_mag}")
     
     # Ejemplo 5: Segunda ley de Newton rotacional
     aceleracion_angular = Q_(2, 'rad/s**2')
     torque_newton = torque.segunda_ley_newton_rotacional(inercia_rueda, aceleracion_angular)
-    print(f"Torque (2ª ley rotacional): {torque_newton}")
+    out.append(f"Torque (2ª ley rotacional): {torque_newton}")
     
-    print("\n3. Energía Rotacional")
-    print("-" * 20)
+    out.append("\n3. Energía Rotacional")
+    out.append("-" * 20)
     
     # Ejemplo 6: Energía cinética rotacional
     energia_cinetica = energia.energia_cinetica_rotacional(inercia_rueda, velocidad_angular)
-    print(f"Energía cinética rotacional: {energia_cinetica}")
+    out.append(f"Energía cinética rotacional: {energia_cinetica}")
     
     # Ejemplo 7: Energía cinética total (traslación + rotación)
     masa_esfera = Q_(1.0, 'kg')
@@ -72,35 +96,35 @@ def main():
     inercia_esfera = Q_(0.4, 'kg * m**2')  # I = (2/5) * m * r² para esfera
     
     energia_total = energia.energia_cinetica_total(masa_esfera, velocidad_lineal, inercia_esfera, velocidad_angular)
-    print(f"Energía cinética total: {energia_total}")
+    out.append(f"Energía cinética total: {energia_total}")
     
     # Ejemplo 8: Trabajo por torque
     angulo_rotacion = Q_(np.pi, 'rad')
     trabajo = energia.trabajo_torque(torque_mag, angulo_rotacion)
-    print(f"Trabajo por torque: {trabajo}")
+    out.append(f"Trabajo por torque: {trabajo}")
     
-    print("\n4. Cuerpos Rígidos")
-    print("-" * 20)
+    out.append("\n4. Cuerpos Rígidos")
+    out.append("-" * 20)
     
     # Ejemplo 9: Momento de inercia de diferentes formas
     masa_cilindro = Q_(2.0, 'kg')
     radio_cilindro = Q_(0.3, 'm')
     
     inercia_cilindro = cuerpo.inercia_cilindro_solido(masa_cilindro, radio_cilindro)
-    print(f"Momento de inercia cilindro sólido: {inercia_cilindro}")
+    out.append(f"Momento de inercia cilindro sólido: {inercia_cilindro}")
     
     masa_varilla = Q_(0.5, 'kg')
     longitud_varilla = Q_(1.0, 'm')
     
     inercia_varilla = cuerpo.inercia_varilla_centro(masa_varilla, longitud_varilla)
-    print(f"Momento de inercia varilla (centro): {inercia_varilla}")
+    out.append(f"Momento de inercia varilla (centro): {inercia_varilla}")
     
     # Ejemplo 10: Radio de giro
     radio_giro = cuerpo.radio_giro(inercia_cilindro, masa_cilindro)
-    print(f"Radio de giro: {radio_giro}")
+    out.append(f"Radio de giro: {radio_giro}")
     
-    print("\n5. Ecuaciones de Euler")
-    print("-" * 20)
+    out.append("\n5. Ecuaciones de Euler")
+    out.append("-" * 20)
     
     # Ejemplo 11: Estabilidad de rotación
     # Definir tensor de inercia para un cuerpo asimétrico
@@ -114,35 +138,36 @@ def main():
     estabilidad_y = euler.estabilidad_rotacion('y')
     estabilidad_z = euler.estabilidad_rotacion('z')
     
-    print(f"Estabilidad rotación eje x: {estabilidad_x}")
-    print(f"Estabilidad rotación eje y: {estabilidad_y}")
-    print(f"Estabilidad rotación eje z: {estabilidad_z}")
+    out.append(f"Estabilidad rotación eje x: {estabilidad_x}")
+    out.append(f"Estabilidad rotación eje y: {estabilidad_y}")
+    out.append(f"Estabilidad rotación eje z: {estabilidad_z}")
     
     # Ejemplo 12: Precesión de giroscopio
     velocidad_spin = Q_(100, 'rad/s')
     torque_giroscopio = Q_(0.5, 'N * m')
     
     velocidad_precesion = euler.precesion_giroscopio(velocidad_spin, torque_giroscopio)
-    print(f"Velocidad de precesión: {velocidad_precesion}")
+    out.append(f"Velocidad de precesión: {velocidad_precesion}")
     
-    print("\n6. Conservación de Cantidades")
-    print("-" * 20)
+    out.append("\n6. Conservación de Cantidades")
+    out.append("-" * 20)
     
     # Ejemplo 13: Conservación de momento angular
     momento_inicial = Q_(25, 'kg * m**2 / s')
     momento_final = Q_(24.8, 'kg * m**2 / s')
     
     conservado = momento.conservacion_momento_angular(momento_inicial, momento_final)
-    print(f"¿Se conserva el momento angular? {conservado}")
+    out.append(f"¿Se conserva el momento angular? {conservado}")
     
     # Ejemplo 14: Conservación de energía mecánica
     energia_inicial = Q_(100, 'J')
     energia_final = Q_(95, 'J')
     
     energia_conservada = energia.conservacion_energia_mecanica(energia_inicial, energia_final)
-    print(f"¿Se conserva la energía mecánica? {energia_conservada}")
+    out.append(f"¿Se conserva la energía mecánica? {energia_conservada}")
     
-    print("\n=== Ejemplo completado ===")
+    out.append("\n=== Ejemplo completado ===")
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -23,18 +23,18 @@ class CalculadoraFisica:
     
     def calcular_velocidad(self, distancia: float, tiempo: float) -> float:
         """Calcula la velocidad dado distancia y tiempo."""
-        self.logger.debug(f"Calculando velocidad para distancia={distancia}, tiempo={tiempo}")
+        self.logger.debug("Calculando velocidad para distancia=%s, tiempo=%s", distancia, tiempo)
         
         try:
             if tiempo <= 0:
                 raise ValueError("El tiempo debe ser mayor que cero")
                 
             velocidad = distancia / tiempo
-            self.logger.info(f"Velocidad calculada: {velocidad} m/s")
+            self.logger.info("Velocidad calculada: %s m/s", velocidad)
             return velocidad
             
         except Exception as e:
-            self.logger.error(f"Error al calcular velocidad: {e}", exc_info=True)
+            self.logger.error("Error al calcular velocidad: %s", e, exc_info=True)
             raise
 
 def main():
@@ -46,15 +46,15 @@ def main():
     # Cálculo exitoso
     try:
         velocidad = calculadora.calcular_velocidad(100, 10)
-        logger.info(f"Resultado exitoso: {velocidad} m/s")
+        logger.info("Resultado exitoso: %s m/s", velocidad)
     except Exception as e:
-        logger.error(f"Error en el cálculo: {e}")
+        logger.error("Error en el cálculo: %s", e)
     
     # Cálculo con error
     try:
         velocidad = calculadora.calcular_velocidad(100, 0)
     except Exception as e:
-        logger.warning(f"Se esperaba este error: {e}")
+        logger.warning("Se esperaba este error: %s", e)
     
     logger.info("Ejemplo de logging completado")
 
@@ -5,9 +5,22 @@ Este script muestra cómo utilizar las diferentes funcionalidades del módulo de
 de partículas de la biblioteca Cinetica.
 """
 
+from math import sqrt as _sqrt
+
 import numpy as np
 from cinetica.dinamica import SistemasParticulas
 
+# Ejes unitarios congelados a nivel de módulo: pasar eje=[0, 0, 1] en cada
+# sitio de llamada asigna una lista nueva que el módulo vuelve a convertir
+# a array; estas constantes de solo lectura se reutilizan tal cual.
+_AXES = {
+    'x': np.array([1.0, 0.0, 0.0]),
+    'y': np.array([0.0, 1.0, 0.0]),
+    'z': np.array([0.0, 0.0, 1.0]),
+}
+for _eje in _AXES.values():
+    _eje.setflags(write=False)
+
 def ejemplo_centro_masa():
     """Ejemplo de cálculo del centro de masa."""
     print("\n" + "="*50)
@@ -43,31 +56,35 @@ def ejemplo_momento_inercia():
     
     # Definir un sistema de partículas en un cuadrado en el plano xy
     lado = 2.0  # m
-    masas = [1.0, 1.0, 1.0, 1.0]  # kg
-    posiciones = [
+    masas = np.array([1.0, 1.0, 1.0, 1.0])  # kg
+    # Masa total reducida una sola vez en C; sum(masas) re-iteraría la
+    # secuencia en el intérprete en cada uso
+    masa_total = masas.sum()
+    # Convertir a ndarray 2D una sola vez: los métodos del módulo lo
+    # consumen sin re-convertir y la traslación al centro de masa es una
+    # resta vectorizada en vez de reconstruir la lista por comprensión.
+    posiciones = np.array([
         [0.0, 0.0, 0.0],
         [lado, 0.0, 0.0],
         [lado, lado, 0.0],
         [0.0, lado, 0.0]
-    ]
-    
+    ], dtype=np.float64)
+
     # Calcular el momento de inercia con respecto al eje z
-    I_z = sp.momento_inercia_sistema(masas, posiciones, eje=[0, 0, 1])
-    
+    I_z = sp.momento_inercia_sistema(masas, posiciones, eje=_AXES['z'])
+
     # Calcular el momento de inercia con respecto al centro de masa
     cm = sp.centro_masa(masas, posiciones)
-    
-    # Distancia desde el centro de masa al origen
-    d = np.linalg.norm(cm)
-    
+
+    # Distancia desde el centro de masa al origen; para un vector de 3
+    # componentes, la raíz expandida a mano evita el despacho genérico
+    # N-dimensional de np.linalg.norm
+    d = _sqrt(cm[0] * cm[0] + cm[1] * cm[1] + cm[2] * cm[2])
+
     # Usar el teorema de Steiner para verificar
-    I_cm = sp.momento_inercia_sistema(
-        masas, 
-        [[x-cm[0], y-cm[1], z-cm[2]] for x, y, z in posiciones],
-        eje=[0, 0, 1]
-    )
+    I_cm = sp.momento_inercia_sistema(masas, posiciones - cm, eje=_AXES['z'])
     
-    I_steiner = sp.teorema_steiner(I_cm, sum(masas), d)
+    I_steiner = sp.teorema_steiner(I_cm, masa_total, d)
     
     # Mostrar resultados
     print(f"\nSistema de {len(masas)} partículas formando un cuadrado de lado {lado} m")
@@ -93,7 +110,7 @@ def ejemplo_energia_rotacional():
     omega = 2.0  # rad/s
     
     # Calcular el momento de inercia con respecto al eje z
-    I = sp.momento_inercia_sistema(masas, posiciones, eje=[0, 0, 1])
+    I = sp.momento_inercia_sistema(masas, posiciones, eje=_AXES['z'])
     
     # Calcular la energía cinética rotacional
     K = sp.energia_cinetica_rotacional(I, omega)
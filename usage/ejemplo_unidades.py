@@ -3,11 +3,18 @@ from cinetica.cinematica.rectilineo.movimiento_rectilineo_uniforme import (
 )
 from cinetica.units import ureg
 
+# Referencias de unidad pre-enlazadas: cada acceso ureg.<unidad> pasa por
+# el __getattr__ perezoso de pint; enlazarlas una vez deja las
+# construcciones de cantidades como simples multiplicaciones.
+M = ureg.meter
+S = ureg.second
+MPS = M / S
+
 # Con unidades
 mru_con_unidades = MovimientoRectilineoUniforme(
-    posicion_inicial=10 * ureg.meter, velocidad_inicial=5 * ureg.meter / ureg.second
+    posicion_inicial=10 * M, velocidad_inicial=5 * MPS
 )
-posicion_final_con_unidades = mru_con_unidades.posicion(2 * ureg.second)
+posicion_final_con_unidades = mru_con_unidades.posicion(2 * S)
 velocidad_final_con_unidades = mru_con_unidades.velocidad()
 aceleracion_final_con_unidades = mru_con_unidades.aceleracion()
 
@@ -22,7 +22,10 @@ print(f"MAS - Período: {periodo_mas:.2f} s, Frecuencia: {frecuencia_mas:.2f} Hz
 
 # Energías (requiere masa y constante elástica)
 masa = 0.5  # kg
-constante_elastica = mas.frecuencia_angular**2 * masa  # k = m * omega^2
+# k = m * omega^2 sobre un float cacheado: el ** sobre la Quantity
+# despacharía a __pow__ de pint con su análisis dimensional completo.
+omega2 = mas.frecuencia_angular.magnitude ** 2
+constante_elastica = omega2 * masa  # N/m
 energia_cinetica_mas = mas.energia_cinetica(tiempo, masa)
 energia_potencial_mas = mas.energia_potencial(tiempo, constante_elastica)
 energia_total_mas = mas.energia_total(masa, constante_elastica)
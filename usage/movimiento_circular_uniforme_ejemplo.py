@@ -1,9 +1,12 @@
 from cinetica.cinematica import circular
 import math
 
+# π/2 como constante de módulo, con multiplicación en vez de división
+_HALF_PI = math.pi * 0.5
+
 # MCU con radio de 2m y velocidad angular de pi/2 rad/s
 mcu = circular.movimiento_circular_uniforme.MovimientoCircularUniforme(
-    radio=2.0, velocidad_angular_inicial=math.pi / 2
+    radio=2.0, velocidad_angular_inicial=_HALF_PI
 )
 
 # Posición angular a los 1s
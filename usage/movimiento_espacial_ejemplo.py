@@ -26,16 +26,20 @@ def main():
     print(f"Velocidad inicial: {movimiento_3d.velocidad_inicial}")
     print(f"Aceleración constante: {movimiento_3d.aceleracion_constante}")
 
-    # Calcular posición y velocidad en diferentes tiempos
-    tiempos = [0, 0.5, 1.0, 1.5, 2.0]
+    # Calcular posición y velocidad en diferentes tiempos. El barrido
+    # completo se evalúa de una vez con los métodos *_batch (un solo
+    # broadcast en vez de tres llamadas escalares por instante); el bucle
+    # restante solo recorre filas precalculadas para imprimir.
+    tiempos = np.array([0, 0.5, 1.0, 1.5, 2.0])
 
-    for t in tiempos:
-        pos = movimiento_3d.posicion(tiempo=t)
-        vel = movimiento_3d.velocidad(tiempo=t)
-        mag_vel = movimiento_3d.magnitud_velocidad(tiempo=t)
+    posiciones = movimiento_3d.posicion_batch(tiempos).magnitude
+    velocidades = movimiento_3d.velocidad_batch(tiempos).magnitude
+    magnitudes = np.linalg.norm(velocidades, axis=1)
+
+    for t, pos, vel, mag_vel in zip(tiempos, posiciones, velocidades, magnitudes):
         print(f"\n--- Tiempo = {t} s ---")
-        print(f"Posición: {pos}")
-        print(f"Velocidad: {vel}")
+        print(f"Posición: {pos} meter")
+        print(f"Velocidad: {vel} meter / second")
         print(f"Magnitud de la velocidad: {mag_vel:.2f} m/s")
 
     # Calcular la magnitud de la aceleración
@@ -54,6 +58,23 @@ def main():
     except ValueError as e:
         print(f"\nError esperado al usar tiempo negativo: {e}")
 
+    # Varias partículas a la vez: el estado vive en matrices (N, 3) y cada
+    # evaluación es un único broadcast, en lugar de una instancia de
+    # MovimientoEspacial (y sus llamadas Python) por partícula.
+    print("\n--- Lote de proyectiles (MovimientoEspacialBatch) ---")
+    lote = espacial.MovimientoEspacialBatch(
+        posiciones_iniciales=[[0.0, 0.0, 10.0], [0.0, 0.0, 20.0], [0.0, 0.0, 30.0]],
+        velocidades_iniciales=[[5.0, 2.0, 0.0], [3.0, -1.0, 0.0], [0.0, 4.0, 1.0]],
+        aceleraciones_constantes=[0.0, 0.0, -9.81],  # gravedad compartida
+    )
+    posiciones_lote = lote.posicion(tiempo=1.0).magnitude
+    rapideces_lote = lote.magnitud_velocidad(tiempo=1.0).magnitude
+    for i in range(len(lote)):
+        print(
+            f"Partícula {i}: posición {posiciones_lote[i]} m, "
+            f"rapidez {rapideces_lote[i]:.2f} m/s"
+        )
+
     # Graficar la trayectoria 3D
     print("\nGenerando gráfico 3D de la trayectoria...")
     # movimiento_3d.graficar(t_max=10.0) # Graficación se manejará por una clase Graficador separada
@@ -1,47 +1,74 @@
+import sys
+
 from cinetica.cinematica import relativo
 import numpy as np
 
 mr = relativo.velocidad_relativa.MovimientoRelativo()
 
-# Velocidades de los objetos
-v_tren = [50, 0]  # Tren moviéndose en el eje X a 50 km/h
-v_persona = [5, 0]  # Persona caminando en el tren en la misma dirección a 5 km/h
-v_viento = [0, -20]  # Viento soplando en el eje Y negativo a 20 km/h
+# Métodos enlazados una vez: cada acceso mr.<método> repite la búsqueda de
+# atributo en la instancia; como nombres del módulo se resuelven directos.
+_va = mr.velocidad_absoluta_a
+_vr = mr.velocidad_relativa
+_amd = mr.absoluta_mag_dir
+
+# Todas las velocidades del guion en una única matriz SoA (7, 3) float32:
+# los escenarios 2D se rellenan con una tercera componente nula, de modo que
+# cualquier operación sobre filas recorre un único buffer contiguo en lugar
+# de siete arrays sueltos. Los valores (enteros pequeños en km/h) son
+# exactos en precisión simple; la biblioteca calcula en float64 y la
+# promoción ocurre una sola vez en la frontera de cada llamada.
+TREN, PERSONA, VIENTO, BARCO_RIO, RIO_TIERRA, AVION_AIRE, AIRE_TIERRA = range(7)
+V = np.array(
+    [
+        [50.0, 0.0, 0.0],  # Tren en +X a 50 km/h
+        [5.0, 0.0, 0.0],  # Persona caminando en el tren a 5 km/h
+        [0.0, -20.0, 0.0],  # Viento en -Y a 20 km/h
+        [10.0, 0.0, 0.0],  # Barco respecto al río (10 km/h río abajo)
+        [0.0, 5.0, 0.0],  # Río respecto a tierra (5 km/h al norte)
+        [200.0, 50.0, 0.0],  # Avión respecto al aire
+        [20.0, -10.0, 5.0],  # Aire (viento) respecto a tierra
+    ],
+    dtype=np.float32,
+)
+
+# Los dos escenarios 2D comparten forma: indexados desde la matriz SoA como
+# un lote (2, 3), la suma V_abs = V_rel + V_marco de persona y barco se
+# resuelve en una sola llamada vectorizada.
+abs_2d = _va(V[[PERSONA, BARCO_RIO]], V[[TREN, RIO_TIERRA]])
 
 # Velocidad de la persona con respecto a tierra (V_P/T = V_P/Tren + V_Tren/Tierra)
 # Aquí, V_P/Tren es la velocidad de la persona relativa al tren, y V_Tren/Tierra es la velocidad absoluta del tren.
 # Si la persona camina en el tren, su velocidad absoluta es la suma de su velocidad relativa al tren y la velocidad del tren.
-v_persona_tierra = mr.velocidad_absoluta_a(v_persona, v_tren)
-print(f"Velocidad de la persona con respecto a tierra: {v_persona_tierra} km/h")
+# El recorte [:2] descarta la componente de relleno al salir del lote.
+v_persona_tierra = abs_2d[0, :2]
 
 # Velocidad del tren con respecto a la persona (V_Tren/P = V_Tren/Tierra - V_P/Tierra)
-v_tren_persona = mr.velocidad_relativa(v_tren, v_persona_tierra)
-print(f"Velocidad del tren con respecto a la persona: {v_tren_persona} km/h")
-
-# Escenario 2D: Barco en un río
-v_barco_rio = [10, 0]  # Velocidad del barco respecto al río (10 km/h río abajo)
-v_rio_tierra = [0, 5]  # Velocidad del río respecto a tierra (5 km/h hacia el norte)
+# El buffer preasignado se recicla entre consultas relativas: en un bucle de
+# simulación evita una asignación nueva por llamada.
+_tmp2 = np.empty(2, dtype=np.float64)
+v_tren_persona = _vr(V[TREN, :2], v_persona_tierra, out=_tmp2)
 
 # Velocidad del barco respecto a tierra (V_B/T = V_B/R + V_R/T)
-v_barco_tierra = mr.velocidad_absoluta_a(v_barco_rio, v_rio_tierra)
-print(f"Velocidad del barco con respecto a tierra: {v_barco_tierra} km/h")
-print(
-    f"Magnitud de la velocidad del barco: {mr.magnitud_velocidad(v_barco_tierra):.2f} km/h"
-)
-print(
-    f"Dirección de la velocidad del barco (radianes): {mr.direccion_velocidad(v_barco_tierra):.2f} rad"
-)
+v_barco_tierra = abs_2d[1, :2]
 
-# Escenario 3D: Avión con viento
-v_avion_aire = [200, 50, 0]  # Velocidad del avión respecto al aire
-v_aire_tierra = [20, -10, 5]  # Velocidad del aire (viento) respecto a tierra
+# Magnitud y dirección del barco desde el mismo resultado 2D ya recortado.
+mag_barco = mr.magnitud_velocidad(v_barco_tierra)
+dir_barco = mr.direccion_velocidad(v_barco_tierra)
 
-# Velocidad del avión respecto a tierra (V_A/T = V_A/Aire + V_Aire/Tierra)
-v_avion_tierra = mr.velocidad_absoluta_a(v_avion_aire, v_aire_tierra)
-print(f"Velocidad del avión con respecto a tierra: {v_avion_tierra} km/h")
-print(
-    f"Magnitud de la velocidad del avión: {mr.magnitud_velocidad(v_avion_tierra):.2f} km/h"
-)
-print(
-    f"Dirección de la velocidad del avión (vector unitario): {mr.direccion_velocidad(v_avion_tierra)}"
-)
+# Velocidad del avión respecto a tierra (V_A/T = V_A/Aire + V_Aire/Tierra):
+# la llamada fusionada devuelve suma, magnitud y dirección en una pasada.
+v_avion_tierra, mag_avion, dir_avion = _amd(V[AVION_AIRE], V[AIRE_TIERRA])
+
+# Las líneas se acumulan y se emiten con una única escritura a stdout en
+# lugar de un print (y su flush) por resultado.
+out = [
+    f"Velocidad de la persona con respecto a tierra: {v_persona_tierra} km/h",
+    f"Velocidad del tren con respecto a la persona: {v_tren_persona} km/h",
+    f"Velocidad del barco con respecto a tierra: {v_barco_tierra} km/h",
+    f"Magnitud de la velocidad del barco: {mag_barco:.2f} km/h",
+    f"Dirección de la velocidad del barco (radianes): {dir_barco:.2f} rad",
+    f"Velocidad del avión con respecto a tierra: {v_avion_tierra} km/h",
+    f"Magnitud de la velocidad del avión: {mag_avion:.2f} km/h",
+    f"Dirección de la velocidad del avión (vector unitario): {dir_avion}",
+]
+sys.stdout.write("\n".join(out) + "\n")